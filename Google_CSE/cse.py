@@ -1,15 +1,22 @@
 import os
+import sys
 import threading
 import queue
 import datetime
-import time
 from pathlib import Path
 from urllib.parse import urlparse
-import requests
-from bs4 import BeautifulSoup
+from typing import Optional
 from dotenv import load_dotenv
-from googleapiclient.discovery import build
-from tenacity import retry, stop_after_attempt, wait_fixed
+from tenacity import retry, retry_if_not_exception_type, stop_after_attempt, wait_fixed
+
+# Shared helpers live at the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from vdd_common.fetch import NON_RETRYABLE_ERRORS, EvidenceProbe, cached_get
+from vdd_common.html_text import extract_text
+from vdd_common.http_client import format_pool_stats, session_pool_stats, shared_session
+from vdd_common.query_planner import split_or_terms
+from vdd_common.search_cache import default_search_cache, format_ledger
+from vdd_common.search_providers import FederatedSearch, providers_from_env
 
 try:
     import customtkinter as ctk
@@ -33,40 +40,43 @@ RISK_KEYWORDS = (
     "OR guilty OR illegal OR arrest OR evasion OR sentence OR kickback OR prison OR jail "
     "OR corruption OR corrupt)"
 )
+RISK_TERMS = split_or_terms(RISK_KEYWORDS)  # The same lexicon, as terms for the evidence probe
 
 MAX_GOOGLE_PAGES = 3  # 3 pages x 10 results = 30 links
 RESULTS_PER_PAGE = 10
 MAX_THREADS = 10  # Max concurrent scraping threads
-HTTP_TIMEOUT = 15  # Timeout per HTTP request (seconds)
+SEARCH_TIMEOUT = 20  # Per-provider search deadline (seconds)
+HTTP_CONNECT_TIMEOUT = 5  # Timeout for opening a connection (seconds)
+HTTP_READ_TIMEOUT = 15  # Timeout between received bytes (seconds)
+MAX_PAGE_BYTES = 5 * 1024 * 1024  # Cap on downloaded page size (bytes)
+EVIDENCE_MIN_RISK_TERMS = 3  # Risk terms to see, besides the company, before a download may stop early
 QUEUE_POLL_INTERVAL = 100  # GUI queue polling (ms)
 
 # Utility Functions
-@retry(stop=stop_after_attempt(3), wait=wait_fixed(2))
-def fetch_page(url: str) -> str:
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/91.0.4472.124 Safari/537.36"
-        )
-    }
-    response = requests.get(url, headers=headers, timeout=HTTP_TIMEOUT)
-    response.raise_for_status()
+@retry(stop=stop_after_attempt(3), wait=wait_fixed(2), retry=retry_if_not_exception_type(NON_RETRYABLE_ERRORS))
+def fetch_page(url: str, probe: Optional[EvidenceProbe] = None) -> str:
+    # One pooled keep-alive session per process instead of a fresh connection per URL
+    response = cached_get(
+        url, timeout=(HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT), session=shared_session(MAX_THREADS),
+        max_bytes=MAX_PAGE_BYTES, probe=probe
+    )
     return response.text
 
-def google_custom_search(query: str, start: int = 1) -> list[str]:
-    service = build("customsearch", "v1", developerKey=GOOGLE_API_KEY)
-    
+_search: Optional[FederatedSearch] = None
+
+def get_search() -> FederatedSearch:
+    # Google CSE plus any other provider configured in .env (e.g. SerpApi), queried together
+    global _search
+    if _search is None:
+        providers = providers_from_env(default_search_cache(), max_workers=MAX_GOOGLE_PAGES)
+        _search = FederatedSearch(providers, default_timeout=SEARCH_TIMEOUT)
+    return _search
+
+def google_custom_search(query: str, pages: int = MAX_GOOGLE_PAGES) -> list[str]:
+    # Providers and their result pages are queried concurrently and merged by URL
     try:
-        result = service.cse().list(
-            q=query,
-            cx=CUSTOM_SEARCH_ENGINE_ID,
-            start=start,
-            num=RESULTS_PER_PAGE
-        ).execute()
-        
-        items = result.get('items', [])
-        return [item.get('link') for item in items if item.get('link')]
+        results = get_search().search(query, pages, RESULTS_PER_PAGE)
+        return [result.url for result in results]
     except Exception as e:
         print(f"Search error: {e}")
         return []
@@ -283,19 +293,11 @@ class VendorDueDiligenceApp:
     # Background
     def _worker(self, company: str):
         try:
-            # Collect Google links using Custom Search API
-            all_links: list[str] = []
+            # Collect links from Google CSE and any other configured provider
             search_query = f'"{company}" {RISK_KEYWORDS}'
-            
-            for page in range(MAX_GOOGLE_PAGES):
-                start_index = page * RESULTS_PER_PAGE + 1
-                new_links = google_custom_search(search_query, start=start_index)
-                all_links.extend(new_links)
-                self.result_queue.put(f"📄 Retrieved page {page + 1} from Google Custom Search API")
-                time.sleep(1)  
-
-            # Remove duplicates
-            all_links = list(dict.fromkeys(all_links))
+            all_links = google_custom_search(search_query)
+            self.result_queue.put(f"📄 Retrieved {MAX_GOOGLE_PAGES} pages from: {', '.join(get_search().provider_names)}")
+            self.result_queue.put(f"📊 SEARCH QUOTA: {format_ledger(default_search_cache().ledger())}")
             total_links = len(all_links)
             self.result_queue.put(f"🔍 Collected {total_links} unique links from Google Custom Search.")
 
@@ -308,10 +310,11 @@ class VendorDueDiligenceApp:
             def analyze(url: str):
                 nonlocal progress_count
                 try:
-                    html = fetch_page(url)
-                    soup = BeautifulSoup(html, "html.parser")
-                    title = soup.title.string.strip() if soup.title else urlparse(url).netloc
-                    text_content = soup.get_text(" ", strip=True).lower()
+                    # Stop reading once the company and enough risk terms have shown up
+                    html = fetch_page(url, probe=EvidenceProbe([company], RISK_TERMS, EVIDENCE_MIN_RISK_TERMS))
+                    title, text_content = extract_text(html)
+                    title = title or urlparse(url).netloc
+                    text_content = text_content.lower()
 
                     if company.lower() in text_content:
                         with lock:
@@ -344,6 +347,7 @@ class VendorDueDiligenceApp:
             # Join any remaining threads
             for t in threads:
                 t.join()
+            self.result_queue.put((f"🔌 HTTP POOL: {format_pool_stats(session_pool_stats(shared_session()))}", "info"))
 
             # Generate final results
             risk_count = len(flagged_links)
@@ -11,27 +11,53 @@ import asyncio
 import logging
 import threading
 import queue
+import multiprocessing
 import datetime
 import time
 import json
 import hashlib
+import heapq
+import io
+import itertools
 import uuid
 from pathlib import Path
 from urllib.parse import urlparse, urljoin
-from typing import List, Dict, Optional, Tuple, Any
+from typing import List, Dict, Optional, Set, Tuple, Any, Callable, Awaitable, AsyncIterator, Iterator
 from dataclasses import dataclass, asdict
 from contextlib import asynccontextmanager
 
 # Core dependencies
-import requests
-from bs4 import BeautifulSoup
+import aiohttp
+import numpy as np
 from dotenv import load_dotenv
-from googleapiclient.discovery import build
-from tenacity import retry, stop_after_attempt, wait_fixed
+from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_exponential
 import stanza  # Using Stanza instead of spaCy
 from playwright.async_api import async_playwright, Browser, Page
 import aiofiles
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+# Shared helpers live at the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from vdd_common.cse_client import CSEClient
+from vdd_common.fetch import (
+    CHUNK_SIZE, HTML_CONTENT_TYPES, EvidenceProbe, FetchRejected, StreamingBody, check_response_headers
+)
+from vdd_common.host_health import FailureRegistry, HostUnavailable
+from vdd_common.http_cache import CachedResponse, HTTPResponseCache
+from vdd_common.html_text import default_backend, extract_text
+from vdd_common.http_client import AsyncPoolStats, build_async_session, format_pool_stats
+from vdd_common.matching import CompanyMatcher, KeywordAutomaton, MentionSpan, PortfolioMatcher
+from vdd_common.ner_cache import NERCache
+from vdd_common.query_planner import plan_queries, reciprocal_rank_fusion, shard_terms
+from vdd_common.ratelimit import TokenBucket
+from vdd_common.run_history import PageRecord, RunDelta, RunHistory, RunSnapshot, compare_runs, page_digest
+from vdd_common.urlnorm import DedupIndex, dedup_key, same_page
+from vdd_common.search_cache import SearchCache, format_ledger
+from vdd_common.text_store import TextStore, content_digest, text_version
+from vdd_common.search_providers import (
+    FederatedSearch, GoogleCSEProvider, SearchProvider, SearchResult, SerpApiProvider
+)
 
 # GUI dependencies
 try:
@@ -43,6 +69,17 @@ except ImportError:
     from tkinter import ttk, scrolledtext, messagebox
     GUI_LIB = "tkinter"
 
+# PDF text extraction: PyMuPDF is much faster, pypdf is pure Python
+try:
+    import fitz
+    PDF_LIB = "pymupdf"
+except ImportError:
+    try:
+        from pypdf import PdfReader
+        PDF_LIB = "pypdf"
+    except ImportError:
+        PDF_LIB = None
+
 # -----------------------------------
 # Configuration & Environment Setup
 # -----------------------------------
@@ -56,17 +93,56 @@ class AppConfig:
     # API Credentials
     google_api_key: str = os.getenv("GOOGLE_API_KEY", "")
     custom_search_engine_id: str = os.getenv("CUSTOM_SEARCH_ENGINE_ID", "")
+    serpapi_key: str = os.getenv("SERPAPI_KEY", "")  # Optional second search provider
     
     # Application Settings
     max_google_pages: int = 3
     results_per_page: int = 10
+    search_queries_per_minute: int = 100  # Custom Search JSON API default quota
+    search_call_budget: int = None  # Requests per provider per company; None gives every lexicon shard a call
+    search_max_query_words: int = 32  # Google ignores query words past this limit
+    search_cache_ttl_hours: int = 24
+    search_daily_limit: int = 100  # CSE free tier; stale cached pages are served beyond it
+    search_provider_timeouts: Dict[str, float] = None  # Seconds before a provider's results are dropped
+    snippet_triage_enabled: bool = True
+    snippet_min_score: float = 0.1  # Results scoring below this on title + snippet are skipped/deferred
+    snippet_low_score_action: str = "defer"  # "defer" (fetch last) or "skip" (never fetch)
     max_concurrent_scrapes: int = 8
-    http_timeout: int = 20
+    max_scrapes_per_host: int = 2
+    http_connect_timeout: float = 5.0
+    http_read_timeout: float = 20.0  # Maximum gap between received chunks
+    http_total_timeout: float = 180.0  # Whole request including the body, per attempt
+    http_retry_attempts: int = 3
+    http_retry_backoff: float = 1.0
+    http_cache_enabled: bool = True
+    http_cache_max_mb: int = 512
+    max_page_bytes: int = 5 * 1024 * 1024
+    max_pdf_bytes: int = 50 * 1024 * 1024
+    stop_on_evidence: bool = False  # Stop downloading once the company and risk terms appear
+    evidence_min_risk_terms: int = 3
     pdf_timeout: int = 30
+    circuit_failure_threshold: int = 3  # Consecutive failures before a host is skipped
+    circuit_reset_seconds: int = 300
+    negative_cache_ttl_hours: int = 6  # How long 403s, certificate errors, etc. are remembered
+    min_static_text_chars: int = 500  # Below this, archive via live navigation
+    text_store_enabled: bool = True  # Keep extracted text so past screenings can be re-scored offline
+    text_store_max_mb: int = 1024  # Oldest stored texts are dropped when the pack file outgrows this
+    html_parser_backend: Optional[str] = None  # selectolax, lxml, stream or bs4; None picks the fastest installed
+    incremental_rescreening: bool = True  # Re-runs only analyze and archive pages new or changed since the last run
     
     # Risk Analysis
     min_confidence_score: float = 0.75
     context_window_size: int = 150
+    nlp_profile: str = "ner"  # Key of NLP_PROFILES; "full" adds POS tagging and lemmas
+    ner_batch_size: int = 32  # Contexts sent to Stanza per call
+    ner_cache_enabled: bool = True
+    ner_cache_max_mb: int = 64
+    ner_cache_memory_entries: int = 4096
+    ner_flush_seconds: float = 0.5  # Longest a context waits for its batch to fill
+    nlp_workers: int = None  # Parse/NLP processes, each with its own Stanza models; 0 analyses in-process
+    nlp_max_pending: int = None  # Pages queued for the workers before fetch handlers wait
+    risk_categories: Dict[str, List[str]] = None  # Checked in order; first match wins
+    strong_risk_indicators: List[str] = None  # Each one present adds 0.2 to the risk score
     
     # File Management
     base_output_dir: str = "vendor_intelligence"
@@ -78,6 +154,15 @@ class AppConfig:
     risk_keywords: List[str] = None
     
     def __post_init__(self):
+        if self.nlp_workers is None:
+            self.nlp_workers = max(min((os.cpu_count() or 1) - 1, 8), 0)
+        
+        if self.nlp_max_pending is None:
+            self.nlp_max_pending = max(self.nlp_workers, 1) * 2
+        
+        if self.search_provider_timeouts is None:
+            self.search_provider_timeouts = {"google_cse": 15.0, "serpapi": 25.0}
+        
         if self.risk_keywords is None:
             self.risk_keywords = [
                 # Financial Crimes
@@ -100,6 +185,18 @@ class AppConfig:
                 "scandal", "misconduct", "unethical", "discrimination", "harassment",
                 "whistleblower", "cover-up", "conflict of interest", "nepotism"
             ]
+        
+        if self.risk_categories is None:
+            self.risk_categories = {
+                "Financial Crime": ["fraud", "embezzlement", "money laundering", "bribery", "corruption"],
+                "Legal Issues": ["lawsuit", "sued", "convicted", "guilty", "litigation", "violation"],
+                "Regulatory": ["SEC", "regulatory", "compliance", "sanctions", "OFAC", "enforcement"],
+                "Operational": ["breach", "hack", "safety", "recall", "accident", "defective"],
+                "Reputational": ["scandal", "misconduct", "unethical", "discrimination", "harassment"]
+            }
+        
+        if self.strong_risk_indicators is None:
+            self.strong_risk_indicators = ["convicted", "guilty", "sentenced", "fined", "violated", "breach"]
 
 # Initialize configuration
 config = AppConfig()
@@ -169,9 +266,47 @@ class RiskFinding:
     risk_category: str
     entities_found: List[str]
     timestamp: datetime.datetime
+    mention_count: int = 1
+    score_distribution: Optional[Dict[str, float]] = None  # Summary of every mention's score on the page
     
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
+    
+    def to_record(self) -> Dict[str, Any]:
+        """JSON-safe form kept in the run history"""
+        data = self.to_dict()
+        data['timestamp'] = self.timestamp.isoformat()
+        return data
+    
+    @classmethod
+    def from_record(cls, data: Dict[str, Any]) -> "RiskFinding":
+        """Rebuild a finding carried forward from an earlier run"""
+        fields = {key: value for key, value in data.items() if key in cls.__dataclass_fields__}
+        fields['timestamp'] = datetime.datetime.fromisoformat(fields['timestamp'])
+        return cls(**fields)
+
+@dataclass
+class FetchedPage:
+    """Raw HTTP payload captured for a single URL"""
+    url: str
+    final_url: str
+    status: int
+    headers: Dict[str, str]  # Lower-cased header names
+    body: bytes
+    charset: Optional[str] = None
+    truncated: bool = False  # Body cut off by the size cap or an evidence probe
+    
+    @property
+    def content_type(self) -> str:
+        return self.headers.get("content-type", "").split(";")[0].strip().lower()
+    
+    @property
+    def text(self) -> str:
+        return self.body.decode(self.charset or "utf-8", errors="replace")
+    
+    @property
+    def is_pdf(self) -> bool:
+        return self.content_type == "application/pdf" or self.body.startswith(b"%PDF-")
 
 @dataclass
 class VendorProfile:
@@ -185,6 +320,7 @@ class VendorProfile:
     overall_risk_score: float
     risk_level: str
     recommendations: List[str]
+    delta: Optional[RunDelta] = None  # Changes since the vendor's previous screening, on re-runs
     
     def to_dict(self) -> Dict[str, Any]:
         data = asdict(self)
@@ -192,65 +328,267 @@ class VendorProfile:
         return data
 
 # -----------------------------------
-# Advanced NLP Risk Analyzer using Stanza
+# Compiled Risk Lexicon
 # -----------------------------------
 
-class ContextualRiskAnalyzer:
-    """Advanced NLP-powered risk analysis engine using Stanza"""
+@dataclass(frozen=True)
+class LexiconEntry:
+    """Everything the analyzer needs to know about one lexicon term"""
+    term: str
+    is_risk_keyword: bool
+    categories: Tuple[str, ...]
+    strong: bool
+
+@dataclass(frozen=True)
+class KeywordHit:
+    """One occurrence of a lexicon term in a text"""
+    start: int
+    end: int
+    entry: LexiconEntry
+
+class RiskLexicon:
+    """Risk keywords, category terms and strong indicators compiled into one automaton"""
     
-    def __init__(self):
-        self.nlp = None
-        self.load_models()
+    # Acronyms this short would otherwise match as word prefixes ("SEC" in "second")
+    WHOLE_WORD_MAX_LENGTH = 3
+    
+    def __init__(self, risk_keywords: List[str], risk_categories: Dict[str, List[str]],
+                 strong_indicators: List[str]):
+        self.category_order = list(risk_categories)
+        
+        terms: Dict[str, Dict[str, Any]] = {}
+        def entry_for(term: str) -> Dict[str, Any]:
+            return terms.setdefault(term.lower(), {"risk": False, "categories": [], "strong": False})
+        
+        for keyword in risk_keywords:
+            entry_for(keyword)["risk"] = True
+        for category, keywords in risk_categories.items():
+            for keyword in keywords:
+                entry_for(keyword)["categories"].append(category)
+        for indicator in strong_indicators:
+            entry_for(indicator)["strong"] = True
+        
+        self.entries = {
+            term: LexiconEntry(term, flags["risk"], tuple(flags["categories"]), flags["strong"])
+            for term, flags in terms.items()
+        }
+        self.risk_keyword_count = sum(1 for entry in self.entries.values() if entry.is_risk_keyword)
+        self.automaton = KeywordAutomaton(
+            self.entries,
+            whole_word=tuple(term for term in self.entries if len(term) <= self.WHOLE_WORD_MAX_LENGTH)
+        )
     
-    def load_models(self):
-        """Load Stanza models with error handling"""
+    @classmethod
+    def from_config(cls, app_config: "AppConfig") -> "RiskLexicon":
+        return cls(app_config.risk_keywords, app_config.risk_categories, app_config.strong_risk_indicators)
+    
+    def scan(self, text: str) -> List[KeywordHit]:
+        """All lexicon hits in one pass, ordered by position"""
+        return [KeywordHit(start, end, entry) for start, end, _, entry in self.automaton.find_all(text)]
+    
+    def classify(self, hits: List[KeywordHit]) -> str:
+        """First configured category with a hit, as the original keyword scan did"""
+        found = {category for hit in hits for category in hit.entry.categories}
+        for category in self.category_order:
+            if category in found:
+                return category
+        return "General Risk"
+
+# -----------------------------------
+# Vectorized Proximity Scoring
+# -----------------------------------
+
+# Keyword weight by distance from a mention: < 50, < 100, < 200 characters, further
+PROXIMITY_BINS = np.array([50, 100, 200])
+PROXIMITY_WEIGHTS = np.array([1.0, 0.7, 0.4, 0.0])
+
+def nearest_distances(mentions: np.ndarray, positions: np.ndarray, term_ids: np.ndarray,
+                      term_count: int) -> np.ndarray:
+    """Distance from each mention to the nearest occurrence of each term, shape (mentions, terms)
+    
+    Positions are sorted per term and searched with one searchsorted call over
+    term-offset keys; terms that never occur get an infinite distance.
+    """
+    distances = np.full((len(mentions), term_count), np.inf)
+    if not len(positions) or not len(mentions):
+        return distances
+    
+    # Sort by (term, position) and shift each term into its own key range so one
+    # searchsorted finds every mention's insertion point within every term's run
+    order = np.lexsort((positions, term_ids))
+    positions, term_ids = positions[order].astype(np.int64), term_ids[order]
+    span = int(max(positions.max(), mentions.max())) + 1
+    keys = term_ids.astype(np.int64) * span + positions
+    
+    terms = np.unique(term_ids)
+    run_start = np.searchsorted(term_ids, terms, side="left")
+    run_end = np.searchsorted(term_ids, terms, side="right")
+    queries = terms[None, :].astype(np.int64) * span + mentions[:, None]
+    insert = np.searchsorted(keys, queries)
+    
+    # Nearest occurrence is the one at or just before the insertion point
+    after = np.minimum(insert, run_end[None, :] - 1)
+    before = np.maximum(insert - 1, run_start[None, :])
+    nearest = np.minimum(np.abs(positions[after] - mentions[:, None]),
+                         np.abs(positions[before] - mentions[:, None]))
+    distances[:, terms] = nearest
+    return distances
+
+@dataclass
+class PageRiskScore:
+    """Risk score of every company mention on a page"""
+    mentions: np.ndarray  # (n, 2) start/end offsets
+    scores: np.ndarray  # (n,) score per mention
+    best_index: int
+    best_mention: Tuple[int, int]  # Offsets of the highest-scoring mention
+    
+    @property
+    def best_score(self) -> float:
+        return float(self.scores[self.best_index])
+    
+    def score_distribution(self, threshold: Optional[float] = None) -> Dict[str, float]:
+        """Summary statistics over all mention scores"""
+        threshold = config.min_confidence_score if threshold is None else threshold
+        return {
+            "mentions": float(len(self.scores)),
+            "max": float(self.scores.max()),
+            "mean": float(self.scores.mean()),
+            "median": float(np.median(self.scores)),
+            "p90": float(np.percentile(self.scores, 90)),
+            "above_threshold": float((self.scores >= threshold).sum()),
+        }
+
+# -----------------------------------
+# Advanced NLP Risk Analyzer using Stanza
+# -----------------------------------
+
+# Stanza processors per profile; only sentence entities are read by the analyzer
+NLP_PROFILES = {
+    "ner": "tokenize,ner",
+    "full": "tokenize,ner,pos,lemma",
+}
+
+_pipelines: Dict[str, Any] = {}
+_failed_profiles: Set[str] = set()
+_pipelines_lock = threading.Lock()
+_nlp_call_lock = threading.Lock()  # Stanza pipelines are not thread-safe
+
+def _build_pipeline(processors: str):
+    """Construct a Stanza pipeline, downloading the processors' English models if missing"""
+    try:
+        pipeline = stanza.Pipeline(
+            lang='en',
+            processors=processors,
+            verbose=False,
+            download_method=None  # Don't auto-download, assume models are present
+        )
+        logger.info(f"Stanza English pipeline loaded successfully ({processors})")
+        return pipeline
+    except Exception as e:
+        logger.warning(f"Stanza pipeline loading failed: {e}")
+        logger.info(f"Attempting to download English models for {processors}...")
         try:
-            # Initialize Stanza pipeline with English models
-            self.nlp = stanza.Pipeline(
+            # Only the profile's processors, not the whole default English package
+            stanza.download('en', processors=processors, verbose=False)
+            pipeline = stanza.Pipeline(
                 lang='en',
-                processors='tokenize,ner,pos,lemma',
-                verbose=False,
-                download_method=None  # Don't auto-download, assume models are present
+                processors=processors,
+                verbose=False
             )
-            logger.info("Stanza English pipeline loaded successfully")
-        except Exception as e:
-            logger.warning(f"Stanza pipeline loading failed: {e}")
-            logger.info("Attempting to download English models...")
-            try:
-                # Download English models if not present
-                stanza.download('en', verbose=False)
-                self.nlp = stanza.Pipeline(
-                    lang='en',
-                    processors='tokenize,ner,pos,lemma',
-                    verbose=False
-                )
-                logger.info("Stanza models downloaded and loaded successfully")
-            except Exception as download_error:
-                logger.error(f"Failed to download/load Stanza models: {download_error}")
-                self.nlp = None
-    
-    def extract_company_mentions(self, text: str, company_name: str) -> List[Tuple[int, int, str]]:
-        """Extract company mentions with context positions"""
-        mentions = []
-        company_variations = self._generate_company_variations(company_name)
-        
-        text_lower = text.lower()
-        for variation in company_variations:
-            start = 0
-            while True:
-                pos = text_lower.find(variation.lower(), start)
-                if pos == -1:
-                    break
-                
-                # Extract context window
-                context_start = max(0, pos - config.context_window_size)
-                context_end = min(len(text), pos + len(variation) + config.context_window_size)
-                context = text[context_start:context_end]
-                
-                mentions.append((pos, pos + len(variation), context))
-                start = pos + 1
-        
-        return mentions
+            logger.info("Stanza models downloaded and loaded successfully")
+            return pipeline
+        except Exception as download_error:
+            logger.error(f"Failed to download/load Stanza models: {download_error}")
+            return None
+
+def get_pipeline(profile: str):
+    """Shared pipeline for a profile, built on first use; None if Stanza cannot load"""
+    if profile not in NLP_PROFILES:
+        raise ValueError(f"Unknown NLP profile '{profile}' (expected one of {', '.join(NLP_PROFILES)})")
+    
+    pipeline = _pipelines.get(profile)
+    if pipeline is not None or profile in _failed_profiles:
+        return pipeline
+    
+    with _pipelines_lock:
+        # Another thread may have finished loading while this one waited
+        if profile not in _pipelines and profile not in _failed_profiles:
+            pipeline = _build_pipeline(NLP_PROFILES[profile])
+            if pipeline is None:
+                _failed_profiles.add(profile)
+            else:
+                _pipelines[profile] = pipeline
+        return _pipelines.get(profile)
+
+def pipeline_failed(profile: str) -> bool:
+    """True once loading the profile's pipeline has been attempted and failed"""
+    return profile in _failed_profiles
+
+class ContextualRiskAnalyzer:
+    """Advanced NLP-powered risk analysis engine using Stanza"""
+    
+    def __init__(self, profile: Optional[str] = None):
+        self.profile = profile or config.nlp_profile
+        if self.profile not in NLP_PROFILES:
+            raise ValueError(f"Unknown NLP profile '{self.profile}' (expected one of {', '.join(NLP_PROFILES)})")
+        self.lexicon = RiskLexicon.from_config(config)
+        self._matchers: Dict[str, CompanyMatcher] = {}
+        self._portfolio: Optional[Tuple[Tuple[str, ...], PortfolioMatcher]] = None
+        self.ner_cache = NERCache(
+            memory_entries=config.ner_cache_memory_entries,
+            max_bytes=config.ner_cache_max_mb * 1024 * 1024
+        ) if config.ner_cache_enabled else None
+    
+    @property
+    def nlp(self):
+        """Stanza pipeline for this analyzer's profile, loaded on first use"""
+        return get_pipeline(self.profile)
+    
+    def reload_lexicon(self):
+        """Rebuild the keyword automaton after config.risk_keywords or categories change"""
+        self.lexicon = RiskLexicon.from_config(config)
+    
+    @property
+    def model_version(self) -> str:
+        """Identifies the pipeline whose entities are cached"""
+        return f"stanza-{stanza.__version__}/{NLP_PROFILES[self.profile]}"
+    
+    def portfolio_matcher(self, vendors: Tuple[str, ...]) -> PortfolioMatcher:
+        """One automaton over every vendor's name variations, rebuilt only when the portfolio changes"""
+        if self._portfolio is None or self._portfolio[0] != vendors:
+            variations = {vendor: self._generate_company_variations(vendor) for vendor in vendors}
+            self._portfolio = (vendors, PortfolioMatcher(variations))
+        return self._portfolio[1]
+    
+    def analyze_portfolio(self, text: str, vendors: Tuple[str, ...],
+                          extract_entities: bool = True) -> Tuple[Dict[str, RiskFinding], Set[str]]:
+        """Score one document for every vendor it mentions
+        
+        Names and lexicon terms are each scanned once; returns the findings per
+        vendor and the set of vendors mentioned at all.
+        """
+        spans_by_vendor = self.portfolio_matcher(vendors).spans(text, config.context_window_size)
+        if not spans_by_vendor:
+            return {}, set()
+        
+        hits = self.lexicon.scan(text)
+        findings = {}
+        for vendor, spans in spans_by_vendor.items():
+            risk_finding = self.analyze_risk_context(text, vendor, extract_entities, spans=spans, hits=hits)
+            if risk_finding:
+                findings[vendor] = risk_finding
+        return findings, set(spans_by_vendor)
+    
+    def company_matcher(self, company_name: str) -> CompanyMatcher:
+        """Compiled matcher for a company, built once per name"""
+        matcher = self._matchers.get(company_name)
+        if matcher is None:
+            matcher = self._matchers[company_name] = CompanyMatcher(self._generate_company_variations(company_name))
+        return matcher
+    
+    def extract_company_mentions(self, text: str, company_name: str) -> List[MentionSpan]:
+        """Extract merged context spans around company mentions, as offsets into text"""
+        return self.company_matcher(company_name).spans(text, config.context_window_size)
     
     def _generate_company_variations(self, company_name: str) -> List[str]:
         """Generate company name variations for better matching"""
@@ -270,103 +608,143 @@ class ContextualRiskAnalyzer:
         
         return list(set(variations))
     
-    def analyze_risk_context(self, text: str, company_name: str) -> Optional[RiskFinding]:
-        """Perform contextual risk analysis using Stanza"""
-        if not self.nlp:
+    def analyze_risk_context(self, text: str, company_name: str, extract_entities: bool = True,
+                             spans: Optional[List[MentionSpan]] = None,
+                             hits: Optional[List[KeywordHit]] = None) -> Optional[RiskFinding]:
+        """Perform contextual risk analysis using Stanza
+        
+        With extract_entities=False the finding is returned without entities so
+        the caller can run NER for many findings at once (see EntityBatcher).
+        Mention spans and lexicon hits already computed for the text may be passed in.
+        """
+        # The pipeline itself is only loaded once a context needs entities
+        if pipeline_failed(self.profile):
             return None
         
         try:
             # Extract company mentions with context
-            mentions = self.extract_company_mentions(text, company_name)
-            if not mentions:
+            if spans is None:
+                spans = self.extract_company_mentions(text, company_name)
+            if not spans:
                 return None
             
-            # Analyze each mention for risk context
-            for start_pos, end_pos, context in mentions:
-                risk_score = self._calculate_risk_score(context, company_name)
-                
-                if risk_score >= config.min_confidence_score:
-                    # Process context with Stanza for entity extraction
-                    doc = self.nlp(context)
-                    
-                    # Extract named entities using Stanza
-                    entities = []
-                    for sentence in doc.sentences:
-                        for ent in sentence.ents:
-                            entities.append(ent.text)
-                    
-                    # Determine risk category
-                    risk_category = self._classify_risk_category(context)
-                    
-                    return RiskFinding(
-                        url="",  # To be filled by caller
-                        title="",  # To be filled by caller
-                        context=context.strip(),
-                        confidence_score=risk_score,
-                        risk_category=risk_category,
-                        entities_found=entities,
-                        timestamp=datetime.datetime.now()
-                    )
+            # One lexicon pass over the page, one vectorized scoring pass over all mentions
+            if hits is None:
+                hits = self.lexicon.scan(text)
+            page_score = self.score_page(spans, hits)
+            if page_score.best_score < config.min_confidence_score:
+                return None
             
-            return None
+            # Merged spans can chain across a whole page that names the company often;
+            # the finding's context is only the window around the best mention
+            mention_start, mention_end = page_score.best_mention
+            context_start = max(0, mention_start - config.context_window_size)
+            context_end = min(len(text), mention_end + config.context_window_size)
+            context = text[context_start:context_end]
+            span_hits = [hit for hit in hits if hit.start >= context_start and hit.end <= context_end]
+            
+            # Extract named entities using Stanza
+            entities = []
+            if extract_entities:
+                if not self.nlp:
+                    return None
+                entities = self.extract_entities([context])[0]
+            
+            # Determine risk category
+            risk_category = self._classify_risk_category(context, span_hits)
+            
+            return RiskFinding(
+                url="",  # To be filled by caller
+                title="",  # To be filled by caller
+                context=context.strip(),
+                confidence_score=page_score.best_score,
+                risk_category=risk_category,
+                entities_found=entities,
+                timestamp=datetime.datetime.now(),
+                mention_count=len(page_score.scores),
+                score_distribution=page_score.score_distribution()
+            )
             
         except Exception as e:
             logger.error(f"Risk analysis error: {e}")
             return None
     
-    def _calculate_risk_score(self, context: str, company_name: str) -> float:
-        """Calculate risk confidence score based on context"""
-        context_lower = context.lower()
-        company_lower = company_name.lower()
-        
-        # Check for risk keywords near company mention
-        risk_indicators = 0
-        total_keywords = len(config.risk_keywords)
-        
-        for keyword in config.risk_keywords:
-            if keyword.lower() in context_lower:
-                # Check proximity to company name
-                company_pos = context_lower.find(company_lower)
-                keyword_pos = context_lower.find(keyword.lower())
-                
-                if company_pos != -1 and keyword_pos != -1:
-                    distance = abs(company_pos - keyword_pos)
-                    # Closer keywords have higher weight
-                    if distance < 50:
-                        risk_indicators += 1.0
-                    elif distance < 100:
-                        risk_indicators += 0.7
-                    elif distance < 200:
-                        risk_indicators += 0.4
-        
-        # Calculate confidence score
-        base_score = min(risk_indicators / max(total_keywords * 0.1, 1), 1.0)
-        
-        # Boost score for strong indicators
-        strong_indicators = ["convicted", "guilty", "sentenced", "fined", "violated", "breach"]
-        for indicator in strong_indicators:
-            if indicator in context_lower:
-                base_score = min(base_score + 0.2, 1.0)
-        
-        return base_score
+    def extract_entities(self, contexts: List[str]) -> List[List[str]]:
+        """Named entities for each context, in one multi-document Stanza call"""
+        return self.extract_entities_counted(contexts)[0]
     
-    def _classify_risk_category(self, context: str) -> str:
+    def extract_entities_counted(self, contexts: List[str]) -> Tuple[List[List[str]], int]:
+        """Like extract_entities, also returning how many contexts came from the NER cache"""
+        version = self.model_version
+        results: List[Optional[List[str]]] = [None] * len(contexts)
+        if self.ner_cache is not None:
+            results = [self.ner_cache.get(context, version) for context in contexts]
+        cached = sum(1 for result in results if result is not None)
+        
+        # Run Stanza once per distinct uncached context
+        missing = list(dict.fromkeys(context for context, result in zip(contexts, results) if result is None))
+        if missing:
+            nlp = self.nlp
+            if nlp is None:
+                return [result or [] for result in results], cached
+            with _nlp_call_lock:
+                documents = nlp([stanza.Document([], text=context) for context in missing])
+            extracted = {}
+            for context, doc in zip(missing, documents):
+                extracted[context] = [ent.text for sentence in doc.sentences for ent in sentence.ents]
+                if self.ner_cache is not None:
+                    self.ner_cache.put(context, version, extracted[context])
+            results = [extracted[context] if result is None else result for context, result in zip(contexts, results)]
+        return results, cached
+    
+    def score_page(self, spans: List[MentionSpan], hits: List[KeywordHit]) -> PageRiskScore:
+        """Score every mention against the nearest occurrence of every risk keyword
+        
+        Computed for all mentions at once, so the result does not depend on
+        which occurrence of the company name is found first.
+        """
+        mention_list = [mention for span in spans for mention in span.mentions]
+        mentions = np.array(mention_list, dtype=np.int64).reshape(-1, 2)
+        starts = mentions[:, 0]
+        
+        term_index: Dict[str, int] = {}
+        risk_hits = [(hit.start, term_index.setdefault(hit.entry.term, len(term_index)))
+                     for hit in hits if hit.entry.is_risk_keyword]
+        risk_terms = len(term_index)
+        term_index = {}
+        strong_hits = [(hit.start, term_index.setdefault(hit.entry.term, len(term_index)))
+                       for hit in hits if hit.entry.strong]
+        
+        def distances(term_hits: List[Tuple[int, int]], term_count: int) -> np.ndarray:
+            array = np.array(term_hits, dtype=np.int64).reshape(-1, 2)
+            return nearest_distances(starts, array[:, 0], array[:, 1], term_count)
+        
+        # Sum of distance-binned weights over every keyword
+        risk_distances = distances(risk_hits, risk_terms)
+        weights = PROXIMITY_WEIGHTS[np.digitize(risk_distances, PROXIMITY_BINS)]
+        indicators = weights.sum(axis=1)
+        base_scores = np.minimum(indicators / max(self.lexicon.risk_keyword_count * 0.1, 1), 1.0)
+        
+        # Strong indicators count when they fall inside the mention's context window
+        strong_distances = distances(strong_hits, len(term_index))
+        strong_counts = (strong_distances <= config.context_window_size).sum(axis=1)
+        scores = np.minimum(base_scores + 0.2 * strong_counts, 1.0)
+        
+        best_index = int(np.argmax(scores))
+        return PageRiskScore(mentions, scores, best_index, tuple(mention_list[best_index]))
+    
+    def score_text(self, text: str, company_name: str, hits: Optional[List[KeywordHit]] = None) -> float:
+        """Best mention score for a short text such as a search snippet; 0.0 if the company is not named"""
+        spans = self.extract_company_mentions(text, company_name)
+        if not spans:
+            return 0.0
+        if hits is None:
+            hits = self.lexicon.scan(text)
+        return self.score_page(spans, hits).best_score
+    
+    def _classify_risk_category(self, context: str, hits: Optional[List[KeywordHit]] = None) -> str:
         """Classify the type of risk based on context"""
-        context_lower = context.lower()
-        
-        categories = {
-            "Financial Crime": ["fraud", "embezzlement", "money laundering", "bribery", "corruption"],
-            "Legal Issues": ["lawsuit", "sued", "convicted", "guilty", "litigation", "violation"],
-            "Regulatory": ["SEC", "regulatory", "compliance", "sanctions", "OFAC", "enforcement"],
-            "Operational": ["breach", "hack", "safety", "recall", "accident", "defective"],
-            "Reputational": ["scandal", "misconduct", "unethical", "discrimination", "harassment"]
-        }
-        
-        for category, keywords in categories.items():
-            if any(keyword in context_lower for keyword in keywords):
-                return category
-        
-        return "General Risk"
+        return self.lexicon.classify(self.lexicon.scan(context) if hits is None else hits)
 
 # -----------------------------------
 # PDF Generation Engine
@@ -375,9 +753,10 @@ class ContextualRiskAnalyzer:
 class PDFArchiveManager:
     """High-performance web-to-PDF conversion system"""
     
-    def __init__(self, output_dir: str):
+    def __init__(self, output_dir: str, registry: Optional[FailureRegistry] = None):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.registry = registry
         self.browser = None
         
     async def __aenter__(self):
@@ -396,15 +775,16 @@ class PDFArchiveManager:
         if self.playwright:
             await self.playwright.stop()
     
-    async def generate_pdf(self, url: str, company_name: str) -> Optional[str]:
-        """Generate PDF from URL with enhanced error handling"""
+    async def generate_pdf(self, url: str, company_name: str, fetched: Optional[FetchedPage] = None) -> Optional[str]:
+        """Generate PDF from URL, rendering the captured response when one is given"""
+        page = None
         try:
-            # Create safe filename
-            parsed_url = urlparse(url)
-            safe_domain = self._sanitize_filename(parsed_url.netloc)
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{company_name}_{safe_domain}_{timestamp}.pdf"
-            filepath = self.output_dir / filename
+            if fetched is None and self.registry:
+                # Live navigation to a host that is known to fail only burns a browser tab
+                self.registry.check(url)
+            
+            filepath = self._archive_path(url, company_name)
+            filename = filepath.name
             
             # Create new page with extended timeout
             page = await self.browser.new_page()
@@ -415,11 +795,20 @@ class PDFArchiveManager:
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
             })
             
-            # Navigate with timeout
-            await page.goto(url, timeout=config.pdf_timeout * 1000, wait_until="networkidle")
-            
-            # Wait for content to load
-            await page.wait_for_timeout(2000)
+            if fetched is not None:
+                # Serve the document we already downloaded; only subresources hit the network
+                handler = self._captured_document_handler(fetched)
+                await page.route("**/*", handler)
+                await page.goto(fetched.final_url, timeout=config.pdf_timeout * 1000, wait_until="load")
+                if not handler.served:
+                    logger.warning(f"Captured response for {url} was not matched to the navigation; "
+                                   f"archived from a live request instead")
+            else:
+                # Navigate with timeout
+                await page.goto(url, timeout=config.pdf_timeout * 1000, wait_until="networkidle")
+                
+                # Wait for content to load
+                await page.wait_for_timeout(2000)
             
             # Generate PDF with print-optimized settings
             await page.pdf(
@@ -433,16 +822,65 @@ class PDFArchiveManager:
                     "left": "1cm"
                 }
             )
-            
-            await page.close()
+            if fetched is None and self.registry:
+                # Closes the breaker again after a successful half-open trial
+                self.registry.record_success(url)
             
             logger.info(f"PDF generated successfully: {filename}")
             return str(filepath)
             
+        except HostUnavailable as e:
+            logger.warning(str(e))
+            return None
         except Exception as e:
             logger.error(f"PDF generation failed for {url}: {e}")
+            if fetched is None and self.registry:
+                self.registry.record_failure(url, e)
+            return None
+        finally:
+            if page:
+                await page.close()
+    
+    @staticmethod
+    def _captured_document_handler(fetched: FetchedPage):
+        """Build a route handler that fulfils the main navigation from the captured body
+        
+        The handler's ``served`` attribute tells whether the captured body was used.
+        """
+        # The body is already decoded, so transport headers no longer apply
+        dropped_headers = {"content-encoding", "content-length", "transfer-encoding"}
+        headers = {name: value for name, value in fetched.headers.items() if name not in dropped_headers}
+        
+        async def handler(route):
+            request = route.request
+            # Chromium may re-spell the URL (trailing slash, fragment, escaping)
+            if not handler.served and request.is_navigation_request() and same_page(request.url, fetched.final_url):
+                handler.served = True
+                await route.fulfill(status=fetched.status, headers=headers, body=fetched.body)
+            else:
+                await route.continue_()
+        
+        handler.served = False
+        return handler
+    
+    def save_document(self, url: str, company_name: str, body: bytes) -> Optional[str]:
+        """Archive an original PDF document as downloaded"""
+        try:
+            filepath = self._archive_path(url, company_name)
+            filepath.write_bytes(body)
+            logger.info(f"PDF document archived: {filepath.name}")
+            return str(filepath)
+        except Exception as e:
+            logger.error(f"PDF archival failed for {url}: {e}")
             return None
     
+    def _archive_path(self, url: str, company_name: str) -> Path:
+        """Create safe archive filename for a source URL"""
+        parsed_url = urlparse(url)
+        safe_domain = self._sanitize_filename(parsed_url.netloc)
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        return self.output_dir / f"{company_name}_{safe_domain}_{timestamp}.pdf"
+    
     def _sanitize_filename(self, filename: str) -> str:
         """Create filesystem-safe filename"""
         # Remove or replace invalid characters
@@ -453,63 +891,438 @@ class PDFArchiveManager:
         # Truncate if too long
         return filename[:50]
 
+# -----------------------------------
+# PDF Document Text Extraction
+# -----------------------------------
+
+def iter_pdf_page_text(body: bytes) -> Iterator[str]:
+    """Yield the text of a PDF document one page at a time"""
+    if PDF_LIB == "pymupdf":
+        with fitz.open(stream=body, filetype="pdf") as document:
+            for page in document:
+                yield page.get_text()
+    elif PDF_LIB == "pypdf":
+        reader = PdfReader(io.BytesIO(body))
+        for page in reader.pages:
+            yield page.extract_text() or ""
+    else:
+        raise RuntimeError("No PDF text extractor installed (pip install pymupdf or pypdf)")
+
+def pdf_document_title(body: bytes) -> Optional[str]:
+    """Read the title from PDF metadata, if any"""
+    try:
+        if PDF_LIB == "pymupdf":
+            with fitz.open(stream=body, filetype="pdf") as document:
+                return (document.metadata or {}).get("title") or None
+        if PDF_LIB == "pypdf":
+            metadata = PdfReader(io.BytesIO(body)).metadata
+            return metadata.title if metadata and metadata.title else None
+    except Exception as e:
+        logger.debug(f"Could not read PDF metadata: {e}")
+    return None
+
+# Markers of client-rendered shells whose static HTML has no real content
+JS_SHELL_MARKERS = (
+    "enable javascript", "requires javascript", "javascript is disabled",
+    '<div id="root"></div>', '<div id="app"></div>', '<div id="__next"></div>'
+)
+
+def requires_live_render(fetched: FetchedPage, text_content: str) -> bool:
+    """Decide whether a captured response is unfit for offline rendering"""
+    if fetched.truncated:
+        return True
+    if fetched.content_type and "html" not in fetched.content_type:
+        return True
+    if len(text_content) < config.min_static_text_chars:
+        return True
+    html_lower = fetched.text.lower()
+    return any(marker in html_lower for marker in JS_SHELL_MARKERS)
+
 # -----------------------------------
 # Search & Analysis Engine
 # -----------------------------------
 
 class GoogleSearchManager:
-    """Enterprise Google Custom Search integration"""
+    """Federated search over Google Custom Search and, when configured, SerpApi"""
     
     def __init__(self):
-        self.service = None
+        self.search: Optional[FederatedSearch] = None
+        self.cache = SearchCache(
+            ttl=config.search_cache_ttl_hours * 3600,
+            daily_limits={"google_cse": config.search_daily_limit}
+        )
         self._initialize_service()
     
     def _initialize_service(self):
-        """Initialize Google Custom Search service"""
+        """Initialize every search provider that has credentials"""
+        providers: List[SearchProvider] = []
         try:
-            if not config.google_api_key or not config.custom_search_engine_id:
-                raise ValueError("Google API credentials not configured")
-            
-            self.service = build("customsearch", "v1", developerKey=config.google_api_key)
+            # Built once from the bundled discovery document; no discovery request per query
+            client = CSEClient(
+                config.google_api_key,
+                config.custom_search_engine_id,
+                bucket=TokenBucket.per_minute(config.search_queries_per_minute),
+                max_workers=config.max_google_pages,
+                cache=self.cache
+            )
+            providers.append(GoogleCSEProvider(client))
             logger.info("Google Custom Search service initialized")
         except Exception as e:
             logger.error(f"Failed to initialize Google service: {e}")
-            self.service = None
+        
+        if config.serpapi_key:
+            try:
+                providers.append(SerpApiProvider(config.serpapi_key, cache=self.cache,
+                                                 max_workers=config.max_google_pages))
+                logger.info("SerpApi search provider initialized")
+            except Exception as e:
+                logger.error(f"Failed to initialize SerpApi provider: {e}")
+        
+        if providers:
+            self.search = FederatedSearch(providers, timeouts=config.search_provider_timeouts)
     
-    async def search_company_risks(self, company_name: str) -> List[str]:
+    async def search_company_risks(self, company_name: str) -> List[SearchResult]:
         """Search for company risk-related content"""
-        if not self.service:
+        if not self.search:
             logger.error("Google Search service not available")
             return []
         
-        all_urls = []
+        # Shard the full risk lexicon so every term is actually searched
+        anchor = f'"{company_name}"'
+        call_budget = config.search_call_budget
+        if call_budget is None:
+            # At least one call per shard; a smaller explicit budget trades lexicon coverage for quota
+            shards = shard_terms(anchor, config.risk_keywords, max_words=config.search_max_query_words)
+            call_budget = max(len(shards), config.max_google_pages)
+        plan = plan_queries(
+            anchor, config.risk_keywords, config.max_google_pages,
+            call_budget, max_words=config.search_max_query_words
+        )
+        if plan.dropped_terms:
+            logger.warning(f"Search budget of {call_budget} calls too small; raise "
+                           f"config.search_call_budget to also search: {', '.join(plan.dropped_terms)}")
+        logger.info(
+            f"Running {len(plan.queries)} query shards x {plan.pages_per_query} pages "
+            f"on {', '.join(self.search.provider_names)}"
+        )
         
-        # Enhanced search query with risk context
-        search_query = f'"{company_name}" (' + ' OR '.join(config.risk_keywords[:10]) + ')'
+        # All shards go to all providers at once; token buckets and timeouts bound the wait
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self.search.search_with_errors, query, plan.pages_per_query,
+                                config.results_per_page)
+              for query in plan.queries),
+            return_exceptions=True
+        )
         
+        rankings = []
+        for query, result in zip(plan.queries, results):
+            if isinstance(result, Exception):
+                logger.error(f"Search error for shard {query!r}: {result}")
+                continue
+            items, errors = result
+            for provider, error in errors.items():
+                logger.warning(f"{provider} failed for shard {query!r}: {error}")
+            rankings.append(items)
+        logger.info(f"Search quota: {format_ledger(self.cache.ledger())}")
+        
+        # URLs ranked well by several shards and providers come first
+        return [
+            SearchResult(item['link'], item['title'], item['snippet'], item['providers'])
+            for item in reciprocal_rank_fusion(rankings)
+        ]
+
+# -----------------------------------
+# Search Result Triage
+# -----------------------------------
+
+class SnippetTriage:
+    """Scores search results from their title and snippet before anything is downloaded"""
+    
+    def __init__(self, risk_analyzer: ContextualRiskAnalyzer):
+        self.risk_analyzer = risk_analyzer
+    
+    def score(self, result: SearchResult, company_name: str) -> Optional[float]:
+        """Risk score of the result's snippet text, or None when there is nothing to judge"""
+        if not result.snippet:
+            return None
+        text = f"{result.title} {result.snippet}"
+        
+        # Same lexicon and proximity scoring the page analyzer applies to every mention
+        hits = self.risk_analyzer.lexicon.scan(text)
+        score = self.risk_analyzer.score_text(text, company_name, hits)
+        
+        # Snippets often elide the company name; still credit bare risk terms
+        keyword_hits = len({hit.entry.term for hit in hits if hit.entry.is_risk_keyword})
+        return max(score, min(keyword_hits * 0.15, 0.6))
+    
+    def prioritize(self, results: List[SearchResult],
+                   company_name: str) -> Tuple[List[Tuple[float, SearchResult]], List[SearchResult]]:
+        """Split results into (priority, result) pairs to fetch, best first, and results to skip"""
+        scheduled = []
+        skipped = []
+        for result in results:
+            score = self.score(result, company_name)
+            if score is None:
+                # No snippet: neither promote nor skip
+                scheduled.append((config.snippet_min_score, result))
+            elif score < config.snippet_min_score and config.snippet_low_score_action == "skip":
+                skipped.append(result)
+            else:
+                scheduled.append((score, result))
+        
+        # Stable sort keeps search rank order among equal scores
+        scheduled.sort(key=lambda pair: pair[0], reverse=True)
+        return scheduled, skipped
+
+# -----------------------------------
+# Async HTTP Fetch Layer
+# -----------------------------------
+
+# Status codes worth another attempt; other 4xx responses are final
+RETRYABLE_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
+
+def _is_retryable_fetch_error(exc: BaseException) -> bool:
+    """Decide whether a failed fetch is transient"""
+    if isinstance(exc, aiohttp.ClientResponseError):
+        return exc.status in RETRYABLE_STATUS_CODES
+    if isinstance(exc, aiohttp.ClientSSLError):
+        # Certificate failures will not fix themselves between attempts
+        return False
+    return isinstance(exc, (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError))
+
+class AsyncPageFetcher:
+    """Non-blocking HTTP client shared by every analysis task of a run"""
+    
+    def __init__(self, max_connections: int = config.max_concurrent_scrapes,
+                 per_host_limit: int = config.max_scrapes_per_host,
+                 cache: Optional[HTTPResponseCache] = None, registry: Optional[FailureRegistry] = None):
+        self.max_connections = max_connections
+        self.per_host_limit = per_host_limit
+        self.cache = cache
+        self.registry = registry
+        self.pool_stats = AsyncPoolStats()
+        self.session: Optional[aiohttp.ClientSession] = None
+    
+    async def __aenter__(self):
+        """Open the pooled client session"""
+        # Pool sized to the scheduler's limits so no task waits for a connection
+        self.session = build_async_session(
+            pool_size=self.max_connections,
+            per_host_limit=self.per_host_limit,
+            connect_timeout=config.http_connect_timeout,
+            read_timeout=config.http_read_timeout,
+            total_timeout=config.http_total_timeout,
+            stats=self.pool_stats
+        )
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close the client session and its connections"""
+        if self.session:
+            await self.session.close()
+            logger.info(f"HTTP connection pool: {format_pool_stats(self.pool_stats.snapshot())}")
+    
+    async def fetch(self, url: str, probe: Optional[EvidenceProbe] = None) -> FetchedPage:
+        """Fetch a URL, retrying transient failures with exponential backoff"""
+        cached = await asyncio.to_thread(self.cache.get, url) if self.cache else None
+        if cached is not None and cached.fresh:
+            logger.debug(f"Serving {url} from response cache")
+            return self._from_cache(url, cached)
+        
+        if self.registry:
+            self.registry.check(url)
+        
+        retrying = AsyncRetrying(
+            stop=stop_after_attempt(config.http_retry_attempts),
+            wait=wait_exponential(multiplier=config.http_retry_backoff, max=10),
+            retry=retry_if_exception(_is_retryable_fetch_error),
+            reraise=True
+        )
         try:
-            for page in range(config.max_google_pages):
-                start_index = page * config.results_per_page + 1
-                
-                result = self.service.cse().list(
-                    q=search_query,
-                    cx=config.custom_search_engine_id,
-                    start=start_index,
-                    num=config.results_per_page
-                ).execute()
-                
-                items = result.get('items', [])
-                page_urls = [item.get('link') for item in items if item.get('link')]
-                all_urls.extend(page_urls)
+            async for attempt in retrying:
+                with attempt:
+                    fetched = await self._fetch_once(url, cached, probe)
+        except FetchRejected:
+            # The host answered; only the payload was unwanted. Also frees a half-open trial.
+            if self.registry:
+                self.registry.record_success(url)
+            raise
+        except Exception as e:
+            if self.registry and self.registry.record_failure(url, e):
+                raise HostUnavailable(f"{url}: {e}") from e
+            raise
+        
+        if self.registry:
+            self.registry.record_success(url)
+        return fetched
+    
+    async def _fetch_once(self, url: str, cached: Optional[CachedResponse] = None,
+                          probe: Optional[EvidenceProbe] = None) -> FetchedPage:
+        """Single streamed GET request without retries, revalidating a stale cache entry"""
+        request_headers = cached.conditional_headers() if cached else {}
+        async with self.session.get(url, headers=request_headers, allow_redirects=True) as response:
+            if cached is not None and response.status == 304:
+                refreshed = await asyncio.to_thread(self.cache.refresh, url, dict(response.headers))
+                return self._from_cache(url, refreshed or cached)
+            
+            response.raise_for_status()
+            headers = {name.lower(): value for name, value in response.headers.items()}
+            # Some servers label documents as generic binaries; trust the .pdf path then
+            is_pdf = response.content_type == "application/pdf" or (
+                response.content_type == "application/octet-stream"
+                and urlparse(str(response.url)).path.lower().endswith(".pdf")
+            )
+            max_bytes = config.max_pdf_bytes if is_pdf else config.max_page_bytes
+            check_response_headers(headers, max_bytes, HTML_CONTENT_TYPES + ((response.content_type,) if is_pdf else ()))
+            
+            # Stream the body so oversized pages never sit fully in memory; the
+            # probe only understands text, and PDFs must be read whole to parse
+            streamed = StreamingBody(max_bytes, None if is_pdf else probe, response.charset)
+            async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                if streamed.add(chunk):
+                    break
+            # A probe satisfied by the last chunk leaves a complete, cacheable body
+            streamed.finish(streamed.stopped_early and not response.content.at_eof()
+                            and bool(await response.content.readany()))
+            
+            fetched = FetchedPage(
+                url=url,
+                final_url=str(response.url),
+                status=response.status,
+                headers=headers,
+                body=streamed.body,
+                charset=response.charset,
+                truncated=streamed.truncated
+            )
+        
+        # Partial bodies must never be served as the full page later
+        if self.cache and not fetched.truncated:
+            await asyncio.to_thread(
+                self.cache.put, url, fetched.final_url, fetched.status, fetched.headers, fetched.body
+            )
+        return fetched
+    
+    @staticmethod
+    def _from_cache(url: str, cached: CachedResponse) -> FetchedPage:
+        return FetchedPage(
+            url=url,
+            final_url=cached.final_url,
+            status=cached.status,
+            headers=cached.headers,
+            body=cached.body,
+            charset=cached.charset
+        )
+
+# -----------------------------------
+# Scrape Scheduling
+# -----------------------------------
+
+class ScrapeScheduler:
+    """Priority work queue with a global concurrency cap and per-host limits"""
+    
+    def __init__(self, max_concurrency: int = config.max_concurrent_scrapes,
+                 per_host_limit: int = config.max_scrapes_per_host):
+        self.max_concurrency = max(1, max_concurrency)
+        self.per_host_limit = max(1, per_host_limit)
+        self._pending: List[Tuple[float, int, str]] = []  # heap of (priority, sequence, url)
+        self._sequence = itertools.count()
+        self._host_in_flight: Dict[str, int] = {}
+        self._in_flight = 0
+        self._completed = 0
+    
+    def submit(self, url: str, priority: float = 0):
+        """Queue a URL; lower priority values run first, ties run FIFO"""
+        heapq.heappush(self._pending, (priority, next(self._sequence), url))
+    
+    @property
+    def queue_depth(self) -> int:
+        return len(self._pending)
+    
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+    
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of live scheduler counters"""
+        return {
+            "queued": self.queue_depth,
+            "in_flight": self._in_flight,
+            "completed": self._completed,
+            "per_host_in_flight": {host: count for host, count in self._host_in_flight.items() if count}
+        }
+    
+    @staticmethod
+    def _host(url: str) -> str:
+        return urlparse(url).netloc.lower()
+    
+    def _pop_runnable(self) -> Optional[Tuple[float, int, str]]:
+        """Pop the best queued job whose host still has a free slot"""
+        skipped = []
+        job = None
+        while self._pending:
+            candidate = heapq.heappop(self._pending)
+            if self._host_in_flight.get(self._host(candidate[2]), 0) < self.per_host_limit:
+                job = candidate
+                break
+            skipped.append(candidate)
+        
+        for candidate in skipped:
+            heapq.heappush(self._pending, candidate)
+        return job
+    
+    async def run(self, handler: Callable[[str], Awaitable[Any]]) -> AsyncIterator[Tuple[str, Any]]:
+        """Drain the queue through handler, yielding (url, result) as jobs finish"""
+        condition = asyncio.Condition()
+        finished: asyncio.Queue = asyncio.Queue()
+        
+        async def worker():
+            while True:
+                async with condition:
+                    job = None
+                    while self._pending:
+                        job = self._pop_runnable()
+                        if job:
+                            break
+                        # Every queued job targets a saturated host
+                        await condition.wait()
+                    if not job:
+                        return
+                    
+                    url = job[2]
+                    host = self._host(url)
+                    self._in_flight += 1
+                    self._host_in_flight[host] = self._host_in_flight.get(host, 0) + 1
                 
-                # Rate limiting
-                await asyncio.sleep(1)
+                result = None
+                try:
+                    result = await handler(url)
+                except Exception as e:
+                    logger.error(f"Scheduled job failed for {url}: {e}")
+                finally:
+                    async with condition:
+                        self._in_flight -= 1
+                        self._host_in_flight[host] -= 1
+                        self._completed += 1
+                        condition.notify_all()
                 
-        except Exception as e:
-            logger.error(f"Google search error: {e}")
+                await finished.put((url, result))
+        
+        workers = [asyncio.create_task(worker()) for _ in range(min(self.max_concurrency, len(self._pending)))]
+        
+        async def close_when_drained():
+            await asyncio.gather(*workers)
+            await finished.put(None)
         
-        # Remove duplicates while preserving order
-        return list(dict.fromkeys(all_urls))
+        closer = asyncio.create_task(close_when_drained())
+        try:
+            while True:
+                item = await finished.get()
+                if item is None:
+                    break
+                yield item
+        finally:
+            for task in workers + [closer]:
+                task.cancel()
 
 # -----------------------------------
 # Content Analysis Engine
@@ -520,33 +1333,85 @@ class WebContentAnalyzer:
     
     def __init__(self):
         self.risk_analyzer = ContextualRiskAnalyzer()
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
-    
-    @retry(stop=stop_after_attempt(3), wait=wait_fixed(2))
-    async def analyze_page(self, url: str, company_name: str) -> Optional[RiskFinding]:
-        """Analyze webpage for risk indicators"""
+    
+    async def analyze_page(self, url: str, company_name: str, fetcher: AsyncPageFetcher) -> Optional[RiskFinding]:
+        """Fetch and analyze webpage for risk indicators"""
+        try:
+            # Fetch page content without blocking the event loop
+            fetched = await fetcher.fetch(url)
+        except Exception as e:
+            logger.error(f"Analysis failed for {url}: {e}")
+            return None
+        
+        title, text_content = self.extract_content(fetched)
+        return self.analyze_content(url, title, text_content, company_name)
+    
+    def extract_content(self, fetched: FetchedPage) -> Tuple[str, str]:
+        """Extract title and main text from a captured response"""
+        # Scripts, styles, nav, header and footer are left out by every backend
+        title, text_content = extract_text(fetched.text, config.html_parser_backend)
+        return title or urlparse(fetched.url).netloc, text_content
+    
+    def analyze_pdf(self, fetched: FetchedPage, company_name: str,
+                    extract_entities: bool = True) -> Optional[RiskFinding]:
+        """Analyze a PDF document page by page, stopping at the first finding"""
+        title = pdf_document_title(fetched.body) or Path(urlparse(fetched.url).path).name or urlparse(fetched.url).netloc
+        try:
+            carry = ""
+            for page_text in iter_pdf_page_text(fetched.body):
+                # Carry the previous page's tail so mentions spanning a page break keep their context
+                risk_finding = self.analyze_content(fetched.url, title, f"{carry} {page_text}", company_name,
+                                                    extract_entities)
+                if risk_finding:
+                    return risk_finding
+                carry = page_text[-config.context_window_size:]
+        except Exception as e:
+            logger.error(f"PDF text extraction failed for {fetched.url}: {e}")
+        return None
+    
+    def analyze_portfolio_content(self, url: str, title: str, text_content: str, vendors: Tuple[str, ...],
+                                  extract_entities: bool = True) -> Tuple[Dict[str, RiskFinding], Set[str]]:
+        """Analyze extracted page text for every vendor of a portfolio"""
+        try:
+            findings, mentioned = self.risk_analyzer.analyze_portfolio(text_content, vendors, extract_entities)
+        except Exception as e:
+            logger.error(f"Portfolio analysis failed for {url}: {e}")
+            return {}, set()
+        
+        for vendor, risk_finding in findings.items():
+            risk_finding.url = url
+            risk_finding.title = title
+            logger.info(f"Risk found in {url} for {vendor}: {risk_finding.risk_category}")
+        return findings, mentioned
+    
+    def analyze_portfolio_pdf(self, fetched: FetchedPage, vendors: Tuple[str, ...],
+                              extract_entities: bool = True) -> Tuple[Dict[str, RiskFinding], Set[str]]:
+        """Analyze a PDF page by page until every mentioned vendor has a finding"""
+        title = pdf_document_title(fetched.body) or Path(urlparse(fetched.url).path).name or urlparse(fetched.url).netloc
+        findings: Dict[str, RiskFinding] = {}
+        mentioned: Set[str] = set()
+        try:
+            carry = ""
+            for page_text in iter_pdf_page_text(fetched.body):
+                page_findings, page_mentioned = self.analyze_portfolio_content(
+                    fetched.url, title, f"{carry} {page_text}", vendors, extract_entities
+                )
+                for vendor, risk_finding in page_findings.items():
+                    findings.setdefault(vendor, risk_finding)
+                mentioned |= page_mentioned
+                if len(findings) == len(vendors):
+                    break
+                carry = page_text[-config.context_window_size:]
+        except Exception as e:
+            logger.error(f"PDF text extraction failed for {fetched.url}: {e}")
+        return findings, mentioned
+    
+    def analyze_content(self, url: str, title: str, text_content: str, company_name: str,
+                        extract_entities: bool = True) -> Optional[RiskFinding]:
+        """Analyze extracted page text for risk indicators"""
         try:
-            # Fetch page content
-            response = self.session.get(url, timeout=config.http_timeout)
-            response.raise_for_status()
-            
-            # Parse content
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Extract title
-            title = soup.title.string.strip() if soup.title else urlparse(url).netloc
-            
-            # Extract main content (remove scripts, styles, etc.)
-            for script_or_style in soup(["script", "style", "nav", "footer", "header"]):
-                script_or_style.decompose()
-            
-            text_content = soup.get_text(" ", strip=True)
-            
             # Perform contextual risk analysis
-            risk_finding = self.risk_analyzer.analyze_risk_context(text_content, company_name)
+            risk_finding = self.risk_analyzer.analyze_risk_context(text_content, company_name, extract_entities)
             
             if risk_finding:
                 risk_finding.url = url
@@ -561,6 +1426,208 @@ class WebContentAnalyzer:
             logger.error(f"Analysis failed for {url}: {e}")
             return None
 
+# -----------------------------------
+# Batched Entity Extraction
+# -----------------------------------
+
+class EntityBatcher:
+    """Collects finding contexts from every page and runs Stanza NER on them in bulk"""
+    
+    def __init__(self, risk_analyzer: ContextualRiskAnalyzer, batch_size: Optional[int] = None,
+                 flush_seconds: Optional[float] = None, pool: Optional["NLPWorkerPool"] = None):
+        self.risk_analyzer = risk_analyzer
+        self.pool = pool
+        self.batch_size = max(batch_size or config.ner_batch_size, 1)
+        self.flush_seconds = config.ner_flush_seconds if flush_seconds is None else flush_seconds
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._batches: Set[asyncio.Task] = set()
+        self.documents = 0
+        self.calls = 0
+        self.cached = 0
+    
+    def submit(self, context: str) -> "asyncio.Future[List[str]]":
+        """Queue a context; the future resolves to its entities once its batch has run"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((context, future))
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.flush_seconds, self._flush)
+        return future
+    
+    def _flush(self):
+        """Start a batch with everything queued so far"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        task = asyncio.get_running_loop().create_task(self._run(batch))
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+    
+    async def _run(self, batch: List[Tuple[str, asyncio.Future]]):
+        contexts = [context for context, _ in batch]
+        self.calls += 1
+        self.documents += len(contexts)
+        try:
+            if self.pool is not None:
+                entities, cached = await self.pool.run(extract_entities_batch, contexts)
+            else:
+                # A worker thread, so the first batch also loads the pipeline off the event loop
+                entities, cached = await asyncio.to_thread(self.risk_analyzer.extract_entities_counted, contexts)
+            self.cached += cached
+        except Exception as e:
+            logger.error(f"Batched entity extraction failed for {len(contexts)} contexts: {e}")
+            entities = [[] for _ in contexts]
+        
+        for (_, future), found in zip(batch, entities):
+            if not future.done():
+                future.set_result(found)
+    
+    async def drain(self):
+        """Flush the partial batch and wait for every batch in flight"""
+        self._flush()
+        while self._batches:
+            await asyncio.gather(*list(self._batches))
+
+# -----------------------------------
+# NLP Worker Pool
+# -----------------------------------
+
+_process_analyzer: Optional[WebContentAnalyzer] = None
+
+def _init_nlp_worker(app_config: AppConfig):
+    """Process-pool initializer: adopt the parent's configuration"""
+    global config
+    config = app_config
+
+def _content_analyzer() -> WebContentAnalyzer:
+    """Analyzer owned by the current process; its Stanza pipeline loads on first use"""
+    global _process_analyzer
+    if _process_analyzer is None:
+        _process_analyzer = WebContentAnalyzer()
+    return _process_analyzer
+
+def analyze_fetched_page(url: str, fetched: FetchedPage,
+                         company_name: str) -> Tuple[str, str, Optional[RiskFinding]]:
+    """Parse and score an HTML page; entities are left to the EntityBatcher"""
+    analyzer = _content_analyzer()
+    title, text_content = analyzer.extract_content(fetched)
+    risk_finding = analyzer.analyze_content(url, title, text_content, company_name, extract_entities=False)
+    return title, text_content, risk_finding
+
+def analyze_fetched_pdf(fetched: FetchedPage, company_name: str) -> Optional[RiskFinding]:
+    """Extract and score a PDF document's text; entities are left to the EntityBatcher"""
+    return _content_analyzer().analyze_pdf(fetched, company_name, extract_entities=False)
+
+def analyze_page_text(url: str, title: str, text_content: str, company_name: str) -> Optional[RiskFinding]:
+    """Score already-extracted text; entities are left to the EntityBatcher"""
+    return _content_analyzer().analyze_content(url, title, text_content, company_name, extract_entities=False)
+
+def analyze_portfolio_page(url: str, fetched: FetchedPage,
+                           vendors: Tuple[str, ...]) -> Tuple[str, str, Dict[str, RiskFinding], Set[str]]:
+    """Parse an HTML page once and score it for every vendor it mentions"""
+    analyzer = _content_analyzer()
+    title, text_content = analyzer.extract_content(fetched)
+    findings, mentioned = analyzer.analyze_portfolio_content(url, title, text_content, vendors, extract_entities=False)
+    return title, text_content, findings, mentioned
+
+def analyze_portfolio_text(url: str, title: str, text_content: str,
+                           vendors: Tuple[str, ...]) -> Tuple[Dict[str, RiskFinding], Set[str]]:
+    return _content_analyzer().analyze_portfolio_content(url, title, text_content, vendors, extract_entities=False)
+
+def analyze_portfolio_document(fetched: FetchedPage, vendors: Tuple[str, ...]) -> Tuple[Dict[str, RiskFinding], Set[str]]:
+    return _content_analyzer().analyze_portfolio_pdf(fetched, vendors, extract_entities=False)
+
+def extract_entities_batch(contexts: List[str]) -> Tuple[List[List[str]], int]:
+    """Entities per context and the number served from the worker's NER cache"""
+    return _content_analyzer().risk_analyzer.extract_entities_counted(contexts)
+
+class NLPWorkerPool:
+    """Runs parsing, scoring and NER in worker processes, falling back to threads in-process
+    
+    At most max_pending calls are outstanding; scrape handlers hold their
+    scheduler slot while they wait, so fetching slows down to the pace of the
+    workers instead of piling up pages in memory.
+    """
+    
+    def __init__(self, workers: Optional[int] = None, max_pending: Optional[int] = None):
+        self.workers = config.nlp_workers if workers is None else workers
+        self.max_pending = max(max_pending or config.nlp_max_pending, 1)
+        self.in_process = self.workers <= 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._spawn_config: Optional[str] = None  # Snapshot of the config the workers were started with
+        self._lock = threading.Lock()
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop = None
+    
+    @property
+    def mode(self) -> str:
+        return "in-process" if self.in_process else f"{self.workers} worker processes"
+    
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        """Start the worker processes on first use; they persist across runs until the config changes"""
+        with self._lock:
+            # Workers copy the config when spawned; a changed lexicon or threshold needs fresh ones
+            snapshot = repr(config)
+            if self._executor is not None and self._spawn_config != snapshot:
+                logger.info("Configuration changed since the NLP workers started; restarting them")
+                # Calls already queued finish on the old workers
+                self._executor.shutdown(wait=False)
+                self._executor = None
+            if self._executor is None and not self.in_process:
+                try:
+                    # Spawned, not forked: the parent runs Tk, the event loop and Torch threads
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=_init_nlp_worker,
+                        initargs=(config,)
+                    )
+                    self._spawn_config = snapshot
+                except (OSError, ValueError, NotImplementedError) as e:
+                    logger.warning(f"NLP worker processes unavailable, analysing in-process: {e}")
+                    self.in_process = True
+            return self._executor
+    
+    def _fall_back(self, error: Exception):
+        logger.warning(f"NLP worker pool failed ({error}); analysing in-process from now on")
+        with self._lock:
+            self.in_process = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _pending_slots(self) -> asyncio.Semaphore:
+        # Each GUI run has its own event loop, and a semaphore belongs to one loop
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self.max_pending)
+            self._slots_loop = loop
+        return self._slots
+    
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Call a module-level function on a worker and await its (picklable) result"""
+        async with self._pending_slots():
+            executor = self._get_executor()
+            if executor is not None:
+                try:
+                    return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+                except BrokenProcessPool as e:
+                    # A worker died (e.g. out of memory loading models); retry here
+                    self._fall_back(e)
+            return await asyncio.to_thread(func, *args)
+    
+    def close(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
 # -----------------------------------
 # Report Generation System
 # -----------------------------------
@@ -586,6 +1653,94 @@ class EnterpriseReportGenerator:
         logger.info(f"Comprehensive report generated: {filename}")
         return str(filepath)
     
+    def generate_delta_report(self, vendor_profile: VendorProfile) -> Optional[str]:
+        """Generate the changes-since-last-screening report for a re-run"""
+        if vendor_profile.delta is None:
+            return None
+        
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"VendorDueDiligence_Delta_{vendor_profile.company_name}_{timestamp}.txt"
+        filepath = self.reports_dir / filename
+        
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(self._build_delta_content(vendor_profile))
+        
+        logger.info(f"Delta report generated: {filename}")
+        return str(filepath)
+    
+    def _build_delta_content(self, profile: VendorProfile) -> str:
+        """Build formatted delta report content"""
+        delta = profile.delta
+        previous_run = datetime.datetime.fromtimestamp(delta.previous_run_at)
+        findings = {finding.url: finding for finding in profile.risk_findings}
+        lines = [
+            "=" * 80,
+            "VENDOR DUE DILIGENCE DELTA REPORT",
+            "=" * 80,
+            f"Company: {profile.company_name}",
+            f"Analysis Date: {profile.analysis_timestamp.strftime('%Y-%m-%d %H:%M:%S')}",
+            f"Previous Screening: {previous_run.strftime('%Y-%m-%d %H:%M:%S')}",
+            f"Overall Risk Level: {profile.risk_level} ({profile.overall_risk_score:.2f}/1.00)",
+            "",
+            "SUMMARY OF CHANGES",
+            "-" * 18,
+            f"New Sources: {len(delta.new_urls)}",
+            f"Changed Sources: {len(delta.changed_urls)}",
+            f"Unchanged Sources (findings carried forward): {len(delta.unchanged_urls)}",
+            f"Sources No Longer Found: {len(delta.dropped_urls)}",
+            f"Sources Unavailable This Run: {len(delta.unavailable_urls)}",
+            f"New Risk Findings: {len(delta.new_findings)}",
+            f"Resolved Risk Findings: {len(delta.resolved_findings)}",
+            f"Carried Risk Findings: {len(delta.carried_findings)}",
+            ""
+        ]
+        
+        if not delta.has_changes:
+            lines.extend(["✓ No new or changed sources since the previous screening", ""])
+        
+        if delta.new_findings:
+            lines.extend(["NEW RISK FINDINGS", "-" * 17])
+            for i, url in enumerate(delta.new_findings, 1):
+                finding = findings[url]
+                source = "changed source" if url in delta.changed_urls else "new source"
+                lines.extend([
+                    f"{i}. {finding.risk_category} ({source}) - {finding.title}",
+                    f"   URL: {url}",
+                    f"   Confidence: {finding.confidence_score:.2f}",
+                    f"   Context: {finding.context[:200]}...",
+                    ""
+                ])
+        
+        if delta.resolved_findings:
+            lines.extend(["RESOLVED RISK FINDINGS", "-" * 22,
+                          "Sources that no longer carry a risk finding after their content changed:"])
+            lines.extend(f"• {url}" for url in delta.resolved_findings)
+            lines.append("")
+        
+        changed_findings = [url for url in delta.carried_findings if url in delta.changed_urls]
+        if changed_findings:
+            lines.extend(["UPDATED SOURCES WITH ONGOING FINDINGS", "-" * 37])
+            for url in changed_findings:
+                lines.append(f"• {findings[url].risk_category}: {url}")
+            lines.append("")
+        
+        for heading, urls in (("NEW SOURCES", delta.new_urls), ("SOURCES NO LONGER FOUND", delta.dropped_urls),
+                              ("SOURCES UNAVAILABLE THIS RUN", delta.unavailable_urls)):
+            if urls:
+                lines.extend([heading, "-" * len(heading)])
+                lines.extend(f"• {url}" for url in urls)
+                lines.append("")
+        
+        lines.extend([
+            "Unchanged sources were not re-analyzed or re-archived; their earlier",
+            "findings and PDF archives are included in the comprehensive report.",
+            "",
+            "=" * 80,
+            "END OF DELTA REPORT",
+            "=" * 80
+        ])
+        return "\n".join(lines)
+    
     def _build_report_content(self, profile: VendorProfile) -> str:
         """Build formatted report content"""
         lines = []
@@ -695,7 +1850,29 @@ class VendorDueDiligenceEngine:
     def __init__(self):
         self.search_manager = GoogleSearchManager()
         self.content_analyzer = WebContentAnalyzer()
+        self.triage = SnippetTriage(self.content_analyzer.risk_analyzer)
         self.report_generator = EnterpriseReportGenerator(config.reports_dir)
+        self.response_cache = (
+            HTTPResponseCache(max_bytes=config.http_cache_max_mb * 1024 * 1024) if config.http_cache_enabled else None
+        )
+        self.failure_registry = FailureRegistry(
+            failure_threshold=config.circuit_failure_threshold,
+            reset_timeout=config.circuit_reset_seconds,
+            negative_ttl=config.negative_cache_ttl_hours * 3600
+        )
+        self.scheduler: Optional[ScrapeScheduler] = None
+        self.nlp_pool = NLPWorkerPool()
+        # Text from one parser backend is not reused by another
+        self.text_store = TextStore(
+            version=text_version(config.html_parser_backend or default_backend()),
+            max_bytes=config.text_store_max_mb * 1024 * 1024
+        ) if config.text_store_enabled else None
+        self.run_history = (
+            RunHistory(Path(config.base_output_dir) / "run_history.sqlite3") if config.incremental_rescreening else None
+        )
+        
+        # Optional sink for ("STATUS", message) / ("PROGRESS", fraction) events
+        self.status_callback: Optional[Callable[[Tuple[Any, ...]], None]] = None
         
         # Create directory structure
         self._create_directory_structure()
@@ -725,81 +1902,441 @@ class VendorDueDiligenceEngine:
         risk_findings = []
         pdf_files = []
         clean_pages = 0
+        page_results = {}  # dedup key -> (url, digest, finding, pdf path) for the run history
         
         try:
+            # Pages unchanged since the last screening keep their finding and archive
+            previous = await asyncio.to_thread(self.run_history.last_run, company_name) if self.run_history else None
+            if previous:
+                logger.info(f"Re-screening {company_name}: last run covered {len(previous.pages)} URLs")
+            
             # Step 1: Search for risk-related content
-            urls = await self.search_manager.search_company_risks(company_name)
-            logger.info(f"Found {len(urls)} URLs for analysis")
+            results = await self.search_manager.search_company_risks(company_name)
+            
+            # Collapse URL variants across providers and shards so each page is processed once
+            seen = DedupIndex()
+            unique_results = []
+            for result in results:
+                if seen.add(result.url, result.providers):
+                    unique_results.append(result)
+            for result in unique_results:
+                result.url = seen.preferred(result.url)
+                result.providers = sorted(seen.sources(result.url))
+            if len(unique_results) < len(results):
+                logger.info(f"Collapsed {len(results) - len(unique_results)} duplicate URL variants")
+            results = unique_results
+            logger.info(f"Found {len(results)} URLs for analysis")
+            
+            # Triage on title + snippet so likely findings are fetched first
+            if config.snippet_triage_enabled:
+                scheduled, skipped = self.triage.prioritize(results, company_name)
+                for result in skipped:
+                    logger.info(f"Skipping low-relevance result: {result.url}")
+            else:
+                scheduled, skipped = [(0.0, result) for result in results], []
+            urls = [result.url for _, result in scheduled]
             
             # Step 2: Concurrent analysis with PDF generation
-            async with PDFArchiveManager(Path(config.base_output_dir) / config.pdf_archive_dir) as pdf_manager:
+            async with AsyncPageFetcher(cache=self.response_cache, registry=self.failure_registry) as fetcher, \
+                    PDFArchiveManager(Path(config.base_output_dir) / config.pdf_archive_dir,
+                                      registry=self.failure_registry) as pdf_manager:
                 
-                # Analyze content and generate PDFs concurrently
-                tasks = []
-                for url in urls:
-                    task = asyncio.create_task(
-                        self._analyze_and_archive(url, company_name, pdf_manager)
-                    )
-                    tasks.append(task)
+                # Analyze content and generate PDFs under the scheduler's limits
+                self.scheduler = ScrapeScheduler()
+                for score, result in scheduled:
+                    # Lower priority values run first
+                    self.scheduler.submit(result.url, priority=-score)
+                
+                async def handle(url: str):
+                    last_page = previous.page(url) if previous else None
+                    return await self._analyze_and_archive(url, company_name, fetcher, pdf_manager, last_page)
+                
+                # Entities for all findings are extracted in bulk while pages keep completing
+                entity_batcher = EntityBatcher(self.content_analyzer.risk_analyzer, pool=self.nlp_pool)
+                logger.info(f"Page analysis: {self.nlp_pool.mode}")
+                pending_entities = []
                 
                 # Process results as they complete
-                for i, task in enumerate(asyncio.as_completed(tasks)):
-                    try:
-                        result = await task
-                        if result:
-                            risk_finding, pdf_path = result
-                            if risk_finding:
-                                risk_findings.append(risk_finding)
-                                logger.info(f"Risk identified: {risk_finding.risk_category}")
-                            else:
-                                clean_pages += 1
-                            
-                            if pdf_path:
-                                pdf_files.append(pdf_path)
-                        
-                        # Progress logging
-                        progress = ((i + 1) / len(tasks)) * 100
-                        logger.info(f"Analysis progress: {progress:.1f}%")
+                completed = 0
+                reused = 0
+                async for url, result in self.scheduler.run(handle):
+                    completed += 1
+                    if result:
+                        risk_finding, pdf_path, digest = result
+                        last_page = previous.page(url) if previous else None
+                        unchanged = digest is not None and last_page is not None and last_page.digest == digest
+                        reused += unchanged
+                        if risk_finding:
+                            risk_findings.append(risk_finding)
+                            if not risk_finding.entities_found:
+                                # Findings carried forward from the last run already have their entities
+                                pending_entities.append((risk_finding, entity_batcher.submit(risk_finding.context)))
+                            logger.info(f"Risk identified: {risk_finding.risk_category}")
+                        else:
+                            clean_pages += 1
                         
-                    except Exception as e:
-                        logger.error(f"Task failed: {e}")
-                        continue
+                        if pdf_path:
+                            pdf_files.append(pdf_path)
+                        page_results[dedup_key(url)] = (url, digest, risk_finding, pdf_path)
+                    else:
+                        page_results[dedup_key(url)] = (url, None, None, None)
+                    
+                    # Progress logging
+                    stats = self.scheduler.stats()
+                    progress = completed / len(urls)
+                    logger.info(
+                        f"Analysis progress: {progress * 100:.1f}% "
+                        f"(queued: {stats['queued']}, in flight: {stats['in_flight']})"
+                    )
+                    self._publish("PROGRESS", progress)
+                    self._publish("STATUS", f"Analyzed {completed}/{len(urls)} sources - "
+                                            f"{stats['in_flight']} in flight, {stats['queued']} queued")
+                
+                await entity_batcher.drain()
+                for risk_finding, entities in pending_entities:
+                    risk_finding.entities_found = entities.result()
+                if entity_batcher.calls:
+                    logger.info(f"Extracted entities for {entity_batcher.documents} contexts "
+                                f"in {entity_batcher.calls} NER calls ({entity_batcher.cached} from cache)")
+                if previous:
+                    logger.info(f"Reused {reused} unchanged pages; analyzed {completed - reused} new or changed")
             
-            # Step 3: Calculate risk metrics
-            overall_risk_score = self._calculate_overall_risk_score(risk_findings, len(urls))
-            risk_level = self._determine_risk_level(overall_risk_score, len(risk_findings))
-            recommendations = self._generate_recommendations(risk_level, len(risk_findings), len(urls))
+            # Steps 3 and 4: Calculate risk metrics and create vendor profile
+            vendor_profile = self._build_profile(company_name, start_time, len(urls), risk_findings,
+                                                 clean_pages, pdf_files)
             
-            # Step 4: Create vendor profile
-            vendor_profile = VendorProfile(
-                company_name=company_name,
-                analysis_timestamp=start_time,
-                total_pages_analyzed=len(urls),
-                risk_findings=risk_findings,
-                clean_pages=clean_pages,
-                pdf_files_generated=pdf_files,
-                overall_risk_score=overall_risk_score,
-                risk_level=risk_level,
-                recommendations=recommendations
-            )
+            if self.run_history:
+                vendor_profile.delta = await asyncio.to_thread(
+                    self._record_run, company_name, start_time, previous, page_results,
+                    [result.url for result in skipped]
+                )
             
-            logger.info(f"Due diligence completed for {company_name}: {risk_level} risk level")
+            logger.info(f"Due diligence completed for {company_name}: {vendor_profile.risk_level} risk level")
             return vendor_profile
             
         except Exception as e:
             logger.error(f"Due diligence failed for {company_name}: {e}")
             raise
     
-    async def _analyze_and_archive(self, url: str, company_name: str, pdf_manager: PDFArchiveManager) -> Optional[Tuple[Optional[RiskFinding], Optional[str]]]:
-        """Analyze content and generate PDF archive"""
+    async def conduct_portfolio_due_diligence(self, company_names: List[str]) -> List[VendorProfile]:
+        """Screen many vendors at once, fetching and parsing every shared URL a single time
+        
+        Each page is scanned once with an automaton over all vendors' name
+        variations, and every vendor it mentions is scored on it, so a page
+        found for one vendor also counts as evidence for another.
+        """
+        vendors = tuple(dict.fromkeys(name.strip() for name in company_names if name.strip()))
+        logger.info(f"Starting portfolio screening of {len(vendors)} vendors")
+        start_time = datetime.datetime.now()
+        
+        # Step 1: Search per vendor; one index collapses URL variants across the whole portfolio
+        seen = DedupIndex()
+        vendor_pages: Dict[str, Set[str]] = {vendor: set() for vendor in vendors}  # dedup keys per vendor
+        priorities: Dict[str, float] = {}
+        for index, vendor in enumerate(vendors, 1):
+            self._publish("STATUS", f"Searching {index}/{len(vendors)}: {vendor}")
+            try:
+                results = await self.search_manager.search_company_risks(vendor)
+            except Exception as e:
+                logger.error(f"Search failed for {vendor}: {e}")
+                continue
+            
+            if config.snippet_triage_enabled:
+                scheduled, skipped = self.triage.prioritize(results, vendor)
+                for result in skipped:
+                    logger.info(f"Skipping low-relevance result for {vendor}: {result.url}")
+            else:
+                scheduled = [(0.0, result) for result in results]
+            
+            for score, result in scheduled:
+                seen.add(result.url, result.providers)
+                key = dedup_key(result.url)
+                vendor_pages[vendor].add(key)
+                priorities[key] = max(score, priorities.get(key, score))
+        
+        urls = {dedup_key(url): url for url in seen.urls()}
+        searched_for = {key: tuple(vendor for vendor in vendors if key in vendor_pages[vendor]) for key in urls}
+        shared = sum(len(pages) for pages in vendor_pages.values())
+        logger.info(f"Portfolio search found {len(urls)} unique URLs for {shared} vendor results")
+        
+        risk_findings: Dict[str, List[RiskFinding]] = {vendor: [] for vendor in vendors}
+        clean_pages = dict.fromkeys(vendors, 0)
+        pdf_files: Dict[str, List[str]] = {vendor: [] for vendor in vendors}
+        
+        # Step 2: Fetch, parse and archive each URL once; score it for every vendor
+        async with AsyncPageFetcher(cache=self.response_cache, registry=self.failure_registry) as fetcher, \
+                PDFArchiveManager(Path(config.base_output_dir) / config.pdf_archive_dir,
+                                  registry=self.failure_registry) as pdf_manager:
+            
+            self.scheduler = ScrapeScheduler()
+            url_keys = {}
+            for key, url in urls.items():
+                url_keys[url] = key
+                self.scheduler.submit(url, priority=-priorities.get(key, 0.0))
+            
+            async def handle(url: str):
+                return await self._analyze_portfolio_page(url, vendors, searched_for[url_keys[url]],
+                                                          fetcher, pdf_manager)
+            
+            entity_batcher = EntityBatcher(self.content_analyzer.risk_analyzer, pool=self.nlp_pool)
+            pending_entities = []
+            
+            completed = 0
+            async for url, result in self.scheduler.run(handle):
+                completed += 1
+                key = url_keys[url]
+                if result:
+                    findings, mentioned, pdf_path = result
+                    # Pages mentioning a vendor count for it even when found via another vendor
+                    for vendor in mentioned - set(searched_for[key]):
+                        vendor_pages[vendor].add(key)
+                    for vendor in set(searched_for[key]) | mentioned:
+                        risk_finding = findings.get(vendor)
+                        if risk_finding:
+                            risk_findings[vendor].append(risk_finding)
+                            pending_entities.append((risk_finding, entity_batcher.submit(risk_finding.context)))
+                        else:
+                            clean_pages[vendor] += 1
+                        if pdf_path:
+                            pdf_files[vendor].append(pdf_path)
+                
+                stats = self.scheduler.stats()
+                progress = completed / max(len(urls), 1)
+                self._publish("PROGRESS", progress)
+                self._publish("STATUS", f"Analyzed {completed}/{len(urls)} shared sources - "
+                                        f"{stats['in_flight']} in flight, {stats['queued']} queued")
+            
+            await entity_batcher.drain()
+            for risk_finding, entities in pending_entities:
+                risk_finding.entities_found = entities.result()
+        
+        # Steps 3 and 4: Per-vendor risk metrics and profiles
+        profiles = [
+            self._build_profile(vendor, start_time, len(vendor_pages[vendor]), risk_findings[vendor],
+                                clean_pages[vendor], pdf_files[vendor])
+            for vendor in vendors
+        ]
+        flagged = sum(1 for profile in profiles if profile.risk_findings)
+        logger.info(f"Portfolio screening completed: {flagged}/{len(vendors)} vendors with findings, "
+                    f"{len(urls)} URLs fetched once each")
+        return profiles
+    
+    async def _analyze_portfolio_page(self, url: str, vendors: Tuple[str, ...], searched_for: Tuple[str, ...],
+                                      fetcher: AsyncPageFetcher, pdf_manager: PDFArchiveManager
+                                      ) -> Optional[Tuple[Dict[str, RiskFinding], Set[str], Optional[str]]]:
+        """Fetch, parse and archive one URL, then score it for every vendor it mentions"""
+        # Archives of pages shared by several vendors are named for the portfolio
+        archive_name = searched_for[0] if len(searched_for) == 1 else "Portfolio"
         try:
-            # Concurrent analysis and PDF generation
-            analysis_task = self.content_analyzer.analyze_page(url, company_name)
-            pdf_task = pdf_manager.generate_pdf(url, company_name)
+            try:
+                fetched = await fetcher.fetch(url)
+            except (HostUnavailable, FetchRejected) as e:
+                logger.warning(f"Skipping {url}: {e}")
+                return ({}, set(), None)
+            except Exception as e:
+                logger.error(f"Analysis failed for {url}: {e}")
+                if urlparse(url).path.lower().endswith(".pdf"):
+                    return ({}, set(), None)
+                return ({}, set(), await pdf_manager.generate_pdf(url, archive_name))
             
-            risk_finding, pdf_path = await asyncio.gather(analysis_task, pdf_task)
+            if fetched.is_pdf:
+                if fetched.truncated:
+                    logger.warning(f"PDF document exceeds size cap, skipping: {url}")
+                    return ({}, set(), None)
+                findings, mentioned = await self.nlp_pool.run(analyze_portfolio_document, fetched, vendors)
+                return (findings, mentioned, pdf_manager.save_document(url, archive_name, fetched.body))
             
-            return (risk_finding, pdf_path)
+            digest = content_digest(fetched.body)
+            stored = None
+            if self.text_store and not fetched.truncated:
+                stored = await asyncio.to_thread(self.text_store.get, digest)
+            
+            if stored is not None:
+                title, text_content = stored.title, stored.text
+                findings, mentioned = await self.nlp_pool.run(analyze_portfolio_text, url, title, text_content, vendors)
+            else:
+                title, text_content, findings, mentioned = await self.nlp_pool.run(
+                    analyze_portfolio_page, url, fetched, vendors
+                )
+            
+            if self.text_store and not fetched.truncated:
+                try:
+                    for vendor in set(searched_for) | mentioned:
+                        await asyncio.to_thread(self.text_store.put, url, digest, title, text_content, vendor)
+                except Exception as e:
+                    logger.warning(f"Could not store extracted text for {url}: {e}")
+            
+            captured = None if requires_live_render(fetched, text_content) else fetched
+            pdf_path = await pdf_manager.generate_pdf(url, archive_name, fetched=captured)
+            return (findings, mentioned, pdf_path)
+        
+        except Exception as e:
+            logger.error(f"Analysis and archival failed for {url}: {e}")
+            return None
+    
+    def rescore(self, company_name: str) -> VendorProfile:
+        """Re-score a vendor's stored page texts with the current lexicon and thresholds
+        
+        Needs no network access and no HTML parsing; only findings go through NER.
+        """
+        if self.text_store is None:
+            raise RuntimeError("Extracted-text store is disabled (config.text_store_enabled)")
+        
+        start_time = datetime.datetime.now()
+        risk_analyzer = self.content_analyzer.risk_analyzer
+        risk_analyzer.reload_lexicon()
+        
+        risk_findings = []
+        pages = 0
+        for url, extracted in self.text_store.iter_pages(self.text_store.urls_for(company_name)):
+            pages += 1
+            risk_finding = self.content_analyzer.analyze_content(url, extracted.title, extracted.text, company_name,
+                                                                 extract_entities=False)
+            if risk_finding:
+                risk_findings.append(risk_finding)
+        
+        if risk_findings:
+            entities = risk_analyzer.extract_entities([finding.context for finding in risk_findings])
+            for risk_finding, found in zip(risk_findings, entities):
+                risk_finding.entities_found = found
+        
+        logger.info(f"Re-scored {pages} stored pages for {company_name}: {len(risk_findings)} findings")
+        return self._build_profile(company_name, start_time, pages, risk_findings, pages - len(risk_findings), [])
+    
+    def _build_profile(self, company_name: str, start_time: datetime.datetime, total_pages: int,
+                       risk_findings: List[RiskFinding], clean_pages: int, pdf_files: List[str]) -> VendorProfile:
+        """Score the findings and assemble the vendor profile"""
+        overall_risk_score = self._calculate_overall_risk_score(risk_findings, total_pages)
+        risk_level = self._determine_risk_level(overall_risk_score, len(risk_findings))
+        recommendations = self._generate_recommendations(risk_level, len(risk_findings), total_pages)
+        
+        return VendorProfile(
+            company_name=company_name,
+            analysis_timestamp=start_time,
+            total_pages_analyzed=total_pages,
+            risk_findings=risk_findings,
+            clean_pages=clean_pages,
+            pdf_files_generated=pdf_files,
+            overall_risk_score=overall_risk_score,
+            risk_level=risk_level,
+            recommendations=recommendations
+        )
+    
+    def _record_run(self, company_name: str, start_time: datetime.datetime, previous: Optional[RunSnapshot],
+                    page_results: Dict[str, Tuple[str, Optional[str], Optional[RiskFinding], Optional[str]]],
+                    skipped_urls: Optional[List[str]] = None) -> Optional[RunDelta]:
+        """Store this run's pages and return the delta against the previous run, if there was one"""
+        pages = {
+            key: PageRecord(url, digest, risk_finding.to_record() if risk_finding else None, pdf_path)
+            for key, (url, digest, risk_finding, pdf_path) in page_results.items()
+        }
+        
+        # Results left unfetched by snippet triage are still listed; nothing suggests the page changed
+        if previous:
+            for url in skipped_urls or []:
+                key = dedup_key(url)
+                last_page = previous.pages.get(key)
+                if key not in pages and last_page is not None:
+                    pages[key] = PageRecord(url, last_page.digest, last_page.finding, last_page.pdf_path)
+        
+        delta = compare_runs(previous, pages) if previous else None
+        
+        # A source that could not be fetched this time keeps its last known state for the next run
+        if previous:
+            for key, page in pages.items():
+                last_page = previous.pages.get(key)
+                if page.digest is None and last_page is not None:
+                    page.digest, page.finding, page.pdf_path = last_page.digest, last_page.finding, last_page.pdf_path
+        try:
+            self.run_history.record_run(company_name, start_time.timestamp(), pages.values())
+        except Exception as e:
+            logger.warning(f"Could not record run history for {company_name}: {e}")
+        return delta
+    
+    def close(self):
+        """Stop the NLP worker processes"""
+        self.nlp_pool.close()
+    
+    def _publish(self, *event: Any):
+        """Forward a progress event to the registered callback"""
+        if self.status_callback:
+            self.status_callback(event)
+    
+    async def _analyze_and_archive(self, url: str, company_name: str, fetcher: AsyncPageFetcher,
+                                   pdf_manager: PDFArchiveManager, last_page: Optional[PageRecord] = None
+                                   ) -> Optional[Tuple[Optional[RiskFinding], Optional[str], Optional[str]]]:
+        """Fetch once, then analyze and archive from the same payload
+        
+        Returns (finding, PDF path, body digest); the digest is None only when
+        nothing could be analyzed. A body identical to the one seen in the
+        vendor's last run keeps that run's finding and archive.
+        """
+        try:
+            probe = None
+            if config.stop_on_evidence:
+                names = self.content_analyzer.risk_analyzer._generate_company_variations(company_name)
+                probe = EvidenceProbe(names, config.risk_keywords, config.evidence_min_risk_terms)
+            
+            try:
+                fetched = await fetcher.fetch(url, probe)
+            except HostUnavailable as e:
+                # Known-bad host or URL; the browser would fail the same way
+                logger.warning(str(e))
+                return (None, None, None)
+            except FetchRejected as e:
+                # Oversized or non-HTML payloads would only be downloaded again by the browser
+                logger.warning(f"Skipping {url}: {e}")
+                return (None, None, None)
+            except Exception as e:
+                logger.error(f"Analysis failed for {url}: {e}")
+                if urlparse(url).path.lower().endswith(".pdf"):
+                    # Chromium cannot print a PDF document it failed to download
+                    return (None, None, None)
+                # Nothing to analyze; the browser may still be able to archive the page
+                return (None, await pdf_manager.generate_pdf(url, company_name), None)
+            
+            # Partial bodies get a marked digest: they only match the same partial read
+            digest = page_digest(fetched.body, fetched.truncated)
+            if last_page is not None and last_page.digest == digest:
+                pdf_path = last_page.pdf_path
+                if pdf_path is None or Path(pdf_path).exists():
+                    logger.info(f"Unchanged since last screening: {url}")
+                    risk_finding = RiskFinding.from_record(last_page.finding) if last_page.finding else None
+                    return (risk_finding, pdf_path, digest)
+            
+            if fetched.is_pdf:
+                # Documents are their own archive; read them without a browser
+                if fetched.truncated:
+                    logger.warning(f"PDF document exceeds size cap, skipping: {url}")
+                    return (None, None, None)
+                risk_finding = await self.nlp_pool.run(analyze_fetched_pdf, fetched, company_name)
+                return (risk_finding, pdf_manager.save_document(url, company_name, fetched.body), digest)
+            
+            # A body parsed before (another URL, an earlier run) only needs scoring
+            stored = None
+            if self.text_store and not fetched.truncated:
+                stored = await asyncio.to_thread(self.text_store.get, digest)
+            
+            # Parsing and scoring are CPU-bound; keep them off the event loop and the GIL
+            if stored is not None:
+                title, text_content = stored.title, stored.text
+                risk_finding = await self.nlp_pool.run(analyze_page_text, url, title, text_content, company_name)
+            else:
+                title, text_content, risk_finding = await self.nlp_pool.run(
+                    analyze_fetched_page, url, fetched, company_name
+                )
+            
+            # Bodies cut short by an evidence probe are not worth re-scoring later
+            if self.text_store and not fetched.truncated:
+                try:
+                    await asyncio.to_thread(self.text_store.put, url, digest, title, text_content, company_name)
+                except Exception as e:
+                    logger.warning(f"Could not store extracted text for {url}: {e}")
+            
+            captured = None if requires_live_render(fetched, text_content) else fetched
+            pdf_path = await pdf_manager.generate_pdf(url, company_name, fetched=captured)
+            
+            return (risk_finding, pdf_path, digest)
             
         except Exception as e:
             logger.error(f"Analysis and archival failed for {url}: {e}")
@@ -892,6 +2429,7 @@ class EnterpriseVendorDueDiligenceGUI:
         
         self.due_diligence_engine = VendorDueDiligenceEngine()
         self.result_queue = queue.Queue()
+        self.due_diligence_engine.status_callback = self.result_queue.put
         self.is_running = False
         
         self._setup_gui()
@@ -916,12 +2454,16 @@ class EnterpriseVendorDueDiligenceGUI:
         
         ctk.CTkLabel(input_frame, text="Target Company:").pack(side="left", padx=(0, 10)) if GUI_LIB == "customtkinter" else ctk.Label(input_frame, text="Target Company:").pack(side="left", padx=(0, 10))
         
-        self.company_entry = ctk.CTkEntry(input_frame, placeholder_text="Enter company name for analysis", width=400) if GUI_LIB == "customtkinter" else ctk.Entry(input_frame, width=50)
+        self.company_entry = ctk.CTkEntry(input_frame, placeholder_text="Company name, or several separated by ';'", width=400) if GUI_LIB == "customtkinter" else ctk.Entry(input_frame, width=50)
         self.company_entry.pack(side="left", padx=(0, 10))
         
         self.analyze_btn = ctk.CTkButton(input_frame, text="Start Analysis", command=self._start_analysis) if GUI_LIB == "customtkinter" else ctk.Button(input_frame, text="Start Analysis", command=self._start_analysis)
         self.analyze_btn.pack(side="left")
         
+        # Offline: re-scores the pages stored by earlier screenings with the current lexicon
+        self.rescore_btn = ctk.CTkButton(input_frame, text="Re-score Stored Pages", command=self._start_rescore) if GUI_LIB == "customtkinter" else ctk.Button(input_frame, text="Re-score Stored Pages", command=self._start_rescore)
+        self.rescore_btn.pack(side="left", padx=(10, 0))
+        
         # Progress section
         progress_frame = ctk.CTkFrame(self.root) if GUI_LIB == "customtkinter" else ctk.Frame(self.root)
         progress_frame.pack(fill="x", padx=20, pady=10)
@@ -934,7 +2476,7 @@ class EnterpriseVendorDueDiligenceGUI:
             self.progress_bar = ttk.Progressbar(progress_frame, mode="indeterminate")
             self.progress_bar.pack(fill="x", pady=5)
         
-        self.status_label = ctk.CTkLabel(progress_frame, text="Ready for analysis - Stanford Stanza NLP Engine Loaded") if GUI_LIB == "customtkinter" else ctk.Label(progress_frame, text="Ready for analysis - Stanford Stanza NLP Engine Loaded")
+        self.status_label = ctk.CTkLabel(progress_frame, text="Ready for analysis") if GUI_LIB == "customtkinter" else ctk.Label(progress_frame, text="Ready for analysis")
         self.status_label.pack()
         
         # Results section
@@ -957,7 +2499,11 @@ class EnterpriseVendorDueDiligenceGUI:
         self.results_text.pack(fill="both", expand=True)
         self._set_text_state("disabled")
     
-    def _start_analysis(self):
+    def _start_rescore(self):
+        """Re-score stored page texts without searching or fetching"""
+        self._start_analysis(rescore=True)
+    
+    def _start_analysis(self, rescore: bool = False):
         """Start vendor due diligence analysis"""
         if self.is_running:
             return
@@ -967,9 +2513,18 @@ class EnterpriseVendorDueDiligenceGUI:
             self._show_message("Input Required", "Please enter a company name for analysis")
             return
         
+        # Several names separated by ";" are screened together as a portfolio
+        company_names = [name.strip() for name in company_name.split(";") if name.strip()]
+        if len(company_names) > 1:
+            company_name = company_names
+        
         self.is_running = True
         self.analyze_btn.configure(state="disabled")
-        self._update_status("Initializing enterprise due diligence analysis with Stanza NLP...")
+        self.rescore_btn.configure(state="disabled")
+        if rescore:
+            self._update_status("Re-scoring stored pages with the current risk lexicon...")
+        else:
+            self._update_status("Initializing enterprise due diligence analysis with Stanza NLP...")
         self._clear_results()
         
         if GUI_LIB == "customtkinter":
@@ -980,27 +2535,49 @@ class EnterpriseVendorDueDiligenceGUI:
         # Start analysis in background thread
         analysis_thread = threading.Thread(
             target=self._run_analysis_worker,
-            args=(company_name,),
+            args=(company_name, rescore),
             daemon=True
         )
         analysis_thread.start()
     
-    def _run_analysis_worker(self, company_name: str):
+    def _run_analysis_worker(self, company_name, rescore: bool = False):
         """Background worker for analysis"""
         try:
             # Run async analysis in thread
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
             
+            if rescore:
+                names = company_name if isinstance(company_name, list) else [company_name]
+                vendor_profiles = [self.due_diligence_engine.rescore(name) for name in names]
+                generator = self.due_diligence_engine.report_generator
+                if len(vendor_profiles) > 1:
+                    reports = [(profile, generator.generate_comprehensive_report(profile)) for profile in vendor_profiles]
+                    self.result_queue.put(("PORTFOLIO_COMPLETED", reports))
+                else:
+                    report_path = generator.generate_comprehensive_report(vendor_profiles[0])
+                    self.result_queue.put(("COMPLETED", vendor_profiles[0], report_path, None))
+                return
+            
+            if isinstance(company_name, list):
+                vendor_profiles = loop.run_until_complete(
+                    self.due_diligence_engine.conduct_portfolio_due_diligence(company_name)
+                )
+                generator = self.due_diligence_engine.report_generator
+                reports = [(profile, generator.generate_comprehensive_report(profile)) for profile in vendor_profiles]
+                self.result_queue.put(("PORTFOLIO_COMPLETED", reports))
+                return
+            
             vendor_profile = loop.run_until_complete(
                 self.due_diligence_engine.conduct_due_diligence(company_name)
             )
             
-            # Generate report
+            # Generate reports
             report_path = self.due_diligence_engine.report_generator.generate_comprehensive_report(vendor_profile)
+            delta_report_path = self.due_diligence_engine.report_generator.generate_delta_report(vendor_profile)
             
             # Send results to GUI
-            self.result_queue.put(("COMPLETED", vendor_profile, report_path))
+            self.result_queue.put(("COMPLETED", vendor_profile, report_path, delta_report_path))
             
         except Exception as e:
             logger.error(f"Analysis failed: {e}")
@@ -1015,8 +2592,12 @@ class EnterpriseVendorDueDiligenceGUI:
                 item = self.result_queue.get_nowait()
                 
                 if item[0] == "COMPLETED":
-                    _, vendor_profile, report_path = item
-                    self._display_results(vendor_profile, report_path)
+                    _, vendor_profile, report_path, delta_report_path = item
+                    self._display_results(vendor_profile, report_path, delta_report_path)
+                    self._analysis_complete()
+                elif item[0] == "PORTFOLIO_COMPLETED":
+                    _, reports = item
+                    self._display_portfolio_results(reports)
                     self._analysis_complete()
                 elif item[0] == "ERROR":
                     _, error_msg = item
@@ -1037,7 +2618,8 @@ class EnterpriseVendorDueDiligenceGUI:
         
         self.root.after(100, self._start_queue_monitor)
     
-    def _display_results(self, vendor_profile: VendorProfile, report_path: str):
+    def _display_results(self, vendor_profile: VendorProfile, report_path: str,
+                         delta_report_path: Optional[str] = None):
         """Display comprehensive analysis results"""
         self._log_result("=== ENTERPRISE DUE DILIGENCE ANALYSIS COMPLETE ===", "header")
         self._log_result(f"Company: {vendor_profile.company_name}", "info")
@@ -1056,6 +2638,16 @@ class EnterpriseVendorDueDiligenceGUI:
         self._log_result(f"PDF Archives: {len(vendor_profile.pdf_files_generated)}", "info")
         self._log_result("", "info")
         
+        # Changes since the previous screening
+        delta = vendor_profile.delta
+        if delta is not None:
+            self._log_result("CHANGES SINCE LAST SCREENING:", "header")
+            self._log_result(f"New / Changed / Unchanged Sources: {len(delta.new_urls)} / {len(delta.changed_urls)} / "
+                             f"{len(delta.unchanged_urls)}", "info")
+            self._log_result(f"New Risk Findings: {len(delta.new_findings)}", "risk" if delta.new_findings else "clean")
+            self._log_result(f"Resolved Risk Findings: {len(delta.resolved_findings)}", "info")
+            self._log_result("", "info")
+        
         # Risk Findings
         if vendor_profile.risk_findings:
             self._log_result("RISK FINDINGS DETECTED:", "risk")
@@ -1077,13 +2669,36 @@ class EnterpriseVendorDueDiligenceGUI:
         
         self._log_result("", "info")
         self._log_result(f"📄 Comprehensive report saved: {Path(report_path).name}", "info")
+        if delta_report_path:
+            self._log_result(f"📄 Delta report saved: {Path(delta_report_path).name}", "info")
         self._log_result(f"📁 PDF archives available in: {config.pdf_archive_dir}/", "info")
         self._log_result(f"🔬 Powered by Stanford Stanza NLP Framework", "info")
     
+    def _display_portfolio_results(self, reports: List[Tuple[VendorProfile, str]]):
+        """Summarize a portfolio screening, riskiest vendors first"""
+        self._log_result("=== PORTFOLIO SCREENING COMPLETE ===", "header")
+        self._log_result(f"Vendors Screened: {len(reports)}", "info")
+        self._log_result(f"NLP Engine: Stanford Stanza v{stanza.__version__}", "info")
+        self._log_result("", "info")
+        
+        ranked = sorted(reports, key=lambda report: report[0].overall_risk_score, reverse=True)
+        for vendor_profile, report_path in ranked:
+            tag = "risk" if "HIGH" in vendor_profile.risk_level else "clean" if "MINIMAL" in vendor_profile.risk_level else "info"
+            self._log_result(
+                f"{vendor_profile.company_name}: {vendor_profile.risk_level} "
+                f"(score {vendor_profile.overall_risk_score:.2f}, {len(vendor_profile.risk_findings)} findings "
+                f"in {vendor_profile.total_pages_analyzed} pages) - {Path(report_path).name}",
+                tag
+            )
+        
+        self._log_result("", "info")
+        self._log_result(f"📁 Reports saved in: {config.reports_dir}/", "info")
+    
     def _analysis_complete(self):
         """Clean up after analysis completion"""
         self.is_running = False
         self.analyze_btn.configure(state="normal")
+        self.rescore_btn.configure(state="normal")
         self._update_status("Analysis completed successfully with Stanza NLP")
         
         if GUI_LIB == "customtkinter":
@@ -1130,7 +2745,10 @@ class EnterpriseVendorDueDiligenceGUI:
     def run(self):
         """Start the application"""
         logger.info("Starting Enterprise Vendor Due Diligence Platform with Stanza NLP")
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self.due_diligence_engine.close()
 
 # -----------------------------------
 # Application Entry Point
@@ -1146,11 +2764,9 @@ def validate_environment():
     if not config.custom_search_engine_id:
         issues.append("CUSTOM_SEARCH_ENGINE_ID not set in environment")
     
-    # Check if Stanza is properly installed
-    try:
-        stanza.download('en', verbose=False)
-    except Exception as e:
-        issues.append(f"Stanza setup issue: {e}")
+    # Models are fetched lazily by get_pipeline, only for the configured profile's processors
+    if config.nlp_profile not in NLP_PROFILES:
+        issues.append(f"Unknown NLP profile '{config.nlp_profile}' (expected one of {', '.join(NLP_PROFILES)})")
     
     if issues:
         logger.error("Environment validation failed:")
@@ -1165,7 +2781,9 @@ def validate_environment():
         print("   GOOGLE_API_KEY=your_google_api_key_here")
         print("   CUSTOM_SEARCH_ENGINE_ID=your_custom_search_engine_id_here")
         print("2. Install Stanza: pip install stanza")
-        print("3. Download English models: python -c 'import stanza; stanza.download(\"en\")'")
+        processors = NLP_PROFILES.get(config.nlp_profile, NLP_PROFILES["ner"])
+        print(f"3. Optionally pre-download models: python -c 'import stanza; "
+              f"stanza.download(\"en\", processors=\"{processors}\")'")
         print("\nFor setup instructions, see: https://developers.google.com/custom-search/v1/overview")
         print("For Stanza docs, see: https://stanfordnlp.github.io/stanza/")
         print("="*60)
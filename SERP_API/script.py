@@ -5,16 +5,22 @@ import sys
 import threading
 import queue
 import datetime
-import time
 from pathlib import Path
 from urllib.parse import urlparse
-import requests
-from bs4 import BeautifulSoup
+from typing import Optional
 from dotenv import load_dotenv
-from serpapi import GoogleSearch
-from tenacity import retry, stop_after_attempt, wait_fixed
+from tenacity import retry, retry_if_not_exception_type, stop_after_attempt, wait_fixed
 from fpdf import FPDF
 
+# Shared helpers live at the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from vdd_common.fetch import NON_RETRYABLE_ERRORS, EvidenceProbe, cached_get
+from vdd_common.html_text import extract_text
+from vdd_common.http_client import format_pool_stats, session_pool_stats, shared_session
+from vdd_common.query_planner import split_or_terms
+from vdd_common.search_cache import default_search_cache
+from vdd_common.search_providers import FederatedSearch, providers_from_env
+
 # Attempt to import CustomTkinter; fallback to Tkinter
 try:
     import customtkinter as ctk
@@ -39,11 +45,16 @@ RISK_KEYWORDS = (
     "OR guilty OR illegal OR arrest OR evasion OR sentence OR kickback OR prison OR jail "
     "OR corruption OR corrupt)"
 )
+RISK_TERMS = split_or_terms(RISK_KEYWORDS)  # The same lexicon, as terms for the evidence probe
 
 MAX_GOOGLE_PAGES = 3  # 3 pages x 10 results = 30 links
 RESULTS_PER_PAGE = 10
 MAX_THREADS = 10  # Max concurrent scraping threads
-HTTP_TIMEOUT = 15  # Timeout per HTTP request (seconds)
+SEARCH_TIMEOUT = 20  # Per-provider search deadline (seconds)
+HTTP_CONNECT_TIMEOUT = 5  # Timeout for opening a connection (seconds)
+HTTP_READ_TIMEOUT = 15  # Timeout between received bytes (seconds)
+MAX_PAGE_BYTES = 5 * 1024 * 1024  # Cap on downloaded page size (bytes)
+EVIDENCE_MIN_RISK_TERMS = 3  # Risk terms to see, besides the company, before a download may stop early
 QUEUE_POLL_INTERVAL = 100  # GUI queue polling (ms)
 
 # -----------------------------------
@@ -199,33 +210,30 @@ class VendorDueDiligencePDF(FPDF):
 # -----------------------------------
 # Utility Functions
 # -----------------------------------
-@retry(stop=stop_after_attempt(3), wait=wait_fixed(2))
-def fetch_page(url: str) -> str:
+@retry(stop=stop_after_attempt(3), wait=wait_fixed(2), retry=retry_if_not_exception_type(NON_RETRYABLE_ERRORS))
+def fetch_page(url: str, probe: Optional[EvidenceProbe] = None) -> str:
     """Fetch the webpage content with retry and timeout."""
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/91.0.4472.124 Safari/537.36"
-        )
-    }
-    response = requests.get(url, headers=headers, timeout=HTTP_TIMEOUT)
-    response.raise_for_status()
+    # One pooled keep-alive session per process instead of a fresh connection per URL
+    response = cached_get(
+        url, timeout=(HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT), session=shared_session(MAX_THREADS),
+        max_bytes=MAX_PAGE_BYTES, probe=probe
+    )
     return response.text
 
-def google_search(company: str, start: int = 0) -> list[str]:
-    """Perform Google search via SERP API and return list of links."""
-    params = {
-        "engine": "google",
-        "q": f'"{company}" {RISK_KEYWORDS}',
-        "api_key": SERP_API_KEY,
-        "start": start,
-        "num": RESULTS_PER_PAGE,
-    }
-    search = GoogleSearch(params)
-    result = search.get_dict()
-    organic_results = result.get("organic_results", [])
-    return [item.get("link") for item in organic_results if item.get("link")]
+_search: Optional[FederatedSearch] = None
+
+def get_search() -> FederatedSearch:
+    # SerpApi plus any other provider configured in .env (e.g. Google CSE), queried together
+    global _search
+    if _search is None:
+        providers = providers_from_env(default_search_cache(), max_workers=MAX_GOOGLE_PAGES)
+        _search = FederatedSearch(providers, default_timeout=SEARCH_TIMEOUT)
+    return _search
+
+def google_search(company: str) -> list[str]:
+    """Search every configured provider concurrently and return merged links."""
+    results = get_search().search(f'"{company}" {RISK_KEYWORDS}', MAX_GOOGLE_PAGES, RESULTS_PER_PAGE)
+    return [result.url for result in results]
 
 # -----------------------------------
 # GUI Application Class
@@ -377,16 +385,8 @@ class VendorDueDiligenceApp:
             self.pdf_generator.cell(0, 8, f'Risk Keywords: Financial crimes, legal issues, regulatory violations', 0, 1, 'L')
             self.pdf_generator.ln(5)
 
-            # Collect Google links
-            all_links: list[str] = []
-            for page in range(MAX_GOOGLE_PAGES):
-                start_index = page * RESULTS_PER_PAGE
-                new_links = google_search(company, start=start_index)
-                all_links.extend(new_links)
-                time.sleep(1)  # Respect rate limits
-
-            # Remove duplicates
-            all_links = list(dict.fromkeys(all_links))
+            # Collect links from every configured search provider (merged, deduplicated)
+            all_links = google_search(company)
             total_links = len(all_links)
             self.result_queue.put(f"🔍 Collected {total_links} unique links from Google.")
 
@@ -402,10 +402,11 @@ class VendorDueDiligenceApp:
             def analyze(url: str):
                 nonlocal progress_count
                 try:
-                    html = fetch_page(url)
-                    soup = BeautifulSoup(html, "html.parser")
-                    title = soup.title.string.strip() if soup.title else urlparse(url).netloc
-                    text_content = soup.get_text(" ", strip=True).lower()
+                    # Stop reading once the company and enough risk terms have shown up
+                    html = fetch_page(url, probe=EvidenceProbe([company], RISK_TERMS, EVIDENCE_MIN_RISK_TERMS))
+                    title, text_content = extract_text(html)
+                    title = title or urlparse(url).netloc
+                    text_content = text_content.lower()
 
                     if company.lower() in text_content:
                         with lock:
@@ -440,6 +441,7 @@ class VendorDueDiligenceApp:
             # Join any remaining threads
             for t in threads:
                 t.join()
+            self.result_queue.put(f"🔌 HTTP POOL: {format_pool_stats(session_pool_stats(shared_session()))}")
 
             # Add summary section to PDF
             self.pdf_generator.add_summary_section()
@@ -0,0 +1 @@
+# Lets pytest import vdd_common from the repository root
@@ -0,0 +1,109 @@
+"""Stand-ins for requests responses and sessions, and for search backends"""
+
+import threading
+import time
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, headers=None, body=b"", url=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.body = body
+        self.url = url
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.body), chunk_size):
+            yield self.body[start:start + chunk_size]
+
+
+class FakeSession:
+    """Returns queued responses and records the headers of each request"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, headers=None, timeout=None, stream=False):
+        self.requests.append(dict(headers or {}))
+        response = self.responses.pop(0)
+        response.url = response.url or url
+        return response
+
+
+class FakeSerpApiSearch:
+    """Stand-in for serpapi.GoogleSearch; pages maps a 0-based start to organic results or an exception"""
+
+    pages = {}
+
+    def __init__(self, params):
+        self.params = params
+
+    def get_dict(self):
+        page = self.pages.get(self.params["start"], [])
+        if isinstance(page, Exception):
+            raise page
+        return {"organic_results": page}
+
+
+class FakeProvider:
+    """Search provider returning fixed items, failing, or sleeping past its deadline"""
+
+    def __init__(self, name, links=(), error=None, delay=0.0):
+        self.name = name
+        self.links = list(links)
+        self.error = error
+        self.delay = delay
+
+    def search(self, query, pages, results_per_page):
+        if self.delay:
+            time.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return [{"link": link, "title": "", "snippet": "", "providers": [self.name]} for link in self.links]
+
+
+class FakeCSEService:
+    """Stand-in for the customsearch service; pages maps a 1-based start to items or an exception"""
+
+    def __init__(self, pages, delay=0.0):
+        self.pages = pages
+        self.delay = delay
+        self.requests = []
+        self.in_flight = self.peak = 0
+        self._lock = threading.Lock()
+
+    def cse(self):
+        return self
+
+    def list(self, q, cx, start, num):
+        self.requests.append((q, cx, start, num))
+        return _FakeCSERequest(self, start)
+
+
+class _FakeCSERequest:
+    def __init__(self, service, start):
+        self.service = service
+        self.start = start
+
+    def execute(self, http=None, num_retries=0):
+        service = self.service
+        with service._lock:
+            service.in_flight += 1
+            service.peak = max(service.peak, service.in_flight)
+        time.sleep(service.delay)
+        with service._lock:
+            service.in_flight -= 1
+        page = service.pages.get(self.start, [])
+        if isinstance(page, Exception):
+            raise page
+        return {"items": page}
@@ -0,0 +1,35 @@
+"""Loads Google_CSE/main.py for tests, skipping when its runtime dependencies are missing"""
+
+import importlib.util
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+MAIN_PATH = Path(__file__).resolve().parent.parent / "Google_CSE" / "main.py"
+
+# Imported at module level by main.py (directly or through vdd_common.cse_client)
+RUNTIME_DEPENDENCIES = ("stanza", "playwright.async_api", "aiofiles", "googleapiclient.discovery", "httplib2")
+
+
+def load_main():
+    """The main module, imported once; its log directory goes to a scratch folder"""
+    for module in RUNTIME_DEPENDENCIES:
+        pytest.importorskip(module)
+
+    if "vdd_main" not in sys.modules:
+        spec = importlib.util.spec_from_file_location("vdd_main", MAIN_PATH)
+        module = importlib.util.module_from_spec(spec)
+        cwd = os.getcwd()
+        os.chdir(tempfile.mkdtemp(prefix="vdd_main_"))
+        try:
+            sys.modules["vdd_main"] = module
+            spec.loader.exec_module(module)
+        except BaseException:
+            sys.modules.pop("vdd_main", None)
+            raise
+        finally:
+            os.chdir(cwd)
+    return sys.modules["vdd_main"]
@@ -0,0 +1,73 @@
+import pytest
+
+pytest.importorskip("googleapiclient.discovery")
+pytest.importorskip("httplib2")
+
+from vdd_common import cse_client  # noqa: E402
+from vdd_common.cse_client import CSEClient  # noqa: E402
+from vdd_common.ratelimit import TokenBucket  # noqa: E402
+
+from tests.fakes import FakeCSEService  # noqa: E402
+
+
+class CountingBucket(TokenBucket):
+    def __init__(self):
+        super().__init__(rate=1000, capacity=1000)
+        self.acquired = 0
+
+    def acquire(self, tokens=1):
+        self.acquired += tokens
+        super().acquire(tokens)
+
+
+def client(monkeypatch, pages, delay=0.0, **kwargs):
+    service = FakeCSEService(pages, delay)
+    monkeypatch.setattr(cse_client, "build", lambda *args, **kwargs: service)
+    return CSEClient("key", "engine", **kwargs), service
+
+
+def items(*links):
+    return [{"link": link} for link in links]
+
+
+def test_pages_are_fetched_concurrently_and_returned_in_order(monkeypatch):
+    bucket = CountingBucket()
+    cse, service = client(monkeypatch, {
+        1: items("https://a.example/1"),
+        11: items("https://a.example/2"),
+        21: items("https://a.example/3"),
+    }, delay=0.05, bucket=bucket, max_workers=3)
+
+    pages = cse.fetch_pages("acme fraud", 3)
+    assert pages == [items("https://a.example/1"), items("https://a.example/2"), items("https://a.example/3")]
+    assert service.peak == 3
+    assert bucket.acquired == 3
+    assert sorted(request[2] for request in service.requests) == [1, 11, 21]
+    assert {request[:2] for request in service.requests} == {("acme fraud", "engine")}
+
+
+def test_a_failed_page_is_empty(monkeypatch):
+    cse, _ = client(monkeypatch, {1: items("https://a.example/1"), 11: RuntimeError("503")})
+    assert cse.fetch_pages("acme", 2) == [items("https://a.example/1"), []]
+
+
+def test_every_page_failing_raises(monkeypatch):
+    cse, _ = client(monkeypatch, {1: RuntimeError("quota"), 11: RuntimeError("quota")})
+    with pytest.raises(RuntimeError, match="quota"):
+        cse.fetch_pages("acme", 2)
+
+
+def test_search_merges_pages_and_drops_url_variants(monkeypatch):
+    cse, _ = client(monkeypatch, {
+        1: items("https://a.example/1", "https://a.example/2"),
+        11: items("https://www.a.example/1/", "https://a.example/3") + [{"title": "no link"}],
+    })
+    assert [item["link"] for item in cse.search("acme", 2)] == [
+        "https://a.example/1", "https://a.example/2", "https://a.example/3",
+    ]
+
+
+def test_missing_credentials_are_rejected(monkeypatch):
+    monkeypatch.setattr(cse_client, "build", lambda *args, **kwargs: FakeCSEService({}))
+    with pytest.raises(ValueError):
+        CSEClient("", "engine")
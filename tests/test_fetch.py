@@ -0,0 +1,79 @@
+import pytest
+
+from vdd_common.fetch import (
+    EvidenceProbe, ResponseTooLarge, StreamingBody, UnsupportedContentType, cached_get,
+)
+from vdd_common.host_health import FailureRegistry
+from vdd_common.http_cache import HTTPResponseCache
+from vdd_common.query_planner import split_or_terms
+
+from tests.fakes import FakeResponse, FakeSession
+
+PAGE = b"<p>Acme Corp was accused of fraud and bribery by the court.</p>" + b"<p>filler</p>" * 50
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return HTTPResponseCache(tmp_path / "http", domain_ttls={})
+
+
+def probe():
+    return EvidenceProbe(["Acme Corp"], ["fraud", "bribery", "court", "launder"], 3)
+
+
+def test_probe_needs_the_name_and_enough_risk_terms():
+    name_only = EvidenceProbe(["Acme"], ["fraud"], 1)
+    assert not name_only.feed("acme annual report")
+    assert name_only.feed("... fraud")
+
+
+def test_probe_finds_terms_split_across_chunks():
+    split = EvidenceProbe(["Acme Corp"], ["fraud"], 1)
+    assert not split.feed("acme co")
+    assert split.feed("rp fraud")
+
+
+def test_probe_stop_on_the_last_chunk_keeps_a_complete_cacheable_body(cache):
+    url = "https://example.com/short"
+    session = FakeSession(FakeResponse(200, {"Content-Type": "text/html"}, PAGE))
+    entry = cached_get(url, cache=cache, session=session, registry=FailureRegistry(), probe=probe())
+    assert not entry.truncated
+    assert entry.body == PAGE
+    assert cache.get(url) is not None
+
+
+def test_probe_stop_with_unread_bytes_marks_the_body_truncated(cache):
+    url = "https://example.com/long"
+    body = PAGE + b"x" * (256 * 1024)
+    session = FakeSession(FakeResponse(200, {"Content-Type": "text/html"}, body))
+    entry = cached_get(url, cache=cache, session=session, registry=FailureRegistry(), probe=probe())
+    assert entry.truncated
+    assert len(entry.body) < len(body)
+    assert cache.get(url) is None
+
+
+def test_cached_pdf_is_refused_by_an_html_caller(cache):
+    url = "https://example.com/report.pdf"
+    cache.put(url, url, 200, {"Content-Type": "application/pdf"}, b"%PDF-1.7")
+    session = FakeSession()
+    with pytest.raises(UnsupportedContentType):
+        cached_get(url, cache=cache, session=session, registry=FailureRegistry())
+    assert session.requests == []
+
+
+def test_cached_body_over_the_callers_cap_is_refused(cache):
+    url = "https://example.com/big"
+    cache.put(url, url, 200, {"Content-Type": "text/html"}, PAGE)
+    with pytest.raises(ResponseTooLarge):
+        cached_get(url, cache=cache, session=FakeSession(), registry=FailureRegistry(), max_bytes=100)
+    assert cached_get(url, cache=cache, session=FakeSession(), registry=FailureRegistry()).body == PAGE
+
+
+def test_body_exactly_at_the_cap_is_complete():
+    streamed = StreamingBody(10)
+    assert not streamed.add(b"0123456789")
+    assert not streamed.truncated
+
+
+def test_split_or_terms_reads_phrases_and_skips_operators():
+    assert split_or_terms('& (crime OR "grease payment" OR OFAC)') == ["crime", "grease payment", "OFAC"]
@@ -0,0 +1,110 @@
+import pytest
+
+from vdd_common import host_health
+from vdd_common.fetch import UnsupportedContentType, cached_get
+from vdd_common.host_health import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, FailureRegistry, HostUnavailable
+from vdd_common.http_cache import HTTPResponseCache
+
+from tests.fakes import FakeResponse, FakeSession
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(host_health.time, "time", clock.time)
+    return clock
+
+
+@pytest.fixture
+def registry(tmp_path, clock):
+    return FailureRegistry(tmp_path / "health.sqlite3", failure_threshold=3, reset_timeout=60)
+
+
+def test_breaker_cycles_closed_open_half_open_closed(clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    assert breaker.state == CLOSED and breaker.allow()
+
+    breaker.record_failure("a")
+    assert breaker.state == CLOSED
+    breaker.record_failure("b")
+    assert breaker.state == OPEN and not breaker.allow()
+
+    clock.now += 60
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow()
+    # Only one trial request at a time
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == CLOSED and breaker.allow() and breaker.allow()
+
+
+def test_failed_trial_reopens_and_releases_the_slot(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    breaker.record_failure("a")
+    clock.now += 60
+    assert breaker.allow()
+
+    breaker.record_failure("a")
+    assert breaker.state == OPEN
+    clock.now += 60
+    assert breaker.allow()
+
+
+def test_repeated_failures_of_one_url_do_not_trip_the_host(registry):
+    for _ in range(5):
+        registry.record_failure("https://example.com/flaky", TimeoutError("timed out"))
+    registry.check("https://example.com/other")
+
+    registry.record_failure("https://example.com/b", TimeoutError("timed out"))
+    registry.record_failure("https://example.com/c", TimeoutError("timed out"))
+    with pytest.raises(HostUnavailable):
+        registry.check("https://example.com/other")
+
+
+def test_rejected_payload_releases_the_half_open_trial(registry, clock, tmp_path):
+    for path in ("a", "b", "c"):
+        registry.record_failure(f"https://example.com/{path}", TimeoutError("timed out"))
+    clock.now += 60
+
+    session = FakeSession(FakeResponse(200, {"Content-Type": "image/png"}, b"\x89PNG"))
+    with pytest.raises(UnsupportedContentType):
+        cached_get("https://example.com/logo.png", cache=HTTPResponseCache(tmp_path / "http"),
+                   session=session, registry=registry)
+
+    assert registry.snapshot()["example.com"][0] == CLOSED
+    registry.check("https://example.com/next")
+
+
+class Forbidden(Exception):
+    status = 403
+
+
+def test_permanent_host_failures_are_remembered(registry):
+    error = Exception("SSLCertVerificationError: CERTIFICATE_VERIFY_FAILED")
+    assert registry.record_failure("https://badcert.example/a", error) == "host"
+    with pytest.raises(HostUnavailable):
+        registry.check("https://badcert.example/b")
+
+
+def test_one_forbidden_page_does_not_block_its_host(registry):
+    assert registry.record_failure("https://news.example/paywalled", Forbidden("403")) == "url"
+    with pytest.raises(HostUnavailable):
+        registry.check("https://news.example/paywalled")
+    registry.check("https://news.example/other-story")
+    assert registry.snapshot()["news.example"][0] == CLOSED
+
+
+def test_forbidden_pages_across_a_host_trip_its_breaker(registry):
+    for n in range(3):
+        registry.record_failure(f"https://blocked.example/{n}", Forbidden("403"))
+    with pytest.raises(HostUnavailable):
+        registry.check("https://blocked.example/next")
@@ -0,0 +1,36 @@
+import pytest
+
+from vdd_common.html_text import BACKENDS, available_backends, extract_text
+
+DOCUMENTS = {
+    "tails": "<html><head><title>Acme</title></head><body>"
+             "<p>tail<script>track()</script>after <!-- note -->more<b>bold</b>end</p></body></html>",
+    "boilerplate": "<html><head><title> Acme Corp fined </title><style>p {}</style></head><body>"
+                   "<header>Site</header><nav><a href='/'>Home</a></nav>"
+                   "<div><h1>Acme Corp fined</h1><p>The regulator fined <em>Acme Corp</em>"
+                   " for fraud.</p><p>Second&nbsp;paragraph &amp; more.</p></div>"
+                   "<footer>Contact</footer>trailing</body></html>",
+    "nested": "<div><ul><li>one</li><li>two<span>three</span>four</li></ul>five</div>",
+    "whitespace": "<p>  spaced \n\n text  </p>\n\n<p>\tnext</p>",
+    "no_title": "<body><p>Only a body</p></body>",
+}
+
+
+@pytest.mark.parametrize("name", sorted(DOCUMENTS))
+def test_backends_agree(name):
+    html = DOCUMENTS[name]
+    results = {backend: extract_text(html, backend) for backend in available_backends()}
+    expected = results["bs4"] if "bs4" in results else results["stream"]
+    assert results == {backend: expected for backend in results}
+
+
+def test_tail_after_removed_element_stays_a_separate_word():
+    for backend in available_backends():
+        _, text = extract_text(DOCUMENTS["tails"], backend)
+        assert "tail after" in text and "track" not in text and "note" not in text, backend
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        extract_text("<p>x</p>", "nope")
+    assert set(available_backends()) <= set(BACKENDS)
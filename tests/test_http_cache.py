@@ -0,0 +1,81 @@
+import time
+
+import pytest
+
+from vdd_common.fetch import cached_get
+from vdd_common.host_health import FailureRegistry
+from vdd_common.http_cache import HTTPResponseCache, canonical_cache_key
+
+from tests.fakes import FakeResponse, FakeSession
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return HTTPResponseCache(tmp_path / "http", domain_ttls={})
+
+
+def expire(cache, url):
+    cache._conn.execute("UPDATE entries SET expires_at = ? WHERE key = ?",
+                        (time.time() - 1, canonical_cache_key(url)))
+    cache._conn.commit()
+
+
+def test_canonical_key_ignores_tracking_and_parameter_order():
+    assert canonical_cache_key("https://Example.com/a?b=2&a=1&utm_source=x#top") == \
+        canonical_cache_key("https://example.com/a?a=1&b=2")
+
+
+def test_fresh_entry_is_served_without_a_request(cache):
+    url = "https://example.com/page"
+    cache.put(url, url, 200, {"Content-Type": "text/html"}, b"<p>cached</p>")
+    session = FakeSession()
+    entry = cached_get(url, cache=cache, session=session, registry=FailureRegistry())
+    assert entry.body == b"<p>cached</p>"
+    assert session.requests == []
+
+
+def test_stale_entry_is_revalidated_with_validators(cache):
+    url = "https://example.com/page"
+    cache.put(url, url, 200, {"Content-Type": "text/html", "ETag": '"v1"',
+                              "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}, b"<p>old</p>")
+    expire(cache, url)
+
+    session = FakeSession(FakeResponse(304, {"ETag": '"v2"'}))
+    entry = cached_get(url, cache=cache, session=session, registry=FailureRegistry())
+
+    assert session.requests[0]["If-None-Match"] == '"v1"'
+    assert session.requests[0]["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+    assert entry.body == b"<p>old</p>"
+    assert entry.fresh
+    stored = cache.get(url)
+    assert stored.fresh and stored.headers["etag"] == '"v2"'
+
+
+def test_changed_page_replaces_the_stale_entry(cache):
+    url = "https://example.com/page"
+    cache.put(url, url, 200, {"Content-Type": "text/html", "ETag": '"v1"'}, b"<p>old</p>")
+    expire(cache, url)
+
+    session = FakeSession(FakeResponse(200, {"Content-Type": "text/html", "ETag": '"v2"'}, b"<p>new</p>"))
+    entry = cached_get(url, cache=cache, session=session, registry=FailureRegistry())
+
+    assert entry.body == b"<p>new</p>"
+    assert cache.get(url).body == b"<p>new</p>"
+
+
+def test_truncated_bodies_are_not_cached(cache):
+    url = "https://example.com/big"
+    session = FakeSession(FakeResponse(200, {"Content-Type": "text/html"}, b"x" * 1000))
+    entry = cached_get(url, cache=cache, session=session, registry=FailureRegistry(), max_bytes=100)
+    assert entry.truncated and len(entry.body) == 100
+    assert cache.get(url) is None
+
+
+def test_eviction_keeps_the_store_within_budget(tmp_path):
+    cache = HTTPResponseCache(tmp_path / "http", max_bytes=250, domain_ttls={})
+    for index in range(5):
+        url = f"https://example.com/{index}"
+        cache.put(url, url, 200, {}, bytes([index]) * 100)
+    assert cache.stats()["bytes"] <= 250
+    assert cache.get("https://example.com/4") is not None
+    assert cache.get("https://example.com/0") is None
@@ -0,0 +1,126 @@
+import asyncio
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from vdd_common import http_client
+from vdd_common.http_client import (
+    AsyncPoolStats, DNSCache, build_async_session, build_session, format_pool_stats,
+    install_dns_cache, session_pool_stats, shared_session,
+)
+
+
+class CountingResolver:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, host, port, *args):
+        self.calls.append((host, port))
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.1", port))]
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def fresh_globals(monkeypatch):
+    # install_dns_cache patches socket.getaddrinfo for the whole process; undo it after the test
+    monkeypatch.setattr(socket, "getaddrinfo", socket.getaddrinfo)
+    monkeypatch.setattr(http_client, "_dns_cache", None)
+    monkeypatch.setattr(http_client, "_shared_session", None)
+
+
+def test_dns_cache_hits_within_ttl_and_expires(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(http_client.time, "monotonic", lambda: clock[0])
+    cache = DNSCache(ttl=10)
+    cache._resolve = resolver = CountingResolver()
+
+    first = cache.getaddrinfo("a.example", 443)
+    assert cache.getaddrinfo("a.example", 443) == first
+    cache.getaddrinfo("a.example", 80)
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    clock[0] += 11
+    cache.getaddrinfo("a.example", 443)
+    assert resolver.calls == [("a.example", 443), ("a.example", 80), ("a.example", 443)]
+
+
+def test_build_session_sizes_the_pool_and_sets_headers():
+    session = build_session(pool_size=16, user_agent="vdd-test")
+    adapter = session.get_adapter("https://a.example/")
+    assert session.get_adapter("http://a.example/") is adapter
+    assert adapter._pool_connections == 16
+    assert adapter._pool_maxsize == 16
+    assert adapter.max_retries.total == 0
+    assert session.headers["User-Agent"] == "vdd-test"
+    assert session.headers["Accept-Encoding"] == http_client.ACCEPT_ENCODING
+    assert session.headers["Connection"] == "keep-alive"
+
+
+def test_shared_session_is_a_singleton_with_the_dns_cache_installed(fresh_globals):
+    session = shared_session(pool_size=4)
+    assert shared_session(pool_size=32) is session
+    cache = install_dns_cache()
+    assert install_dns_cache() is cache
+    assert socket.getaddrinfo == cache.getaddrinfo
+
+
+def test_pooled_session_reuses_connections(server, fresh_globals):
+    install_dns_cache()
+    session = build_session(pool_size=2)
+    for _ in range(5):
+        assert session.get(server, timeout=5).text == "ok"
+
+    stats = session_pool_stats(session)
+    assert (stats["connections"], stats["requests"], stats["hosts"]) == (1, 5, 1)
+    assert stats["reuse_rate"] == pytest.approx(0.8)
+    assert "dns_hits" in stats
+    assert format_pool_stats(stats) == "5 requests over 1 connections (80% reused)"
+
+
+def test_reuse_stats_without_requests():
+    assert http_client._reuse_stats(0, 0)["reuse_rate"] == 0.0
+    assert http_client._reuse_stats(3, 2)["reuse_rate"] == 0.0
+
+
+def test_async_session_limits_timeouts_and_reuse(server):
+    async def run():
+        stats = AsyncPoolStats()
+        session = build_async_session(pool_size=8, per_host_limit=2, connect_timeout=1,
+                                      read_timeout=2, total_timeout=3, user_agent="vdd-test", stats=stats)
+        async with session:
+            assert session.connector.limit == 8
+            assert session.connector.limit_per_host == 2
+            assert (session.timeout.connect, session.timeout.sock_read, session.timeout.total) == (1, 2, 3)
+            assert session.headers["User-Agent"] == "vdd-test"
+            for _ in range(3):
+                async with session.get(server) as response:
+                    assert await response.text() == "ok"
+        return stats.snapshot()
+
+    snapshot = asyncio.run(run())
+    assert (snapshot["connections"], snapshot["requests"]) == (1, 3)
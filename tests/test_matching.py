@@ -0,0 +1,75 @@
+import random
+import re
+
+import pytest
+
+from vdd_common.matching import CompanyMatcher, KeywordAutomaton, PortfolioMatcher, merge_mention_windows
+
+WORDS = ["acme", "acme corp", "corp", "fine", "fined", "defined", "sec", "second", "fraud", "the", "a",
+         "acme.", "acme inc", "inc", "bribe"]
+
+
+def random_text(rng, words=200):
+    pieces = []
+    for _ in range(words):
+        word = rng.choice(WORDS)
+        pieces.append(word.upper() if rng.random() < 0.2 else word)
+        pieces.append(rng.choice([" ", " ", ", ", ". ", "-", "_"]))
+    return "".join(pieces)
+
+
+def brute_force(text, patterns, whole_word):
+    """Every boundary-respecting occurrence, found one pattern at a time"""
+    found = []
+    for pattern in patterns:
+        tail = r"(?!\w)" if pattern in whole_word else ""
+        for match in re.finditer(r"(?<!\w)(?=" + re.escape(pattern) + tail + ")", text, re.IGNORECASE):
+            found.append((match.start(), match.start() + len(pattern), pattern))
+    return sorted(found)
+
+
+def test_automaton_matches_brute_force():
+    rng = random.Random(7)
+    patterns = ["fine", "fraud", "sec", "acme corp", "acme", "bribe"]
+    automaton = KeywordAutomaton({pattern: pattern for pattern in patterns}, whole_word=("sec",))
+    for _ in range(50):
+        text = random_text(rng)
+        matches = sorted((start, end, key) for start, end, key, _ in automaton.find_all(text))
+        assert matches == brute_force(text, patterns, {"sec"})
+
+
+def test_automaton_respects_word_starts_and_allows_suffixes():
+    automaton = KeywordAutomaton({"fine": 1, "sec": 2}, whole_word=("sec",))
+    keys = [key for _, _, key, _ in automaton.find_all("Defined, FINED, fine; second SEC")]
+    assert keys == ["fine", "fine", "sec"]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_portfolio_matcher_finds_what_company_matchers_find(seed):
+    rng = random.Random(seed)
+    variations = {
+        "Acme Corp": ["Acme Corp", "Acme", "Acme."],
+        "Acme Inc": ["Acme Inc", "Acme"],
+        "Second Fine": ["second fine"],
+    }
+    portfolio = PortfolioMatcher(variations)
+    text = random_text(rng)
+    found = portfolio.find(text)
+    for vendor, names in variations.items():
+        assert found.get(vendor, []) == CompanyMatcher(names).find(text)
+
+
+def test_company_matcher_prefers_the_longest_variation():
+    matcher = CompanyMatcher(["Acme", "Acme Corp"])
+    assert matcher.find("ACME CORP and acme, not acmes") == [(0, 9), (14, 18)]
+
+
+def test_mention_windows_merge_only_when_they_overlap():
+    spans = merge_mention_windows(1000, [(100, 104), (150, 154), (600, 604)], window=50)
+    assert [(span.start, span.end) for span in spans] == [(50, 204), (550, 654)]
+    assert spans[0].mentions == ((100, 104), (150, 154))
+
+
+def test_mention_windows_are_clipped_to_the_text():
+    spans = merge_mention_windows(20, [(2, 6)], window=50)
+    assert (spans[0].start, spans[0].end) == (0, 20)
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from tests.main_module import load_main
+
+main = load_main()
+
+
+def brute_force(mentions, positions, term_ids, term_count):
+    expected = np.full((len(mentions), term_count), np.inf)
+    for row, mention in enumerate(mentions):
+        for position, term in zip(positions, term_ids):
+            expected[row, term] = min(expected[row, term], abs(int(position) - int(mention)))
+    return expected
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_matches_brute_force_on_random_pages(seed):
+    rng = np.random.default_rng(seed)
+    term_count = int(rng.integers(1, 8))
+    occurrences = int(rng.integers(1, 40))
+    page_length = int(rng.integers(10, 5000))
+    mentions = rng.integers(0, page_length, size=int(rng.integers(1, 12)))
+    positions = rng.integers(0, page_length, size=occurrences)
+    # Leave the last term out now and then so absent terms are covered too
+    term_ids = rng.integers(0, max(term_count - int(rng.integers(0, 2)), 1), size=occurrences)
+
+    actual = main.nearest_distances(mentions, positions, term_ids, term_count)
+    np.testing.assert_array_equal(actual, brute_force(mentions, positions, term_ids, term_count))
+
+
+def test_mention_beyond_every_term_and_repeated_positions():
+    mentions = np.array([0, 50, 500])
+    positions = np.array([10, 10, 40, 30])
+    term_ids = np.array([1, 1, 1, 0])
+    np.testing.assert_array_equal(
+        main.nearest_distances(mentions, positions, term_ids, 3),
+        [[30, 10, np.inf], [20, 10, np.inf], [470, 460, np.inf]],
+    )
+
+
+def test_no_occurrences_or_no_mentions():
+    empty = np.array([], dtype=np.int64)
+    assert np.isinf(main.nearest_distances(np.array([5]), empty, empty, 2)).all()
+    assert main.nearest_distances(empty, np.array([1]), np.array([0]), 2).shape == (0, 2)
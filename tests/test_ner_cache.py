@@ -0,0 +1,38 @@
+from vdd_common.ner_cache import NERCache, context_key
+
+
+def test_key_ignores_whitespace_but_not_case_or_model():
+    assert context_key("Acme  Ltd\nfined", "m1") == context_key(" Acme Ltd fined ", "m1")
+    assert context_key("Acme Ltd fined", "m1") != context_key("acme ltd fined", "m1")
+    assert context_key("Acme Ltd fined", "m1") != context_key("Acme Ltd fined", "m2")
+
+
+def test_memory_then_disk_hits(tmp_path):
+    cache = NERCache(tmp_path / "ner.sqlite3", memory_entries=1)
+    assert cache.get("Acme Ltd was fined", "m1") is None
+
+    cache.put("Acme Ltd was fined", "m1", ["Acme Ltd"])
+    cache.put("Beta Corp was sued", "m1", ["Beta Corp"])
+    assert cache.get("Beta Corp was sued", "m1") == ["Beta Corp"]
+    # Pushed out of the one-entry memory tier, still on disk
+    assert cache.get("Acme Ltd was fined", "m1") == ["Acme Ltd"]
+    assert cache.get("Acme Ltd was fined", "m2") is None
+
+    stats = cache.stats()
+    assert (stats["memory_hits"], stats["disk_hits"], stats["misses"]) == (1, 1, 2)
+
+
+def test_entries_survive_a_new_instance(tmp_path):
+    NERCache(tmp_path / "ner.sqlite3").put("Acme Ltd was fined", "m1", ["Acme Ltd"])
+    assert NERCache(tmp_path / "ner.sqlite3").get("Acme Ltd was fined", "m1") == ["Acme Ltd"]
+
+
+def test_store_is_evicted_least_recently_used_first(tmp_path):
+    cache = NERCache(tmp_path / "ner.sqlite3", memory_entries=0, max_bytes=1000)
+    contexts = [f"context number {n} about Acme Ltd" for n in range(30)]
+    for context in contexts:
+        cache.put(context, "m1", ["Acme Ltd"] * 3)
+
+    assert cache.stats()["bytes"] <= 1000
+    assert cache.get(contexts[-1], "m1") == ["Acme Ltd"] * 3
+    assert cache.get(contexts[0], "m1") is None
@@ -0,0 +1,67 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tests.main_module import load_main
+
+main = load_main()
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    """Thread-backed stand-in for the spawned process pool"""
+
+    started = []
+
+    def __init__(self, max_workers, mp_context=None, initializer=None, initargs=()):
+        super().__init__(max_workers=max_workers)
+        self.initargs = initargs
+        self.snapshot = repr(initargs[0])
+        self.shut_down = False
+        self.started.append(self)
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shut_down = True
+        super().shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+@pytest.fixture
+def executors(monkeypatch):
+    monkeypatch.setattr(RecordingExecutor, "started", [])
+    monkeypatch.setattr(main, "ProcessPoolExecutor", RecordingExecutor)
+    return RecordingExecutor.started
+
+
+def run(pool):
+    return asyncio.run(pool.run(len, "abc"))
+
+
+def test_workers_persist_across_runs_while_the_config_is_unchanged(executors):
+    pool = main.NLPWorkerPool(workers=2)
+    assert run(pool) == 3
+    assert run(pool) == 3
+    assert len(executors) == 1
+    assert executors[0].initargs == (main.config,)
+    pool.close()
+    assert executors[0].shut_down
+
+
+def test_changed_config_restarts_the_workers(executors, monkeypatch):
+    pool = main.NLPWorkerPool(workers=2)
+    run(pool)
+
+    monkeypatch.setattr(main.config, "risk_keywords", main.config.risk_keywords + ["sanctions evasion"])
+    assert run(pool) == 3
+
+    old, new = executors
+    assert old.shut_down and not new.shut_down
+    assert "sanctions evasion" not in old.snapshot
+    assert "sanctions evasion" in new.snapshot
+    pool.close()
+
+
+def test_in_process_pool_never_spawns_workers(executors):
+    pool = main.NLPWorkerPool(workers=0)
+    assert pool.mode == "in-process"
+    assert run(pool) == 3
+    assert executors == []
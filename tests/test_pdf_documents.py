@@ -0,0 +1,127 @@
+import asyncio
+
+import pytest
+
+from tests.main_module import load_main
+
+main = load_main()
+
+RISK_TEXT = "Acme Corp was convicted of fraud and bribery and money laundering"
+
+
+def make_pdf(pages, title=None):
+    """Minimal PDF with one Helvetica text line per page"""
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>"]
+    font = 3 + 2 * len(pages)
+    kids = " ".join(f"{3 + 2 * n} 0 R" for n in range(len(pages)))
+    objects.append(f"<< /Type /Pages /Kids [{kids}] /Count {len(pages)} >>")
+    for n, text in enumerate(pages):
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET"
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents {4 + 2 * n} 0 R "
+                       f"/Resources << /Font << /F1 {font} 0 R >> >> >>")
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+    objects.append("<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    if title:
+        objects.append(f"<< /Title ({title}) >>")
+
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    info = f" /Info {len(objects)} 0 R" if title else ""
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R{info} >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return out
+
+
+def fetched_pdf(body, url="https://regulator.example/orders/acme.pdf", content_type="application/pdf", **kwargs):
+    return main.FetchedPage(url, url, 200, {"content-type": content_type}, body, **kwargs)
+
+
+class FakeFetcher:
+    def __init__(self, fetched):
+        self.fetched = fetched
+
+    async def fetch(self, url, probe=None):
+        return self.fetched
+
+
+class RecordingArchive(main.PDFArchiveManager):
+    """Archive manager without a browser that records any attempt to render"""
+
+    def __init__(self, output_dir):
+        super().__init__(output_dir)
+        self.rendered = []
+
+    async def generate_pdf(self, url, company_name, fetched=None):
+        self.rendered.append(url)
+        return None
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(main.config, "nlp_workers", 0)
+    monkeypatch.setattr(main.config, "text_store_enabled", False)
+    monkeypatch.setattr(main.config, "incremental_rescreening", False)
+    engine = main.VendorDueDiligenceEngine()
+    yield engine
+    engine.close()
+
+
+def test_pdf_is_recognized_by_type_or_signature():
+    body = make_pdf(["Acme Corp"])
+    assert fetched_pdf(body).is_pdf
+    assert fetched_pdf(body, content_type="application/octet-stream").is_pdf
+    assert not fetched_pdf(b"<html></html>", content_type="text/html").is_pdf
+
+
+def test_pages_are_extracted_one_at_a_time_with_the_title():
+    body = make_pdf(["Annual report of Acme Corp", "Board of directors"], title="Acme Annual Report")
+    pages = main.iter_pdf_page_text(body)
+    assert "Annual report of Acme Corp" in next(pages)
+    assert "Board of directors" in next(pages)
+    assert main.pdf_document_title(body) == "Acme Annual Report"
+
+
+def test_finding_on_a_later_page_is_reported_with_the_document_title():
+    body = make_pdf(["Annual report", RISK_TEXT], title="Enforcement Order")
+    finding = main.WebContentAnalyzer().analyze_pdf(fetched_pdf(body), "Acme Corp", extract_entities=False)
+    assert finding is not None
+    assert finding.title == "Enforcement Order"
+    assert "convicted" in finding.context
+
+
+def test_original_bytes_are_the_archive(tmp_path):
+    body = make_pdf(["Acme Corp"])
+    archive = main.PDFArchiveManager(str(tmp_path / "archive"))
+    path = archive.save_document("https://regulator.example/acme.pdf", "Acme Corp", body)
+    assert open(path, "rb").read() == body
+
+
+def test_pdf_source_is_analyzed_and_archived_without_a_browser(engine, tmp_path):
+    body = make_pdf(["Annual report", RISK_TEXT])
+    archive = RecordingArchive(str(tmp_path / "archive"))
+    url = "https://regulator.example/orders/acme.pdf"
+
+    finding, pdf_path, digest = asyncio.run(
+        engine._analyze_and_archive(url, "Acme Corp", FakeFetcher(fetched_pdf(body)), archive)
+    )
+    assert finding is not None
+    assert open(pdf_path, "rb").read() == body
+    assert digest is not None
+    assert archive.rendered == []
+
+
+def test_truncated_pdf_is_skipped_rather_than_rendered(engine, tmp_path):
+    archive = RecordingArchive(str(tmp_path / "archive"))
+    fetched = fetched_pdf(make_pdf([RISK_TEXT])[:200], truncated=True)
+
+    result = asyncio.run(
+        engine._analyze_and_archive(fetched.url, "Acme Corp", FakeFetcher(fetched), archive)
+    )
+    assert result == (None, None, None)
+    assert archive.rendered == []
@@ -0,0 +1,34 @@
+from vdd_common.query_planner import plan_queries, quote_term, reciprocal_rank_fusion, shard_terms
+
+TERMS = ["fraud", "money laundering", "bribery", "kickback", "corruption", "insider trading", "lawsuit",
+         "litigation", "sued", "convicted", "guilty", "sentenced", "indicted", "charged", "violated"]
+
+
+def test_every_term_lands_in_a_shard_within_the_word_limit():
+    shards = shard_terms('"Acme Corp"', TERMS, max_words=12)
+    assert [term for shard in shards for term in shard] == [quote_term(term) for term in TERMS]
+    for shard in shards:
+        query = f'"Acme Corp" ({" OR ".join(shard)})'
+        assert len(query.split()) <= 12
+
+
+def test_plan_never_exceeds_the_call_budget():
+    plan = plan_queries('"Acme Corp"', TERMS, pages=3, call_budget=3, max_words=8)
+    assert plan.total_calls <= 3
+    assert len(plan.queries) == 3 and plan.pages_per_query == 1
+    assert plan.dropped_terms
+
+
+def test_budget_for_one_query_keeps_full_depth():
+    plan = plan_queries('"Acme Corp"', TERMS[:3], pages=3, call_budget=3)
+    assert len(plan.queries) == 1 and plan.pages_per_query == 3
+
+
+def test_rrf_merges_variants_and_prefers_the_canonical_link():
+    first = [{"link": "http://www.example.com/a?utm_source=x", "providers": ["cse"]},
+             {"link": "https://example.com/b", "providers": ["cse"]}]
+    second = [{"link": "https://example.com/b", "providers": ["serpapi"]},
+              {"link": "https://example.com/a", "providers": ["serpapi"]}]
+    merged = reciprocal_rank_fusion([first, second])
+    assert [item["link"] for item in merged] == ["https://example.com/a", "https://example.com/b"]
+    assert merged[0]["providers"] == ["cse", "serpapi"]
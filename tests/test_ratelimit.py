@@ -0,0 +1,61 @@
+import pytest
+
+from vdd_common import ratelimit
+from vdd_common.ratelimit import TokenBucket
+
+
+class Clock:
+    """Monotonic clock that only moves when sleep() is called"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(ratelimit.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(ratelimit.time, "sleep", clock.sleep)
+    return clock
+
+
+def test_burst_up_to_capacity_then_refill(clock):
+    bucket = TokenBucket(rate=2, capacity=3)
+    assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+    clock.now += 0.5
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+
+
+def test_refill_never_exceeds_capacity(clock):
+    bucket = TokenBucket(rate=10, capacity=2)
+    clock.now += 60
+    assert [bucket.try_acquire() for _ in range(3)] == [True, True, False]
+
+
+def test_acquire_waits_for_the_missing_tokens(clock):
+    bucket = TokenBucket(rate=4, capacity=1)
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.sleeps == [pytest.approx(0.25)]
+
+
+def test_per_minute_caps_the_burst_at_the_quota():
+    bucket = TokenBucket.per_minute(100)
+    assert (bucket.rate, bucket.capacity) == (pytest.approx(100 / 60), 10)
+    assert TokenBucket.per_minute(6).capacity == 6
+
+
+def test_rate_and_capacity_must_be_positive():
+    with pytest.raises(ValueError):
+        TokenBucket(0, 1)
+    with pytest.raises(ValueError):
+        TokenBucket(1, 0)
@@ -0,0 +1,94 @@
+from vdd_common.run_history import (
+    PARTIAL_DIGEST_PREFIX, PageRecord, RunHistory, RunSnapshot, compare_runs, page_digest,
+)
+from vdd_common.urlnorm import dedup_key
+
+FINDING = {"url": "https://a.example/fraud", "risk_category": "fraud"}
+
+
+def snapshot(*pages):
+    return RunSnapshot(1, "Acme Ltd", 1000.0, {dedup_key(page.url): page for page in pages})
+
+
+def current(*pages):
+    return {dedup_key(page.url): page for page in pages}
+
+
+def test_page_digest_marks_partial_bodies():
+    assert page_digest(b"body") != page_digest(b"body", truncated=True)
+    assert page_digest(b"body", truncated=True).startswith(PARTIAL_DIGEST_PREFIX)
+    assert page_digest(b"body", truncated=True) == page_digest(b"body", truncated=True)
+
+
+def test_compare_runs_classifies_pages():
+    previous = snapshot(
+        PageRecord("https://a.example/same", "d1"),
+        PageRecord("https://a.example/edited", "d2"),
+        PageRecord("https://a.example/gone", "d3"),
+        PageRecord("https://a.example/down", "d4"),
+    )
+    delta = compare_runs(previous, current(
+        PageRecord("https://www.a.example/same/", "d1"),
+        PageRecord("https://a.example/edited", "d2b"),
+        PageRecord("https://a.example/down", None),
+        PageRecord("https://a.example/fresh", "d5"),
+    ))
+
+    assert delta.previous_run_at == 1000.0
+    assert delta.unchanged_urls == ["https://www.a.example/same/"]
+    assert delta.changed_urls == ["https://a.example/edited"]
+    assert delta.unavailable_urls == ["https://a.example/down"]
+    assert delta.new_urls == ["https://a.example/fresh"]
+    assert delta.dropped_urls == ["https://a.example/gone"]
+    assert delta.has_changes
+
+
+def test_compare_runs_tracks_findings():
+    previous = snapshot(
+        PageRecord("https://a.example/kept", "d1", FINDING),
+        PageRecord("https://a.example/cleared", "d2", FINDING),
+        PageRecord("https://a.example/flagged", "d3"),
+    )
+    delta = compare_runs(previous, current(
+        PageRecord("https://a.example/kept", "d1", FINDING),
+        PageRecord("https://a.example/cleared", "d2b"),
+        PageRecord("https://a.example/flagged", "d3b", FINDING),
+    ))
+
+    assert delta.carried_findings == ["https://a.example/kept"]
+    assert delta.resolved_findings == ["https://a.example/cleared"]
+    assert delta.new_findings == ["https://a.example/flagged"]
+
+
+def test_truncated_page_is_changed_not_unavailable():
+    previous = snapshot(PageRecord("https://a.example/long", page_digest(b"full body")))
+    delta = compare_runs(previous, current(
+        PageRecord("https://a.example/long", page_digest(b"full", truncated=True), FINDING),
+    ))
+
+    assert delta.changed_urls == ["https://a.example/long"]
+    assert delta.unavailable_urls == []
+    assert delta.new_findings == ["https://a.example/long"]
+
+
+def test_unchanged_run_has_no_changes():
+    page = PageRecord("https://a.example/same", "d1", FINDING)
+    delta = compare_runs(snapshot(page), current(page))
+    assert not delta.has_changes
+    assert delta.carried_findings == ["https://a.example/same"]
+
+
+def test_history_round_trip(tmp_path):
+    history = RunHistory(tmp_path / "history.sqlite3")
+    assert history.last_run("Acme Ltd") is None
+
+    history.record_run("Acme Ltd", 1000.0, [PageRecord("https://a.example/x", "d1", FINDING, "/tmp/x.pdf")])
+    history.record_run("acme  ltd", 2000.0, [PageRecord("https://a.example/x", "d2"),
+                                             PageRecord("https://a.example/y", None)])
+
+    last = history.last_run("ACME Ltd")
+    assert last.started_at == 2000.0
+    assert last.page("http://www.a.example/x/").digest == "d2"
+    assert last.page("https://a.example/y").digest is None
+    assert [run["pages"] for run in history.runs("Acme Ltd")] == [2, 1]
+    assert [run["findings"] for run in history.runs("Acme Ltd")] == [0, 1]
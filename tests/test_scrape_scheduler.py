@@ -0,0 +1,82 @@
+import asyncio
+
+from tests.main_module import load_main
+
+main = load_main()
+
+
+def drain(scheduler, handler):
+    async def collect():
+        return [item async for item in scheduler.run(handler)]
+    return asyncio.run(collect())
+
+
+def test_lower_priority_values_run_first_and_ties_stay_fifo():
+    scheduler = main.ScrapeScheduler(max_concurrency=1, per_host_limit=1)
+    for url, priority in [("https://a.example/late", 5), ("https://b.example/first", -1),
+                          ("https://c.example/tie-1", 0), ("https://d.example/tie-2", 0)]:
+        scheduler.submit(url, priority)
+
+    started = []
+
+    async def handler(url):
+        started.append(url)
+        return url.upper()
+
+    results = drain(scheduler, handler)
+    assert started == ["https://b.example/first", "https://c.example/tie-1",
+                       "https://d.example/tie-2", "https://a.example/late"]
+    assert dict(results)["https://b.example/first"] == "HTTPS://B.EXAMPLE/FIRST"
+    assert scheduler.stats()["completed"] == 4
+
+
+def test_per_host_limit_caps_concurrency_on_one_host():
+    scheduler = main.ScrapeScheduler(max_concurrency=6, per_host_limit=2)
+    for n in range(6):
+        scheduler.submit(f"https://busy.example/{n}")
+    scheduler.submit("https://other.example/1")
+
+    peak = {"busy.example": 0, "other.example": 0}
+    running = {"busy.example": 0, "other.example": 0}
+
+    async def handler(url):
+        host = url.split("/")[2]
+        running[host] += 1
+        peak[host] = max(peak[host], running[host])
+        await asyncio.sleep(0.01)
+        running[host] -= 1
+
+    results = drain(scheduler, handler)
+    assert len(results) == 7
+    assert peak["busy.example"] == 2
+    assert scheduler.stats()["per_host_in_flight"] == {}
+
+
+def test_saturated_host_does_not_block_other_hosts():
+    scheduler = main.ScrapeScheduler(max_concurrency=2, per_host_limit=1)
+    scheduler.submit("https://slow.example/1", priority=0)
+    scheduler.submit("https://slow.example/2", priority=1)
+    scheduler.submit("https://fast.example/1", priority=2)
+
+    finished = []
+
+    async def handler(url):
+        await asyncio.sleep(0.05 if "slow" in url else 0)
+        finished.append(url)
+
+    drain(scheduler, handler)
+    # The second worker skips the queued slow.example job and takes fast.example
+    assert finished[0] == "https://fast.example/1"
+
+
+def test_failing_job_yields_none_and_frees_its_slot():
+    scheduler = main.ScrapeScheduler(max_concurrency=1, per_host_limit=1)
+    scheduler.submit("https://a.example/broken")
+    scheduler.submit("https://a.example/fine")
+
+    async def handler(url):
+        if "broken" in url:
+            raise RuntimeError("boom")
+        return "ok"
+
+    assert dict(drain(scheduler, handler)) == {"https://a.example/broken": None, "https://a.example/fine": "ok"}
@@ -0,0 +1,79 @@
+import pytest
+
+from vdd_common.search_cache import QuotaExhausted, SearchCache, format_ledger
+
+ITEMS = [{"link": "https://a.example/1", "title": "One"}]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return SearchCache(tmp_path / "search.sqlite3", daily_limits={"google_cse": 2, "serpapi": None})
+
+
+class Calls:
+    """fetch() stand-in that counts calls and returns or raises a fixed outcome"""
+
+    def __init__(self, result=ITEMS):
+        self.result = result
+        self.count = 0
+
+    def __call__(self):
+        self.count += 1
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+def test_fresh_page_is_served_without_a_call(cache):
+    calls = Calls()
+    assert cache.fetch("google_cse", "Acme  FRAUD", 1, calls) == ITEMS
+    assert cache.fetch("google_cse", "acme fraud", 1, calls) == ITEMS
+    assert calls.count == 1
+    ledger = cache.ledger()["google_cse"]
+    assert (ledger["calls"], ledger["hits"], ledger["remaining"]) == (1, 1, 1)
+
+
+def test_explicit_zero_ttl_stores_an_already_stale_page(cache):
+    cache.put("serpapi", "acme", 0, ITEMS, ttl=0)
+    calls = Calls([])
+    assert cache.fetch("serpapi", "acme", 0, calls) == []
+    assert calls.count == 1
+
+
+def test_stale_page_is_served_once_the_quota_is_spent(cache):
+    cache.put("google_cse", "acme", 1, ITEMS, ttl=0)
+    cache.fetch("google_cse", "other", 1, Calls())
+    cache.fetch("google_cse", "more", 1, Calls())
+    assert cache.remaining("google_cse") == 0
+
+    calls = Calls()
+    assert cache.fetch("google_cse", "acme", 1, calls) == ITEMS
+    assert calls.count == 0
+    assert cache.ledger()["google_cse"]["stale_hits"] == 1
+
+
+def test_spent_quota_with_nothing_cached_raises(cache):
+    cache.fetch("google_cse", "one", 1, Calls())
+    cache.fetch("google_cse", "two", 1, Calls())
+    calls = Calls()
+    with pytest.raises(QuotaExhausted):
+        cache.fetch("google_cse", "three", 1, calls)
+    assert calls.count == 0
+
+
+def test_stale_page_is_served_when_the_call_fails(cache):
+    cache.put("serpapi", "acme", 0, ITEMS, ttl=0)
+    assert cache.fetch("serpapi", "acme", 0, Calls(RuntimeError("503"))) == ITEMS
+    assert cache.ledger()["serpapi"]["stale_hits"] == 1
+
+
+def test_failed_call_with_nothing_cached_raises(cache):
+    with pytest.raises(RuntimeError):
+        cache.fetch("serpapi", "acme", 0, Calls(RuntimeError("503")))
+
+
+def test_unmetered_provider_never_runs_out(cache):
+    for n in range(5):
+        cache.fetch("serpapi", f"query {n}", 0, Calls())
+    assert cache.remaining("serpapi") is None
+    assert "serpapi: 5 calls, 0 cached, unmetered" in format_ledger(cache.ledger())
@@ -0,0 +1,78 @@
+import pytest
+
+from vdd_common.search_providers import FederatedSearch, SearchProvider, SerpApiProvider
+
+from tests.fakes import FakeProvider, FakeSerpApiSearch
+
+
+def serpapi(pages):
+    search_cls = type("PagedSearch", (FakeSerpApiSearch,), {"pages": pages})
+    return SerpApiProvider("key", search_cls=search_cls)
+
+
+def test_search_provider_is_abstract():
+    with pytest.raises(TypeError):
+        SearchProvider()
+
+
+def test_serpapi_keeps_the_pages_that_succeeded():
+    provider = serpapi({
+        0: [{"link": "https://a.example/1", "title": "One"}],
+        10: RuntimeError("quota"),
+        20: [{"link": "https://a.example/3"}, {"title": "no link"}],
+    })
+    items = provider.search("acme", 3, 10)
+    assert [item["link"] for item in items] == ["https://a.example/1", "https://a.example/3"]
+    assert items[0]["providers"] == ["serpapi"]
+
+
+def test_serpapi_raises_when_every_page_fails():
+    provider = serpapi({0: RuntimeError("quota"), 10: RuntimeError("quota")})
+    with pytest.raises(RuntimeError):
+        provider.search("acme", 2, 10)
+
+
+def test_results_are_fused_and_attributed():
+    search = FederatedSearch([
+        FakeProvider("serpapi", ["https://a.example/1", "https://a.example/2"]),
+        FakeProvider("google_cse", ["https://www.a.example/1/", "https://a.example/3"]),
+    ])
+    items, errors = search.search_with_errors("acme", 1, 10)
+    assert errors == {}
+    assert [item["link"] for item in items][0] in ("https://a.example/1", "https://www.a.example/1/")
+    assert sorted(items[0]["providers"]) == ["google_cse", "serpapi"]
+    assert len(items) == 3
+
+
+def test_a_failing_provider_contributes_nothing():
+    search = FederatedSearch([
+        FakeProvider("serpapi", error=RuntimeError("quota exhausted")),
+        FakeProvider("google_cse", ["https://a.example/1"]),
+    ])
+    items, errors = search.search_with_errors("acme", 1, 10)
+    assert [item["link"] for item in items] == ["https://a.example/1"]
+    assert errors == {"serpapi": "RuntimeError: quota exhausted"}
+
+
+def test_a_slow_provider_is_dropped_at_its_deadline():
+    search = FederatedSearch([
+        FakeProvider("serpapi", ["https://a.example/slow"], delay=1.0),
+        FakeProvider("google_cse", ["https://a.example/1"]),
+    ], timeouts={"serpapi": 0.05})
+    results = search.search("acme", 1, 10)
+    assert [result.url for result in results] == ["https://a.example/1"]
+    assert search.last_errors == {"serpapi": "timed out"}
+
+
+def test_all_providers_failing_raises():
+    search = FederatedSearch([
+        FakeProvider("serpapi", error=RuntimeError("quota")),
+        FakeProvider("google_cse", ["https://a.example/1"], delay=1.0),
+    ], timeouts={"google_cse": 0.05})
+    with pytest.raises(RuntimeError, match="All search providers failed"):
+        search.search_with_errors("acme", 1, 10)
+
+
+def test_no_providers_is_a_configuration_error():
+    with pytest.raises(ValueError):
+        FederatedSearch([])
@@ -0,0 +1,80 @@
+from vdd_common.text_store import TextStore, content_digest, text_version
+
+
+def put_page(store, n, size=2000, company="Acme Ltd"):
+    # Incompressible-ish text so each frame has a predictable footprint
+    text = " ".join(f"{n}-{i}-{i * 7919 % 10007}" for i in range(size // 12))
+    digest = content_digest(text.encode())
+    store.put(f"https://a.example/{n}", digest, f"Page {n}", text, company)
+    return digest, text
+
+
+def test_round_trip_and_urls(tmp_path):
+    store = TextStore(tmp_path)
+    digest, text = put_page(store, 1)
+
+    stored = store.get(digest)
+    assert (stored.title, stored.text) == ("Page 1", text)
+    assert store.get_url("https://a.example/1").text == text
+    assert store.urls_for("Acme Ltd") == ["https://a.example/1"]
+    assert [url for url, _ in store.iter_pages(["https://a.example/1", "https://a.example/2"])] == [
+        "https://a.example/1"
+    ]
+
+
+def test_backend_is_part_of_the_version(tmp_path):
+    assert text_version("lxml") != text_version("selectolax")
+
+    lxml_store = TextStore(tmp_path, version=text_version("lxml"))
+    digest, _ = put_page(lxml_store, 1)
+    lxml_store.close()
+
+    assert TextStore(tmp_path, version=text_version("selectolax")).get(digest) is None
+    assert TextStore(tmp_path, version=text_version("lxml")).get(digest) is not None
+
+
+def test_pack_stays_within_max_bytes(tmp_path):
+    store = TextStore(tmp_path, max_bytes=20_000)
+    digests = [put_page(store, n)[0] for n in range(40)]
+
+    stats = store.stats()
+    assert stats["pack_file_bytes"] <= 20_000
+    assert list(tmp_path.glob("texts*.pack")) == [store.pack_path]
+    # The newest texts survive compaction, the oldest are dropped
+    assert store.get(digests[-1]) is not None
+    assert store.get(digests[0]) is None
+    assert store.get_url("https://a.example/0") is None
+
+
+def test_compaction_keeps_surviving_texts_readable(tmp_path):
+    store = TextStore(tmp_path)
+    pages = [put_page(store, n) for n in range(5)]
+    before = store.stats()["pack_file_bytes"]
+    other = TextStore(tmp_path)
+    assert other.get(pages[-1][0]) is not None
+
+    store.max_bytes = before // 2
+    store.compact()
+
+    assert store.stats()["pack_file_bytes"] < before
+    survivors = [(digest, text) for digest, text in pages if store.get(digest) is not None]
+    assert survivors and len(survivors) < len(pages)
+    for digest, text in survivors:
+        assert store.get(digest).text == text
+
+    # A second handle that mapped the old pack follows the switch
+    digest, text = survivors[-1]
+    assert other.get(digest).text == text
+
+
+def test_compaction_drops_other_versions(tmp_path):
+    old = TextStore(tmp_path, version="old")
+    put_page(old, 1)
+    old.close()
+
+    store = TextStore(tmp_path, version="new")
+    new_digest, _ = put_page(store, 2)
+    store.compact()
+
+    assert store.stats()["texts"] == 1
+    assert store.get(new_digest) is not None
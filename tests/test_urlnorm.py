@@ -0,0 +1,50 @@
+import pytest
+
+from vdd_common.urlnorm import DedupIndex, clean_url, dedup_key, same_page
+
+
+@pytest.mark.parametrize("variant", [
+    "http://www.example.com/news/story?utm_source=feed#comments",
+    "https://example.com/news/story/",
+    "https://m.example.com/news/story",
+    "https://amp.example.com/news/story/amp",
+    "https://example.com/amp/news/story",
+    "https://example.com/news/story?fbclid=abc",
+    "https://EXAMPLE.com:443/news/story",
+    "https://example.com/news/%73tory",
+])
+def test_variants_share_a_dedup_key(variant):
+    assert dedup_key(variant) == dedup_key("https://example.com/news/story")
+
+
+@pytest.mark.parametrize("host, other", [
+    ("amp.dev", "dev"),
+    ("m.co.uk", "co.uk"),
+    ("www.gov.in", "gov.in"),
+])
+def test_prefixes_are_kept_when_no_registrable_domain_would_remain(host, other):
+    assert dedup_key(f"https://{host}/page") != dedup_key(f"https://{other}/page")
+
+
+def test_prefix_is_stripped_under_a_country_second_level_domain():
+    assert same_page("https://m.example.co.uk/a", "https://www.example.co.uk/a")
+
+
+def test_value_less_query_keys_are_kept_as_written():
+    assert clean_url("https://example.com/search?flag&q=1&utm_medium=x") == "https://example.com/search?flag&q=1"
+    assert dedup_key("https://example.com/search?q=1&flag") == "example.com/search?flag&q=1"
+    assert dedup_key("https://example.com/search?flag") != dedup_key("https://example.com/search?flag=")
+
+
+def test_query_order_does_not_matter_but_values_do():
+    assert same_page("https://example.com/?a=1&b=2", "https://example.com/?b=2&a=1")
+    assert not same_page("https://example.com/?id=1", "https://example.com/?id=2")
+
+
+def test_index_keeps_the_preferred_url_and_merges_sources():
+    index = DedupIndex()
+    assert index.add("http://m.example.com/story?utm_source=x", ["serpapi"])
+    assert not index.add("https://example.com/story", ["google_cse"])
+    assert index.preferred("http://www.example.com/story/") == "https://example.com/story"
+    assert index.sources("https://example.com/story") == {"serpapi", "google_cse"}
+    assert len(index) == 1
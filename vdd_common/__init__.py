@@ -0,0 +1,12 @@
+"""
+Shared infrastructure for the vendor due diligence entry points.
+
+The SERP_API and Google_CSE applications are standalone scripts; they add
+the repository root to ``sys.path`` so they can import from this package.
+"""
+
+import os
+from pathlib import Path
+
+# Root directory for all persistent caches (HTTP responses, search results, ...)
+CACHE_ROOT = Path(os.getenv("VDD_CACHE_DIR", Path(__file__).resolve().parent.parent / ".vdd_cache"))
@@ -0,0 +1,123 @@
+"""
+Benchmark the HTML parser backends on pages from the HTTP response cache.
+
+    python -m vdd_common.bench_parsers [--limit 200] [--repeat 3] [--cache-dir PATH]
+
+Every installed backend extracts title and text from the same cached HTML
+pages; the report lists per-page timings, throughput, and how closely each
+backend's text matches the BeautifulSoup baseline.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from . import CACHE_ROOT
+from .html_text import BACKENDS, available_backends
+from .http_cache import HTTPResponseCache
+
+MARKUP_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+
+
+def load_pages(cache_dir: Path, limit: int) -> List[Tuple[str, str]]:
+    """(url, html) for up to limit cached HTML responses"""
+    cache = HTTPResponseCache(cache_dir)
+    pages = []
+    for url in cache.urls():
+        if len(pages) >= limit:
+            break
+        entry = cache.get(url)
+        if entry is None or entry.status != 200:
+            continue
+        content_type = entry.headers.get("content-type", "").split(";")[0].strip().lower()
+        if content_type in MARKUP_CONTENT_TYPES:
+            pages.append((url, entry.text))
+    return pages
+
+
+def similarity(text: str, baseline: str) -> float:
+    """Word-level similarity ratio; 1.0 means identical word sequences"""
+    return SequenceMatcher(None, text.split(), baseline.split(), autojunk=False).ratio()
+
+
+def run(pages: List[Tuple[str, str]], backends: List[str], repeat: int) -> Dict[str, Dict[str, float]]:
+    results = {}
+    baseline = {url: BACKENDS["bs4"](html)[1] for url, html in pages} if "bs4" in backends else {}
+    total_bytes = sum(len(html.encode("utf-8")) for _, html in pages)
+
+    for backend in backends:
+        extract = BACKENDS[backend]
+        timings = []
+        failures = 0
+        texts = {}
+        for url, html in pages:
+            best = float("inf")
+            for _ in range(repeat):
+                started = time.perf_counter()
+                try:
+                    texts[url] = extract(html)[1]
+                except Exception:
+                    failures += 1
+                    break
+                best = min(best, time.perf_counter() - started)
+            if best != float("inf"):
+                timings.append(best)
+
+        total = sum(timings)
+        results[backend] = {
+            "pages": len(timings),
+            "failures": failures,
+            "total_s": total,
+            "median_ms": statistics.median(timings) * 1000 if timings else 0.0,
+            "p95_ms": sorted(timings)[int(len(timings) * 0.95) - 1] * 1000 if timings else 0.0,
+            "mb_per_s": total_bytes / total / 1e6 if total else 0.0,
+        }
+        if baseline and texts:
+            results[backend]["similarity"] = statistics.mean(
+                similarity(texts[url], baseline[url]) for url in texts
+            )
+    return results
+
+
+def format_results(results: Dict[str, Dict[str, float]]) -> str:
+    lines = [
+        f"{'backend':<12}{'pages':>7}{'fail':>6}{'median ms':>11}{'p95 ms':>9}"
+        f"{'MB/s':>8}{'vs bs4':>8}{'speedup':>9}"
+    ]
+    reference = results.get("bs4", {}).get("total_s")
+    for backend, row in results.items():
+        speedup = f"{reference / row['total_s']:.1f}x" if reference and row["total_s"] else "-"
+        match = f"{row['similarity']:.3f}" if "similarity" in row else "-"
+        lines.append(
+            f"{backend:<12}{row['pages']:>7}{row['failures']:>6}{row['median_ms']:>11.2f}"
+            f"{row['p95_ms']:>9.2f}{row['mb_per_s']:>8.1f}{match:>8}{speedup:>9}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compare HTML parser backends on cached pages")
+    parser.add_argument("--cache-dir", type=Path, default=CACHE_ROOT / "http")
+    parser.add_argument("--limit", type=int, default=200, help="Maximum number of pages")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per page; the fastest is kept")
+    parser.add_argument("--backend", action="append", choices=list(BACKENDS),
+                        help="Backend to include (repeatable; default: all installed)")
+    args = parser.parse_args(argv)
+
+    pages = load_pages(args.cache_dir, args.limit)
+    if not pages:
+        print(f"No cached HTML pages under {args.cache_dir}; run a screening first", file=sys.stderr)
+        return 1
+
+    backends = args.backend or available_backends()
+    print(f"{len(pages)} pages, {sum(len(html) for _, html in pages) / 1e6:.1f} MB of HTML")
+    print(format_results(run(pages, backends, max(args.repeat, 1))))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
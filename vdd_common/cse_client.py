@@ -0,0 +1,104 @@
+"""
+Google Custom Search client shared by the CSE entry points.
+
+The API service object is built once per client from the discovery
+document bundled with google-api-python-client (``static_discovery``), so
+no discovery request is made at start-up or per query. Result pages are
+requested concurrently under a TokenBucket, and the merged items are
+deduplicated by canonical page while keeping Google's ranking order. With a
+SearchCache attached, pages already fetched within their TTL cost no quota.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+import httplib2
+from googleapiclient.discovery import build
+
+from .ratelimit import TokenBucket
+from .search_cache import SearchCache
+from .urlnorm import dedup_key
+
+PROVIDER = "google_cse"
+
+# Default Custom Search JSON API quota is 100 queries per minute per project
+DEFAULT_QUERIES_PER_MINUTE = 100
+MAX_RESULTS_PER_PAGE = 10
+REQUEST_TIMEOUT = 15
+REQUEST_RETRIES = 2  # execute() backs off on 429 / 5xx by itself
+
+
+class CSEClient:
+    """Reusable Custom Search client issuing result pages concurrently"""
+
+    def __init__(self, api_key: str, engine_id: str, bucket: Optional[TokenBucket] = None,
+                 max_workers: int = 4, timeout: float = REQUEST_TIMEOUT, cache: Optional[SearchCache] = None):
+        if not api_key or not engine_id:
+            raise ValueError("Google API credentials not configured")
+        self.engine_id = engine_id
+        self.bucket = bucket or TokenBucket.per_minute(DEFAULT_QUERIES_PER_MINUTE)
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.cache = cache
+        self.service = build("customsearch", "v1", developerKey=api_key,
+                             static_discovery=True, cache_discovery=False)
+        # httplib2 connections are not thread-safe; give each worker its own
+        self._local = threading.local()
+
+    def _http(self) -> httplib2.Http:
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = self._local.http = httplib2.Http(timeout=self.timeout)
+        return http
+
+    def fetch_page(self, query: str, start: int = 1, num: int = MAX_RESULTS_PER_PAGE) -> List[Dict[str, Any]]:
+        """Raw result items for one page (start is 1-based)"""
+        def execute() -> List[Dict[str, Any]]:
+            self.bucket.acquire()
+            request = self.service.cse().list(q=query, cx=self.engine_id, start=start, num=num)
+            result = request.execute(http=self._http(), num_retries=REQUEST_RETRIES)
+            return result.get("items", [])
+
+        if self.cache is None:
+            return execute()
+        # Different engines index different sites, so the engine is part of the key
+        return self.cache.fetch(PROVIDER, f"cx={self.engine_id} num={num} {query}", start, execute)
+
+    def fetch_pages(self, query: str, pages: int,
+                    results_per_page: int = MAX_RESULTS_PER_PAGE) -> List[List[Dict[str, Any]]]:
+        """Result pages in order; a failed page is empty unless every page failed"""
+        starts = [page * results_per_page + 1 for page in range(pages)]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, pages) or 1) as pool:
+            futures = [pool.submit(self.fetch_page, query, start, results_per_page) for start in starts]
+
+        results, errors = [], []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as exc:
+                errors.append(exc)
+                results.append([])
+        if errors and len(errors) == len(futures):
+            raise errors[0]
+        return results
+
+    def search(self, query: str, pages: int, results_per_page: int = MAX_RESULTS_PER_PAGE) -> List[Dict[str, Any]]:
+        """Merged items across pages, deduplicated by canonical URL in rank order"""
+        return dedupe_items(item for page in self.fetch_pages(query, pages, results_per_page) for item in page)
+
+
+def dedupe_items(items) -> List[Dict[str, Any]]:
+    """Drop items whose link is a variant of an earlier one (first occurrence wins)"""
+    seen = set()
+    unique = []
+    for item in items:
+        link = item.get("link")
+        if not link:
+            continue
+        key = dedup_key(link)
+        if key in seen:
+            continue
+        seen.add(key)
+        unique.append(item)
+    return unique
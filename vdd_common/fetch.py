@@ -0,0 +1,233 @@
+"""
+Synchronous page fetching backed by the shared HTTP response cache.
+
+Bodies are streamed rather than loaded in one go: the Content-Type and
+Content-Length headers are checked before any of the body is read, reading
+stops at a byte cap, and an optional EvidenceProbe can end the download as
+soon as enough evidence has been seen. Every request is checked against the
+shared FailureRegistry first, so known-bad hosts fail immediately.
+"""
+
+import codecs
+import threading
+import time
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+import requests
+
+from .host_health import FailureRegistry, HostUnavailable
+from .http_cache import CachedResponse, HTTPResponseCache, charset_from_headers
+
+DEFAULT_MAX_BODY_BYTES = 5 * 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+
+# Content types the text analyzers know how to read
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml", "text/plain")
+
+
+class FetchRejected(Exception):
+    """The response was refused before or while reading its body"""
+
+
+class ResponseTooLarge(FetchRejected):
+    """Declared body size exceeds the configured cap"""
+
+
+class UnsupportedContentType(FetchRejected):
+    """Body is of a type the caller cannot analyze"""
+
+
+# Errors that another attempt cannot fix; retry decorators should exclude these
+NON_RETRYABLE_ERRORS = (FetchRejected, HostUnavailable)
+
+
+class EvidenceProbe:
+    """Incremental scan that reports when a name and enough risk terms have been seen"""
+
+    def __init__(self, names: Iterable[str], risk_terms: Iterable[str] = (), min_risk_terms: int = 1):
+        self.names = [name.lower() for name in names if name]
+        self.risk_terms = [term.lower() for term in risk_terms if term]
+        self.min_risk_terms = min(min_risk_terms, len(self.risk_terms))
+        # Keep enough trailing text to catch matches split across chunks
+        self._overlap = max([len(term) for term in self.names + self.risk_terms] or [1]) - 1
+        self.reset()
+
+    def reset(self):
+        """Forget everything seen so far, e.g. before a retried download"""
+        self.name_seen = False
+        self.terms_seen = set()
+        self._tail = ""
+
+    @property
+    def satisfied(self) -> bool:
+        return self.name_seen and len(self.terms_seen) >= self.min_risk_terms
+
+    def feed(self, text: str) -> bool:
+        """Scan the next piece of decoded text; returns True once satisfied"""
+        window = self._tail + text.lower()
+        if not self.name_seen:
+            self.name_seen = any(name in window for name in self.names)
+        for term in self.risk_terms:
+            if term not in self.terms_seen and term in window:
+                self.terms_seen.add(term)
+        self._tail = window[-self._overlap:] if self._overlap else ""
+        return self.satisfied
+
+
+def check_response_headers(headers: Dict[str, str], max_bytes: int,
+                           allowed_types: Optional[Tuple[str, ...]] = HTML_CONTENT_TYPES):
+    """Reject a response from its headers alone, before the body is read"""
+    headers = {name.lower(): value for name, value in headers.items()}
+    content_type = headers.get("content-type", "").split(";")[0].strip().lower()
+    if allowed_types and content_type and content_type not in allowed_types:
+        raise UnsupportedContentType(f"Unsupported content type: {content_type}")
+
+    declared = headers.get("content-length", "")
+    if declared.isdigit() and int(declared) > max_bytes:
+        raise ResponseTooLarge(f"Declared body of {int(declared)} bytes exceeds cap of {max_bytes}")
+
+
+def check_cached_entry(entry: CachedResponse, max_bytes: int,
+                       allowed_types: Optional[Tuple[str, ...]] = HTML_CONTENT_TYPES):
+    """Apply the same limits to a cached response as to a live one"""
+    check_response_headers(entry.headers, max_bytes, allowed_types)
+    if len(entry.body) > max_bytes:
+        raise ResponseTooLarge(f"Cached body of {len(entry.body)} bytes exceeds cap of {max_bytes}")
+
+
+class StreamingBody:
+    """Accumulates body chunks up to a cap, feeding an optional EvidenceProbe"""
+
+    def __init__(self, max_bytes: int, probe: Optional[EvidenceProbe] = None, charset: Optional[str] = None):
+        self.max_bytes = max_bytes
+        self.probe = probe
+        self.truncated = False  # Bytes of the body were left unread
+        self.stopped_early = False  # The probe ended reading; see finish()
+        self._chunks = []
+        self._size = 0
+        self._decoder = None
+        if probe is not None:
+            probe.reset()
+            try:
+                self._decoder = codecs.getincrementaldecoder(charset or "utf-8")(errors="replace")
+            except LookupError:
+                self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    @property
+    def body(self) -> bytes:
+        return b"".join(self._chunks)
+
+    def add(self, chunk: bytes) -> bool:
+        """Append a chunk; returns True when reading should stop"""
+        room = self.max_bytes - self._size
+        if len(chunk) > room:
+            chunk = chunk[:room]
+            self.truncated = True
+        self._chunks.append(chunk)
+        self._size += len(chunk)
+
+        if self.probe is not None and self.probe.feed(self._decoder.decode(chunk)):
+            self.stopped_early = True
+        return self.truncated or self.stopped_early
+
+    def finish(self, more: bool):
+        """Record whether the stream still had data when the probe stopped reading"""
+        if self.stopped_early and more:
+            self.truncated = True
+
+
+_default_cache: Optional[HTTPResponseCache] = None
+_default_registry: Optional[FailureRegistry] = None
+_defaults_lock = threading.Lock()
+
+
+def default_cache() -> HTTPResponseCache:
+    """Process-wide response cache, created on first use"""
+    global _default_cache
+    with _defaults_lock:
+        if _default_cache is None:
+            _default_cache = HTTPResponseCache()
+        return _default_cache
+
+
+def default_registry() -> FailureRegistry:
+    """Process-wide failure registry, created on first use"""
+    global _default_registry
+    with _defaults_lock:
+        if _default_registry is None:
+            _default_registry = FailureRegistry()
+        return _default_registry
+
+
+def cached_get(url: str, headers: Optional[Dict[str, str]] = None,
+               timeout: Union[float, Tuple[float, float]] = 15,
+               cache: Optional[HTTPResponseCache] = None, session: Optional[requests.Session] = None,
+               max_bytes: int = DEFAULT_MAX_BODY_BYTES,
+               allowed_types: Optional[Tuple[str, ...]] = HTML_CONTENT_TYPES,
+               probe: Optional[EvidenceProbe] = None,
+               registry: Optional[FailureRegistry] = None) -> CachedResponse:
+    """GET a URL, serving fresh copies from disk and revalidating stale ones
+
+    Responses declaring more than max_bytes are rejected outright; bodies
+    without a declared length are cut off at max_bytes. Cached entries are
+    held to the same type and size limits as live responses. Partial bodies are
+    returned with truncated=True and are never written to the cache.
+    Permanent failures (403, certificate errors, ...) are recorded in the
+    registry and re-raised as HostUnavailable so callers do not retry them.
+    """
+    cache = cache or default_cache()
+    entry = cache.get(url)
+    if entry is not None:
+        # The cache is shared: another caller may have stored a body this one refuses
+        check_cached_entry(entry, max_bytes, allowed_types)
+        if entry.fresh:
+            return entry
+
+    registry = registry or default_registry()
+    registry.check(url)
+
+    request_headers = dict(headers or {})
+    if entry is not None:
+        request_headers.update(entry.conditional_headers())
+
+    try:
+        result = _stream_get(url, request_headers, timeout, cache, session, entry,
+                             max_bytes, allowed_types, probe)
+    except FetchRejected:
+        # The host answered; only the payload was unwanted. Also frees a half-open trial.
+        registry.record_success(url)
+        raise
+    except Exception as exc:
+        if registry.record_failure(url, exc):
+            raise HostUnavailable(f"{url}: {exc}") from exc
+        raise
+
+    registry.record_success(url)
+    return result
+
+
+def _stream_get(url: str, request_headers: Dict[str, str], timeout: Union[float, Tuple[float, float]],
+                cache: HTTPResponseCache, session: Optional[requests.Session], entry: Optional[CachedResponse],
+                max_bytes: int, allowed_types: Optional[Tuple[str, ...]], probe: Optional[EvidenceProbe]) -> CachedResponse:
+    """Perform the streamed GET and store complete bodies"""
+    with (session or requests).get(url, headers=request_headers, timeout=timeout, stream=True) as response:
+        if entry is not None and response.status_code == 304:
+            return cache.refresh(url, dict(response.headers)) or entry
+
+        response.raise_for_status()
+        response_headers = {name.lower(): value for name, value in response.headers.items()}
+        check_response_headers(response_headers, max_bytes, allowed_types)
+
+        streamed = StreamingBody(max_bytes, probe, charset_from_headers(response_headers))
+        chunks = response.iter_content(CHUNK_SIZE)
+        for chunk in chunks:
+            if streamed.add(chunk):
+                break
+        # A probe satisfied by the last chunk leaves a complete, cacheable body
+        streamed.finish(streamed.stopped_early and any(chunks))
+
+    if streamed.truncated:
+        now = time.time()
+        return CachedResponse(url, response.url, response.status_code, response_headers,
+                              streamed.body, now, now, truncated=True)
+    return cache.put(url, response.url, response.status_code, response_headers, streamed.body)
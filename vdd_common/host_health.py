@@ -0,0 +1,185 @@
+"""
+Per-host circuit breakers and a persisted negative-result cache.
+
+Hosts that keep failing trip a breaker (closed -> open -> half-open) so
+the rest of a run skips them without paying for retries or a browser tab.
+Failures that will not fix themselves within a run are also written to a
+small SQLite table with an expiry, so later runs skip them as well: for
+the whole host on certificate, DNS and HTTP/2 protocol errors, for the
+single URL on 401/403/451 (one paywalled or bot-blocked article says
+nothing about the rest of a news site) and 404/410.
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+from . import CACHE_ROOT
+from .http_cache import canonical_cache_key
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Substrings of error messages that mean the whole host is unusable for now
+HOST_FAILURE_MARKERS = (
+    "CERTIFICATE_VERIFY_FAILED", "SSLCertVerificationError", "ERR_CERT_",
+    "ERR_HTTP2_PROTOCOL_ERROR", "ERR_NAME_NOT_RESOLVED", "Name or service not known",
+)
+
+# Access refusals are per page; enough of them on one host still trip its breaker
+URL_FAILURE_STATUSES = {401, 403, 404, 410, 451}
+
+
+class HostUnavailable(Exception):
+    """The host's breaker is open or the URL is in the negative cache"""
+
+
+def _status_of(exc: BaseException) -> Optional[int]:
+    """HTTP status carried by a requests or aiohttp error, if any"""
+    status = getattr(exc, "status", None)
+    if isinstance(status, int):
+        return status
+    response = getattr(exc, "response", None)
+    return getattr(response, "status_code", None)
+
+
+def classify_failure(exc: BaseException) -> Optional[str]:
+    """Return "host" or "url" for failures worth remembering, None for transient ones"""
+    status = _status_of(exc)
+    if status in URL_FAILURE_STATUSES:
+        return "url"
+
+    message = f"{type(exc).__name__}: {exc}"
+    if any(marker in message for marker in HOST_FAILURE_MARKERS):
+        return "host"
+    return None
+
+
+class CircuitBreaker:
+    """Classic three-state breaker for a single host
+
+    Failures are counted per distinct URL, so retrying one flaky page
+    cannot trip the breaker for every other page on the host.
+    """
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 300):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.opened_at: Optional[float] = None
+        self._failing: Set[str] = set()
+        self._trial_in_flight = False
+
+    @property
+    def failures(self) -> int:
+        """Distinct URLs that failed since the last success"""
+        return len(self._failing)
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return CLOSED
+        if time.time() - self.opened_at >= self.reset_timeout:
+            return HALF_OPEN
+        return OPEN
+
+    def allow(self) -> bool:
+        """Whether a request may be attempted right now"""
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and not self._trial_in_flight:
+            # Let exactly one probe request through
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def record_success(self):
+        self._failing.clear()
+        self.opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self, key: str = "", trip: bool = False):
+        self._failing.add(key)
+        self._trial_in_flight = False
+        if trip or self.failures >= self.failure_threshold or self.opened_at is not None:
+            self.opened_at = time.time()
+
+
+class FailureRegistry:
+    """Shared record of failing hosts and URLs, consulted before fetching or archiving"""
+
+    def __init__(self, db_path: Path = CACHE_ROOT / "host_health.sqlite3", failure_threshold: int = 3,
+                 reset_timeout: float = 300, negative_ttl: float = 6 * 3600):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.negative_ttl = negative_ttl
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), timeout=30, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS negative (key TEXT PRIMARY KEY, reason TEXT, expires_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _host(url: str) -> str:
+        return (urlsplit(url).hostname or "").lower()
+
+    def _breaker(self, host: str) -> CircuitBreaker:
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = self._breakers[host] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+        return breaker
+
+    def _negative_reason(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT reason, expires_at FROM negative WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        if row[1] <= time.time():
+            self._conn.execute("DELETE FROM negative WHERE key = ?", (key,))
+            self._conn.commit()
+            return None
+        return row[0]
+
+    def check(self, url: str):
+        """Raise HostUnavailable if the URL should not be attempted"""
+        host = self._host(url)
+        with self._lock:
+            for key in (f"host:{host}", f"url:{canonical_cache_key(url)}"):
+                reason = self._negative_reason(key)
+                if reason:
+                    raise HostUnavailable(f"Skipping {url}: {reason} (cached failure)")
+            if not self._breaker(host).allow():
+                raise HostUnavailable(f"Skipping {url}: circuit open for {host}")
+
+    def record_success(self, url: str):
+        with self._lock:
+            self._breaker(self._host(url)).record_success()
+
+    def record_failure(self, url: str, exc: BaseException) -> Optional[str]:
+        """Count a failure; returns the remembered scope ("host"/"url") for permanent ones"""
+        scope = classify_failure(exc)
+        host = self._host(url)
+        detail = str(exc).splitlines()[0][:200] if str(exc) else ""
+        reason = f"{type(exc).__name__}: {detail}"
+        with self._lock:
+            self._breaker(host).record_failure(canonical_cache_key(url), trip=scope == "host")
+            if scope:
+                key = f"host:{host}" if scope == "host" else f"url:{canonical_cache_key(url)}"
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO negative VALUES (?, ?, ?)",
+                    (key, reason, time.time() + self.negative_ttl)
+                )
+                self._conn.commit()
+        return scope
+
+    def snapshot(self) -> Dict[str, Tuple[str, int]]:
+        """Breaker state and failure count per host seen this process"""
+        with self._lock:
+            return {host: (breaker.state, breaker.failures) for host, breaker in self._breakers.items()}
@@ -0,0 +1,201 @@
+"""
+Title and main-text extraction from HTML with pluggable parser backends.
+
+Building a BeautifulSoup tree with ``html.parser`` and then decomposing the
+boilerplate elements is the largest CPU cost per page after NLP. Each
+backend here returns the same ``(title, text)`` pair, with text joined from
+stripped strings like ``get_text(" ", strip=True)`` and script, style,
+nav, header and footer content left out:
+
+- ``selectolax``: lexbor (or Modest) C parser, fastest when installed
+- ``lxml``: libxml2 HTML parser
+- ``stream``: a streaming extractor on the stdlib tokenizer that never
+  builds a tree; always available
+- ``bs4``: the original BeautifulSoup path, used as the fallback
+
+``extract_text`` picks the fastest available backend and falls back to
+BeautifulSoup if it fails on a page.
+"""
+
+from html.parser import HTMLParser
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as SelectolaxParser
+except ImportError:
+    try:
+        # Releases before lexbor became the default only ship the Modest parser
+        from selectolax.parser import HTMLParser as SelectolaxParser
+    except ImportError:
+        SelectolaxParser = None
+
+try:
+    import lxml.html
+except ImportError:
+    lxml = None
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError:
+    BeautifulSoup = None
+
+# Elements whose text is never part of the main content
+BOILERPLATE_TAGS = ("script", "style", "nav", "footer", "header")
+
+# Fastest first
+BACKEND_PREFERENCE = ("selectolax", "lxml", "stream", "bs4")
+
+TitleAndText = Tuple[Optional[str], str]
+
+
+class StreamingTextExtractor(HTMLParser):
+    """Collects the title and non-boilerplate text while the markup is fed in"""
+
+    def __init__(self, skip_tags: Iterable[str] = BOILERPLATE_TAGS):
+        super().__init__(convert_charrefs=True)
+        self.skip_tags = frozenset(skip_tags)
+        self.title: Optional[str] = None
+        self._parts: List[str] = []
+        self._buffer: List[str] = []
+        self._skip_depth = 0
+        self._title_parts: Optional[List[str]] = None
+
+    def _flush(self):
+        # Text nodes may arrive in several pieces; strip them only once whole
+        if self._buffer:
+            text = "".join(self._buffer).strip()
+            if text and not self._skip_depth:
+                self._parts.append(text)
+            self._buffer = []
+
+    def handle_starttag(self, tag: str, attrs):
+        self._flush()
+        if tag in self.skip_tags:
+            self._skip_depth += 1
+        elif tag == "title" and self.title is None:
+            self._title_parts = []
+
+    def handle_endtag(self, tag: str):
+        self._flush()
+        if tag in self.skip_tags and self._skip_depth:
+            self._skip_depth -= 1
+        elif tag == "title" and self._title_parts is not None:
+            self.title = "".join(self._title_parts).strip() or None
+            self._title_parts = None
+
+    def handle_startendtag(self, tag: str, attrs):
+        self._flush()
+
+    def handle_data(self, data: str):
+        if self._title_parts is not None:
+            self._title_parts.append(data)
+        self._buffer.append(data)
+
+    def result(self) -> TitleAndText:
+        self.close()
+        self._flush()
+        return self.title, " ".join(self._parts)
+
+
+def extract_stream(chunks: Iterable[str]) -> TitleAndText:
+    """Extract from markup arriving in pieces, e.g. a decoded response stream"""
+    extractor = StreamingTextExtractor()
+    for chunk in chunks:
+        extractor.feed(chunk)
+    return extractor.result()
+
+
+def _extract_selectolax(html: str) -> TitleAndText:
+    tree = SelectolaxParser(html)
+    title_node = tree.css_first("title")
+    title = (title_node.text(strip=True) if title_node is not None else "") or None
+    tree.strip_tags(list(BOILERPLATE_TAGS))
+    if tree.root is None:
+        return title, ""
+    # Node.text(separator=" ") would also join whitespace-only nodes, doubling spaces
+    strings = (node.text_content.strip() for node in tree.root.traverse(include_text=True) if node.tag == "-text")
+    return title, " ".join(text for text in strings if text)
+
+
+def _lxml_strings(root) -> Iterator[str]:
+    """Text nodes in document order, skipping boilerplate subtrees but keeping their tails
+
+    drop_tree() would glue a removed element's tail onto the preceding text
+    ("tail<script>..</script>after" -> "tailafter"), so tails are kept as
+    separate strings, like the text nodes the other backends see.
+    """
+    pending = [root]
+    while pending:
+        item = pending.pop()
+        if isinstance(item, str):
+            yield item
+            continue
+        # Comments and processing instructions have a callable tag
+        if isinstance(item.tag, str) and item.tag not in BOILERPLATE_TAGS:
+            if item.text:
+                yield item.text
+            for child in reversed(item):
+                if child.tail:
+                    pending.append(child.tail)
+                pending.append(child)
+
+
+def _extract_lxml(html: str) -> TitleAndText:
+    if not html.strip():
+        return None, ""
+    document = lxml.html.document_fromstring(html)
+    title = (document.findtext(".//title") or "").strip() or None
+    return title, " ".join(text.strip() for text in _lxml_strings(document) if text.strip())
+
+
+def _extract_stream(html: str) -> TitleAndText:
+    return extract_stream([html])
+
+
+def _extract_bs4(html: str) -> TitleAndText:
+    soup = BeautifulSoup(html, "html.parser")
+    title = soup.title.string.strip() if soup.title and soup.title.string else None
+    for element in soup(list(BOILERPLATE_TAGS)):
+        element.decompose()
+    return title or None, soup.get_text(" ", strip=True)
+
+
+BACKENDS: Dict[str, Callable[[str], TitleAndText]] = {
+    "selectolax": _extract_selectolax,
+    "lxml": _extract_lxml,
+    "stream": _extract_stream,
+    "bs4": _extract_bs4,
+}
+
+
+def available_backends() -> List[str]:
+    """Installed backends, fastest first"""
+    installed = {
+        "selectolax": SelectolaxParser is not None,
+        "lxml": lxml is not None,
+        "stream": True,
+        "bs4": BeautifulSoup is not None,
+    }
+    return [name for name in BACKEND_PREFERENCE if installed[name]]
+
+
+def default_backend() -> str:
+    return available_backends()[0]
+
+
+def extract_text(html: str, backend: Optional[str] = None) -> TitleAndText:
+    """(title or None, main text) using the given or fastest backend
+
+    If the backend raises on malformed markup, BeautifulSoup (or the
+    streaming extractor without it) is used for that page instead.
+    """
+    backend = backend or default_backend()
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown HTML parser backend '{backend}' (expected one of {', '.join(BACKENDS)})")
+    try:
+        return BACKENDS[backend](html)
+    except Exception:
+        fallback = "bs4" if BeautifulSoup is not None else "stream"
+        if backend == fallback:
+            raise
+        return BACKENDS[fallback](html)
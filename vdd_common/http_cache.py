@@ -0,0 +1,236 @@
+"""
+Persistent, content-addressed HTTP response cache.
+
+Bodies are written once per SHA-256 digest under ``blobs/`` and indexed in
+SQLite by canonical URL together with their headers and validators. Stale
+entries keep their ETag / Last-Modified so callers can revalidate them with
+a conditional request instead of downloading the page again.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+from . import CACHE_ROOT
+from .urlnorm import clean_url, sorted_query
+
+DEFAULT_TTL = 24 * 3600
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# Freshness per registrable domain; subdomains inherit their parent's TTL
+DOMAIN_TTLS = {
+    "wikipedia.org": 7 * 24 * 3600,
+    "coalindia.in": 3 * 24 * 3600,
+    "gov.in": 3 * 24 * 3600,
+    "nseindia.com": 3600,
+    "moneycontrol.com": 3600,
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    final_url TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    stored_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_last_access ON entries(last_access);
+CREATE INDEX IF NOT EXISTS entries_digest ON entries(digest);
+"""
+
+
+def canonical_cache_key(url: str) -> str:
+    """Normalize a URL so trivially different spellings share one entry"""
+    # Tracking parameters and fragments never change the response body
+    parts = urlsplit(clean_url(url))
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, sorted_query(parts.query), ""))
+
+
+def charset_from_headers(headers: Dict[str, str]) -> Optional[str]:
+    for param in headers.get("content-type", "").split(";")[1:]:
+        name, _, value = param.strip().partition("=")
+        if name.lower() == "charset" and value:
+            return value.strip('"\' ')
+    return None
+
+
+@dataclass
+class CachedResponse:
+    """Response body and metadata as stored in the cache"""
+    url: str
+    final_url: str
+    status: int
+    headers: Dict[str, str]  # Lower-cased header names
+    body: bytes
+    stored_at: float
+    expires_at: float
+    truncated: bool = False  # Partial body from an early-terminated stream
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    @property
+    def charset(self) -> Optional[str]:
+        return charset_from_headers(self.headers)
+
+    @property
+    def text(self) -> str:
+        return self.body.decode(self.charset or "utf-8", errors="replace")
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Validators for revalidating this entry"""
+        headers = {}
+        if self.headers.get("etag"):
+            headers["If-None-Match"] = self.headers["etag"]
+        if self.headers.get("last-modified"):
+            headers["If-Modified-Since"] = self.headers["last-modified"]
+        return headers
+
+
+class HTTPResponseCache:
+    """SQLite-indexed blob store with per-domain TTLs and LRU eviction"""
+
+    def __init__(self, cache_dir: Path = CACHE_ROOT / "http", max_bytes: int = DEFAULT_MAX_BYTES,
+                 default_ttl: int = DEFAULT_TTL, domain_ttls: Optional[Dict[str, int]] = None):
+        self.cache_dir = Path(cache_dir)
+        self.blob_dir = self.cache_dir / "blobs"
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.domain_ttls = DOMAIN_TTLS if domain_ttls is None else domain_ttls
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.cache_dir / "index.sqlite3"), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+    def ttl_for(self, url: str) -> int:
+        """Freshness lifetime for a URL based on its host"""
+        host = (urlsplit(url).hostname or "").lower()
+        for domain, ttl in self.domain_ttls.items():
+            if host == domain or host.endswith("." + domain):
+                return ttl
+        return self.default_ttl
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Return the cached response for a URL, fresh or stale"""
+        key = canonical_cache_key(url)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, final_url, status, headers, digest, stored_at, expires_at FROM entries WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            try:
+                body = self._blob_path(row[4]).read_bytes()
+            except FileNotFoundError:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+
+            self._conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+
+        return CachedResponse(
+            url=row[0], final_url=row[1], status=row[2], headers=json.loads(row[3]),
+            body=body, stored_at=row[5], expires_at=row[6]
+        )
+
+    def put(self, url: str, final_url: str, status: int, headers: Dict[str, str], body: bytes) -> CachedResponse:
+        """Store a response body and its metadata"""
+        headers = {name.lower(): value for name, value in headers.items()}
+        digest = hashlib.sha256(body).hexdigest()
+        now = time.time()
+        expires_at = now + self.ttl_for(url)
+
+        blob_path = self._blob_path(digest)
+        if not blob_path.exists():
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = blob_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(body)
+            os.replace(tmp_path, blob_path)
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (canonical_cache_key(url), url, final_url, status, json.dumps(headers), digest, len(body),
+                 headers.get("etag"), headers.get("last-modified"), now, expires_at, now)
+            )
+            self._evict_if_needed()
+            self._conn.commit()
+
+        return CachedResponse(url, final_url, status, headers, body, now, expires_at)
+
+    def refresh(self, url: str, headers: Dict[str, str]) -> Optional[CachedResponse]:
+        """Extend a stale entry after a 304 Not Modified response"""
+        entry = self.get(url)
+        if entry is None:
+            return None
+
+        # A 304 may carry updated validators; keep everything else
+        for name, value in headers.items():
+            if name.lower() in ("etag", "last-modified", "cache-control", "expires"):
+                entry.headers[name.lower()] = value
+        entry.expires_at = time.time() + self.ttl_for(url)
+
+        with self._lock:
+            self._conn.execute(
+                "UPDATE entries SET headers = ?, etag = ?, last_modified = ?, expires_at = ? WHERE key = ?",
+                (json.dumps(entry.headers), entry.headers.get("etag"), entry.headers.get("last-modified"),
+                 entry.expires_at, canonical_cache_key(url))
+            )
+            self._conn.commit()
+        return entry
+
+    def urls(self) -> List[str]:
+        """Original URL of every stored entry, most recently used first"""
+        with self._lock:
+            rows = self._conn.execute("SELECT url FROM entries ORDER BY last_access DESC").fetchall()
+        return [row[0] for row in rows]
+
+    def stats(self) -> Dict[str, int]:
+        """Entry count and on-disk footprint"""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            return {"entries": entries, "bytes": self._total_bytes(), "max_bytes": self.max_bytes}
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.blob_dir / digest[:2] / digest
+
+    def _total_bytes(self) -> int:
+        row = self._conn.execute("SELECT SUM(size) FROM (SELECT DISTINCT digest, size FROM entries)").fetchone()
+        return row[0] or 0
+
+    def _evict_if_needed(self):
+        """Drop least recently used entries until the store fits its budget"""
+        total = self._total_bytes()
+        if total <= self.max_bytes:
+            return
+
+        rows = self._conn.execute("SELECT key, digest, size FROM entries ORDER BY last_access").fetchall()
+        for key, digest, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            still_referenced = self._conn.execute(
+                "SELECT 1 FROM entries WHERE digest = ? LIMIT 1", (digest,)
+            ).fetchone()
+            if not still_referenced:
+                self._blob_path(digest).unlink(missing_ok=True)
+                total -= size
@@ -0,0 +1,218 @@
+"""
+Shared, pooled HTTP clients for every entry point.
+
+One keep-alive connection pool per process, sized to the caller's worker
+count, with separate connect and read timeouts, compressed transfer
+encodings and a short-lived DNS cache. Both the requests-based scripts and
+the aiohttp engine in Google_CSE/main.py build their clients here so pool
+behaviour stays consistent, and both report pool statistics so connection
+reuse can be checked after a run.
+
+Neither requests nor aiohttp speaks HTTP/2; connections are reused over
+HTTP/1.1 keep-alive instead.
+"""
+
+import socket
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_CONNECT_TIMEOUT = 5.0
+DEFAULT_READ_TIMEOUT = 15.0
+DEFAULT_TOTAL_TIMEOUT = 180.0  # Whole request, so a server trickling bytes cannot hold a slot forever
+DEFAULT_POOL_SIZE = 10
+DNS_CACHE_TTL = 300
+KEEPALIVE_TIMEOUT = 30
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/91.0.4472.124 Safari/537.36"
+)
+
+# Only advertise brotli when a decoder is installed; urllib3 and aiohttp pick it up automatically
+try:
+    import brotli  # noqa: F401
+    BROTLI_AVAILABLE = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        BROTLI_AVAILABLE = True
+    except ImportError:
+        BROTLI_AVAILABLE = False
+
+ACCEPT_ENCODING = "gzip, deflate, br" if BROTLI_AVAILABLE else "gzip, deflate"
+
+
+class DNSCache:
+    """TTL-bounded memo of socket.getaddrinfo results"""
+
+    def __init__(self, ttl: float = DNS_CACHE_TTL):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[Tuple[Any, ...], Tuple[float, list]] = {}
+        self._lock = threading.Lock()
+        self._resolve = socket.getaddrinfo
+
+    def getaddrinfo(self, host, port, family=0, type=0, proto=0, flags=0):
+        key = (host, port, family, type, proto, flags)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self.hits += 1
+                return entry[1]
+
+        result = self._resolve(host, port, family, type, proto, flags)
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (now + self.ttl, result)
+        return result
+
+
+_dns_cache: Optional[DNSCache] = None
+_shared_session: Optional[requests.Session] = None
+_shared_lock = threading.Lock()
+
+
+def install_dns_cache(ttl: float = DNS_CACHE_TTL) -> DNSCache:
+    """Route this process's blocking name lookups through a DNSCache (idempotent)"""
+    global _dns_cache
+    with _shared_lock:
+        if _dns_cache is None:
+            _dns_cache = DNSCache(ttl)
+            socket.getaddrinfo = _dns_cache.getaddrinfo
+        return _dns_cache
+
+
+def build_session(pool_size: int = DEFAULT_POOL_SIZE, user_agent: str = DEFAULT_USER_AGENT) -> requests.Session:
+    """requests.Session whose per-host pool can hold one connection per worker"""
+    session = requests.Session()
+    # Retries are handled by the callers' tenacity decorators
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0, pool_block=False)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({
+        "User-Agent": user_agent,
+        "Accept-Encoding": ACCEPT_ENCODING,
+        "Connection": "keep-alive",
+    })
+    return session
+
+
+def shared_session(pool_size: int = DEFAULT_POOL_SIZE) -> requests.Session:
+    """Process-wide pooled session, created on first use"""
+    global _shared_session
+    install_dns_cache()
+    with _shared_lock:
+        if _shared_session is None:
+            _shared_session = build_session(pool_size)
+        return _shared_session
+
+
+def session_pool_stats(session: requests.Session) -> Dict[str, Any]:
+    """Connections opened vs. requests sent across a session's urllib3 pools"""
+    connections = requests_sent = hosts = 0
+    seen = set()
+    for adapter in session.adapters.values():
+        if id(adapter) in seen:
+            continue
+        seen.add(id(adapter))
+        pools = adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            hosts += 1
+            connections += pool.num_connections
+            requests_sent += pool.num_requests
+
+    stats = _reuse_stats(connections, requests_sent)
+    stats["hosts"] = hosts
+    if _dns_cache is not None:
+        stats["dns_hits"] = _dns_cache.hits
+        stats["dns_misses"] = _dns_cache.misses
+    return stats
+
+
+def _reuse_stats(connections: int, requests_sent: int) -> Dict[str, Any]:
+    reuse = 1 - connections / requests_sent if requests_sent else 0.0
+    return {"connections": connections, "requests": requests_sent, "reuse_rate": max(reuse, 0.0)}
+
+
+def format_pool_stats(stats: Dict[str, Any]) -> str:
+    """One-line summary suitable for a status message or log entry"""
+    return (
+        f"{stats['requests']} requests over {stats['connections']} connections "
+        f"({stats['reuse_rate'] * 100:.0f}% reused)"
+    )
+
+
+class AsyncPoolStats:
+    """Counts new vs. reused aiohttp connections through a TraceConfig"""
+
+    def __init__(self):
+        self.created = 0
+        self.reused = 0
+        self.dns_hits = 0
+        self.dns_misses = 0
+
+    def trace_config(self):
+        import aiohttp
+
+        async def on_create(session, context, params):
+            self.created += 1
+
+        async def on_reuse(session, context, params):
+            self.reused += 1
+
+        async def on_dns_hit(session, context, params):
+            self.dns_hits += 1
+
+        async def on_dns_miss(session, context, params):
+            self.dns_misses += 1
+
+        trace = aiohttp.TraceConfig()
+        trace.on_connection_create_end.append(on_create)
+        trace.on_connection_reuseconn.append(on_reuse)
+        trace.on_dns_cache_hit.append(on_dns_hit)
+        trace.on_dns_cache_miss.append(on_dns_miss)
+        return trace
+
+    def snapshot(self) -> Dict[str, Any]:
+        stats = _reuse_stats(self.created, self.created + self.reused)
+        stats["dns_hits"] = self.dns_hits
+        stats["dns_misses"] = self.dns_misses
+        return stats
+
+
+def build_async_session(pool_size: int = DEFAULT_POOL_SIZE, per_host_limit: int = 0,
+                        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+                        read_timeout: float = DEFAULT_READ_TIMEOUT,
+                        total_timeout: float = DEFAULT_TOTAL_TIMEOUT,
+                        user_agent: str = DEFAULT_USER_AGENT,
+                        stats: Optional[AsyncPoolStats] = None):
+    """aiohttp.ClientSession with a keep-alive pool, DNS cache and split timeouts
+
+    Must be called from inside a running event loop.
+    """
+    import aiohttp
+
+    connector = aiohttp.TCPConnector(
+        limit=pool_size,
+        limit_per_host=per_host_limit,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        enable_cleanup_closed=True,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        # sock_read alone never fires on a slow trickle; total bounds each request, body included
+        timeout=aiohttp.ClientTimeout(total=total_timeout, connect=connect_timeout, sock_read=read_timeout),
+        headers={"User-Agent": user_agent, "Accept-Encoding": ACCEPT_ENCODING},
+        trace_configs=[stats.trace_config()] if stats else None,
+    )
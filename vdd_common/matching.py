@@ -0,0 +1,216 @@
+"""
+Multi-pattern keyword matching in a single pass.
+
+``KeywordAutomaton`` compiles a set of lower-cased patterns into an
+Aho-Corasick automaton and reports every occurrence, with its position and
+the payload registered for the pattern, in one linear scan of the text.
+The C implementation from ``pyahocorasick`` is used when installed; an
+equivalent pure-Python automaton is used otherwise.
+
+Matches must start at a word boundary so that "fine" does not fire inside
+"defined"; suffixes are allowed ("fined", "lawsuits") unless the pattern is
+registered as whole-word, which short acronyms such as "SEC" should be.
+
+``CompanyMatcher`` finds one company's name variations with a compiled
+regular expression; ``PortfolioMatcher`` finds many vendors' variations
+with one automaton and resolves overlaps the same way. Mentions become
+``MentionSpan`` context windows, merged where they overlap.
+"""
+
+import re
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Tuple
+
+try:
+    import ahocorasick
+    AHOCORASICK_LIB = "pyahocorasick"
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_LIB = None
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def lower_preserving_offsets(text: str) -> str:
+    """Lower-case text without changing its length (unlike str.lower for e.g. 'İ')"""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return "".join(char if len(char.lower()) != 1 else char.lower() for char in text)
+
+
+class _PurePythonAutomaton:
+    """Textbook Aho-Corasick over dict transitions"""
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[str, Any]]] = [[]]
+
+    def add_word(self, word: str, value: Tuple[str, Any]):
+        state = 0
+        for char in word:
+            nxt = self._goto[state].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][char] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append(value)
+
+    def make_automaton(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def iter(self, text: str) -> Iterator[Tuple[int, Tuple[str, Any]]]:
+        """Yield (index of last matched char, value) like pyahocorasick"""
+        state = 0
+        goto, fail, out = self._goto, self._fail, self._out
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for value in out[state]:
+                yield index, value
+
+
+class KeywordAutomaton:
+    """Compiled set of keywords matched case-insensitively in one pass"""
+
+    def __init__(self, patterns: Dict[str, Any], whole_word: Tuple[str, ...] = ()):
+        """patterns maps each keyword to the payload reported with its matches"""
+        whole_word = {word.lower() for word in whole_word}
+        self._automaton = ahocorasick.Automaton() if ahocorasick else _PurePythonAutomaton()
+        self.size = 0
+        for pattern, payload in patterns.items():
+            key = pattern.lower()
+            if not key:
+                continue
+            self._automaton.add_word(key, (key, (payload, key in whole_word)))
+            self.size += 1
+        if self.size:
+            self._automaton.make_automaton()
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, str, Any]]:
+        """Yield (start, end, keyword, payload) for each boundary-respecting match
+
+        Offsets refer to ``text``; matching is done on a lower-cased copy of
+        the same length.
+        """
+        if not self.size:
+            return
+        lowered = lower_preserving_offsets(text)
+        length = len(lowered)
+        for last, (key, (payload, whole)) in self._automaton.iter(lowered):
+            start = last - len(key) + 1
+            end = last + 1
+            # Same boundaries as the regex (?<!\w) and (?!\w), whatever the key's own edge characters
+            if start > 0 and _is_word_char(lowered[start - 1]):
+                continue
+            if whole and end < length and _is_word_char(lowered[end]):
+                continue
+            yield start, end, key, payload
+
+    def find_all(self, text: str) -> List[Tuple[int, int, str, Any]]:
+        """All matches ordered by start offset"""
+        return sorted(self.iter_matches(text), key=lambda match: (match[0], match[1]))
+
+
+@dataclass(frozen=True)
+class MentionSpan:
+    """Merged context window around one or more company mentions (offsets into the text)"""
+    start: int
+    end: int
+    mentions: Tuple[Tuple[int, int], ...]
+
+
+def merge_mention_windows(text_length: int, mentions: List[Tuple[int, int]], window: int) -> List[MentionSpan]:
+    """Context windows around ordered mentions, with overlapping windows merged"""
+    spans: List[MentionSpan] = []
+    current_start = current_end = None
+    current_mentions: List[Tuple[int, int]] = []
+
+    for start, end in mentions:
+        window_start = max(0, start - window)
+        window_end = min(text_length, end + window)
+        if current_end is not None and window_start <= current_end:
+            current_end = max(current_end, window_end)
+            current_mentions.append((start, end))
+            continue
+        if current_end is not None:
+            spans.append(MentionSpan(current_start, current_end, tuple(current_mentions)))
+        current_start, current_end, current_mentions = window_start, window_end, [(start, end)]
+
+    if current_end is not None:
+        spans.append(MentionSpan(current_start, current_end, tuple(current_mentions)))
+    return spans
+
+
+class CompanyMatcher:
+    """All variations of a company name compiled into one word-bounded alternation"""
+
+    def __init__(self, variations: List[str]):
+        # Longest first so "Acme Corp" wins over "Acme" at the same position
+        alternatives = sorted({variation for variation in variations if variation}, key=len, reverse=True)
+        self.pattern = re.compile(
+            r"(?<!\w)(?:" + "|".join(re.escape(variation) for variation in alternatives) + r")(?!\w)",
+            re.IGNORECASE
+        )
+
+    def find(self, text: str) -> List[Tuple[int, int]]:
+        """Non-overlapping (start, end) offsets of every mention, in one scan"""
+        return [match.span() for match in self.pattern.finditer(text)]
+
+    def spans(self, text: str, window: int) -> List[MentionSpan]:
+        """Context windows around mentions, with overlapping windows merged"""
+        return merge_mention_windows(len(text), self.find(text), window)
+
+
+class PortfolioMatcher:
+    """Name variations of many vendors compiled into one automaton, scanned once per document"""
+
+    def __init__(self, variations_by_vendor: Dict[str, List[str]]):
+        vendors_by_variation: Dict[str, List[str]] = {}
+        for vendor, variations in variations_by_vendor.items():
+            for variation in variations:
+                if variation and vendor not in vendors_by_variation.setdefault(variation.lower(), []):
+                    vendors_by_variation[variation.lower()].append(vendor)
+        self.vendors = list(variations_by_vendor)
+        # A variation may belong to several vendors ("Acme" for "Acme Inc" and "Acme Ltd")
+        self.automaton = KeywordAutomaton(
+            {variation: tuple(vendors) for variation, vendors in vendors_by_variation.items()},
+            whole_word=tuple(vendors_by_variation)
+        )
+
+    def find(self, text: str) -> Dict[str, List[Tuple[int, int]]]:
+        """Mention offsets per vendor, resolved like CompanyMatcher: leftmost, then longest"""
+        found: Dict[str, List[Tuple[int, int]]] = {}
+        for start, end, _, vendors in self.automaton.find_all(text):
+            for vendor in vendors:
+                mentions = found.setdefault(vendor, [])
+                if mentions and start == mentions[-1][0]:
+                    mentions[-1] = (start, max(end, mentions[-1][1]))
+                elif not mentions or start >= mentions[-1][1]:
+                    mentions.append((start, end))
+        return found
+
+    def spans(self, text: str, window: int) -> Dict[str, List[MentionSpan]]:
+        """Merged context spans for every vendor mentioned in the text"""
+        return {
+            vendor: merge_mention_windows(len(text), mentions, window)
+            for vendor, mentions in self.find(text).items()
+        }
@@ -0,0 +1,143 @@
+"""
+Memoized named-entity extraction results.
+
+The same paragraphs (press-release boilerplate, Wikipedia lead sections,
+syndicated copies of one news story) come back across URLs and across
+runs, and each costs a full Stanza pass. Entities are cached under a hash
+of the whitespace-normalized context and the pipeline/model version, in a
+small in-memory LRU in front of a size-bounded SQLite store, so a new
+model or profile never reuses another model's entities.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from . import CACHE_ROOT
+
+DEFAULT_MEMORY_ENTRIES = 4096
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entities (
+    key TEXT PRIMARY KEY,
+    entities TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entities_last_access ON entities(last_access);
+"""
+
+
+def normalize_context(context: str) -> str:
+    """Unicode- and whitespace-normalized text; case is kept since NER depends on it"""
+    return " ".join(unicodedata.normalize("NFC", context).split())
+
+
+def context_key(context: str, model_version: str) -> str:
+    digest = hashlib.sha256(normalize_context(context).encode("utf-8")).hexdigest()
+    return f"{model_version}:{digest}"
+
+
+class NERCache:
+    """Two-tier (memory LRU, then SQLite) cache of entities per context"""
+
+    def __init__(self, db_path: Path = CACHE_ROOT / "ner.sqlite3", memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        self.memory_entries = memory_entries
+        self.max_bytes = max_bytes
+        self._memory: "OrderedDict[str, List[str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._bytes = self._total_bytes()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def get(self, context: str, model_version: str) -> Optional[List[str]]:
+        """Cached entities for a context, or None"""
+        key = context_key(context, model_version)
+        with self._lock:
+            entities = self._memory.get(key)
+            if entities is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return list(entities)
+
+            row = self._conn.execute("SELECT entities FROM entities WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            self._conn.execute("UPDATE entities SET last_access = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+            entities = json.loads(row[0])
+            self._remember(key, entities)
+            self.disk_hits += 1
+            return list(entities)
+
+    def put(self, context: str, model_version: str, entities: List[str]):
+        key = context_key(context, model_version)
+        payload = json.dumps(entities)
+        with self._lock:
+            self._remember(key, list(entities))
+            previous = self._conn.execute("SELECT size FROM entities WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entities VALUES (?, ?, ?, ?)",
+                (key, payload, len(key) + len(payload), time.time())
+            )
+            self._bytes += len(key) + len(payload) - (previous[0] if previous else 0)
+            self._evict_if_needed()
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters for this process and the store's footprint"""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM entities").fetchone()[0]
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "entries": entries,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def _remember(self, key: str, entities: List[str]):
+        self._memory[key] = entities
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _total_bytes(self) -> int:
+        return self._conn.execute("SELECT SUM(size) FROM entities").fetchone()[0] or 0
+
+    def _evict_if_needed(self):
+        """Drop least recently used rows until the store fits its budget"""
+        if self._bytes <= self.max_bytes:
+            return
+
+        # Other processes share the file, so re-read the real total before deleting
+        self._bytes = self._total_bytes()
+        if self._bytes <= self.max_bytes:
+            return
+
+        # Evict down to 90% so the next few puts do not trigger another pass
+        target = self.max_bytes * 0.9
+        rows = self._conn.execute("SELECT key, size FROM entities ORDER BY last_access").fetchall()
+        for key, size in rows:
+            if self._bytes <= target:
+                break
+            self._conn.execute("DELETE FROM entities WHERE key = ?", (key,))
+            self._memory.pop(key, None)
+            self._bytes -= size
+
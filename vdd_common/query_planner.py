@@ -0,0 +1,125 @@
+"""
+Query planning for keyword-heavy risk searches.
+
+Search engines silently ignore everything past a query's word limit (32
+words for Google), so OR-ing the whole risk lexicon into one query only
+searches its first few terms. The planner splits the lexicon into shards
+that each fit the limit alongside the company name, fits the shards and
+their result pages into a per-run call budget, and merges the per-shard
+rankings with reciprocal rank fusion.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from .urlnorm import dedup_key, url_preference
+
+DEFAULT_MAX_QUERY_WORDS = 32
+DEFAULT_MAX_QUERY_CHARS = 2048
+RRF_K = 60
+
+QUERY_TERM = re.compile(r'"([^"]+)"|([^\s()&|"]+)')
+QUERY_OPERATORS = {"OR", "AND", "NOT"}
+
+
+@dataclass
+class QueryPlan:
+    """Shard queries to run and how many result pages to request for each"""
+    queries: List[str]
+    pages_per_query: int
+    dropped_terms: List[str] = field(default_factory=list)  # Shards cut to fit the budget
+
+    @property
+    def total_calls(self) -> int:
+        return len(self.queries) * self.pages_per_query
+
+
+def quote_term(term: str) -> str:
+    """Quote multi-word terms so they are matched as phrases"""
+    term = term.strip().strip('"')
+    return f'"{term}"' if " " in term else term
+
+
+def split_or_terms(query: str) -> List[str]:
+    """Terms of a boolean keyword block such as '(crime OR "grease payment")'"""
+    terms = []
+    for phrase, word in QUERY_TERM.findall(query):
+        if phrase or word not in QUERY_OPERATORS:
+            terms.append(phrase or word)
+    return terms
+
+
+def _query(anchor: str, terms: Sequence[str]) -> str:
+    return f"{anchor} ({' OR '.join(terms)})"
+
+
+def shard_terms(anchor: str, terms: Iterable[str], max_words: int = DEFAULT_MAX_QUERY_WORDS,
+                max_chars: int = DEFAULT_MAX_QUERY_CHARS) -> List[List[str]]:
+    """Greedily pack quoted terms into shards whose full query fits both limits
+
+    Every term is kept; a term too long to share a query goes in a shard of
+    its own. OR operators are counted as words since engines count them.
+    """
+    anchor_words = len(anchor.split())
+    shards: List[List[str]] = []
+    current: List[str] = []
+    words = anchor_words
+
+    for term in dict.fromkeys(quote_term(term) for term in terms if term.strip()):
+        term_words = len(term.split()) + (1 if current else 0)
+        fits = words + term_words <= max_words and len(_query(anchor, current + [term])) <= max_chars
+        if current and not fits:
+            shards.append(current)
+            current, words = [], anchor_words
+            term_words = len(term.split())
+        current.append(term)
+        words += term_words
+
+    if current:
+        shards.append(current)
+    return shards
+
+
+def plan_queries(anchor: str, terms: Iterable[str], pages: int, call_budget: int,
+                 max_words: int = DEFAULT_MAX_QUERY_WORDS,
+                 max_chars: int = DEFAULT_MAX_QUERY_CHARS) -> QueryPlan:
+    """Cover as many shards as the budget allows, trading result depth for breadth"""
+    shards = shard_terms(anchor, terms, max_words, max_chars)
+    call_budget = max(call_budget, 1)
+
+    # Breadth first: every shard gets at least one page before any gets a second
+    kept = shards[:call_budget]
+    dropped = [term for shard in shards[call_budget:] for term in shard]
+    pages_per_query = max(1, min(pages, call_budget // max(len(kept), 1)))
+
+    return QueryPlan([_query(anchor, shard) for shard in kept], pages_per_query, dropped)
+
+
+def reciprocal_rank_fusion(rankings: Iterable[Sequence[Dict[str, Any]]], k: int = RRF_K,
+                           key: Optional[Callable[[Dict[str, Any]], str]] = None) -> List[Dict[str, Any]]:
+    """Merge ranked result lists, scoring each URL by sum(1 / (k + rank))
+
+    Items are deduplicated by urlnorm.dedup_key, so http/https, www., AMP and
+    tracking-parameter variants collapse. The first-seen item is kept, with
+    the most canonical variant's link and the merged "providers" lists.
+    """
+    key = key or (lambda item: dedup_key(item["link"]))
+    scores: Dict[str, float] = {}
+    items: Dict[str, Dict[str, Any]] = {}
+
+    for ranking in rankings:
+        for rank, item in enumerate(ranking, start=1):
+            if not item.get("link"):
+                continue
+            item_key = key(item)
+            scores[item_key] = scores.get(item_key, 0.0) + 1.0 / (k + rank)
+            kept = items.setdefault(item_key, dict(item))
+            if url_preference(item["link"]) > url_preference(kept["link"]):
+                kept["link"] = item["link"]  # e.g. the https, non-AMP variant
+            for provider in item.get("providers", ()):
+                if provider not in kept.setdefault("providers", []):
+                    kept["providers"].append(provider)
+
+    # Python's sort is stable, so ties keep first-seen order
+    return [items[item_key] for item_key in sorted(scores, key=scores.get, reverse=True)]
@@ -0,0 +1,184 @@
+"""
+Per-vendor screening history for incremental re-screening.
+
+Every completed screening records, for each source URL, the SHA-256 of
+the body that was analysed, the finding it produced (if any) and its PDF
+archive. A re-run looks up the vendor's last run and only analyses and
+archives URLs that are new or whose content hash changed; unchanged pages
+carry their previous finding forward. ``compare_runs`` summarises what
+changed between two runs for the delta report.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from . import CACHE_ROOT
+from .urlnorm import dedup_key
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    company TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    finished_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_company ON runs(company, started_at);
+CREATE TABLE IF NOT EXISTS run_pages (
+    run_id INTEGER NOT NULL,
+    url TEXT NOT NULL,
+    digest TEXT,
+    finding TEXT,
+    pdf_path TEXT,
+    PRIMARY KEY (run_id, url)
+);
+"""
+
+
+# Marks the digest of a body that was cut short, so it never matches a complete one
+PARTIAL_DIGEST_PREFIX = "partial:"
+
+
+def page_digest(body: bytes, truncated: bool = False) -> str:
+    """Digest of the bytes that were analysed, flagged when the body was cut short"""
+    digest = hashlib.sha256(body).hexdigest()
+    return PARTIAL_DIGEST_PREFIX + digest if truncated else digest
+
+
+def company_key(company: str) -> str:
+    """Case- and whitespace-insensitive vendor name"""
+    return " ".join(company.lower().split())
+
+
+@dataclass
+class PageRecord:
+    """What one screening saw at one URL"""
+    url: str
+    digest: Optional[str]  # page_digest of the body; None when the page could not be fetched
+    finding: Optional[Dict[str, Any]] = None  # JSON-safe finding, if the page produced one
+    pdf_path: Optional[str] = None
+
+
+@dataclass
+class RunSnapshot:
+    """A vendor's recorded run, with pages keyed by urlnorm.dedup_key"""
+    run_id: int
+    company: str
+    started_at: float
+    pages: Dict[str, PageRecord]
+
+    def page(self, url: str) -> Optional[PageRecord]:
+        return self.pages.get(dedup_key(url))
+
+
+@dataclass
+class RunDelta:
+    """Differences between a screening and the vendor's previous one (URL lists)"""
+    previous_run_at: Optional[float]
+    new_urls: List[str] = field(default_factory=list)
+    changed_urls: List[str] = field(default_factory=list)
+    unchanged_urls: List[str] = field(default_factory=list)
+    dropped_urls: List[str] = field(default_factory=list)  # No longer among the search results
+    unavailable_urls: List[str] = field(default_factory=list)  # Could not be fetched this time
+    new_findings: List[str] = field(default_factory=list)
+    resolved_findings: List[str] = field(default_factory=list)
+    carried_findings: List[str] = field(default_factory=list)
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.new_findings or self.resolved_findings or self.new_urls or self.changed_urls)
+
+
+def compare_runs(previous: Optional[RunSnapshot], pages: Dict[str, PageRecord]) -> RunDelta:
+    """Delta of the current pages (keyed by dedup_key) against the previous run"""
+    delta = RunDelta(previous.started_at if previous else None)
+    before = previous.pages if previous else {}
+
+    for key, page in pages.items():
+        old = before.get(key)
+        if page.digest is None:
+            if old is not None:
+                delta.unavailable_urls.append(page.url)
+            continue
+        if old is None or old.digest is None:
+            delta.new_urls.append(page.url)
+        elif old.digest != page.digest:
+            delta.changed_urls.append(page.url)
+        else:
+            delta.unchanged_urls.append(page.url)
+
+        had_finding = old is not None and old.finding is not None
+        if page.finding is not None and not had_finding:
+            delta.new_findings.append(page.url)
+        elif page.finding is None and had_finding:
+            delta.resolved_findings.append(page.url)
+        elif page.finding is not None:
+            delta.carried_findings.append(page.url)
+
+    delta.dropped_urls = [page.url for key, page in before.items() if key not in pages]
+    return delta
+
+
+class RunHistory:
+    """SQLite record of each vendor's screenings"""
+
+    def __init__(self, db_path: Path = CACHE_ROOT / "run_history.sqlite3"):
+        self._lock = threading.Lock()
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+    def last_run(self, company: str) -> Optional[RunSnapshot]:
+        """The vendor's most recent recorded run"""
+        with self._lock:
+            run = self._conn.execute(
+                "SELECT run_id, started_at FROM runs WHERE company = ? ORDER BY started_at DESC LIMIT 1",
+                (company_key(company),)
+            ).fetchone()
+            if run is None:
+                return None
+            rows = self._conn.execute(
+                "SELECT url, digest, finding, pdf_path FROM run_pages WHERE run_id = ?", (run[0],)
+            ).fetchall()
+
+        pages = {}
+        for url, digest, finding, pdf_path in rows:
+            pages[dedup_key(url)] = PageRecord(url, digest, json.loads(finding) if finding else None, pdf_path)
+        return RunSnapshot(run[0], company, run[1], pages)
+
+    def record_run(self, company: str, started_at: float, pages: Iterable[PageRecord]) -> int:
+        """Store a completed run and return its id"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO runs (company, started_at, finished_at) VALUES (?, ?, ?)",
+                (company_key(company), started_at, time.time())
+            )
+            run_id = cursor.lastrowid
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO run_pages VALUES (?, ?, ?, ?, ?)",
+                [(run_id, page.url, page.digest, json.dumps(page.finding) if page.finding else None, page.pdf_path)
+                 for page in pages]
+            )
+            self._conn.commit()
+        return run_id
+
+    def runs(self, company: str) -> List[Dict[str, Any]]:
+        """Recorded runs for a vendor, newest first"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT r.run_id, r.started_at, r.finished_at, COUNT(p.url), COUNT(p.finding) "
+                "FROM runs r LEFT JOIN run_pages p ON p.run_id = r.run_id "
+                "WHERE r.company = ? GROUP BY r.run_id ORDER BY r.started_at DESC",
+                (company_key(company),)
+            ).fetchall()
+        return [
+            {"run_id": run_id, "started_at": started_at, "finished_at": finished_at, "pages": pages,
+             "findings": findings}
+            for run_id, started_at, finished_at, pages, findings in rows
+        ]
@@ -0,0 +1,190 @@
+"""
+Persistent search-result cache and per-provider quota ledger.
+
+Result pages are stored in SQLite keyed by provider, normalized query and
+page, so re-running a report or a batch screening reuses earlier pages
+instead of spending paid API quota. Every lookup is metered per provider
+and UTC day; once a provider's daily budget is spent, stale pages are
+served instead, and the same happens when the provider call itself fails.
+"""
+
+import datetime
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from . import CACHE_ROOT
+
+DEFAULT_TTL = 24 * 3600
+
+# Free-tier daily request budgets; None means unmetered
+DEFAULT_DAILY_LIMITS: Dict[str, Optional[int]] = {
+    "google_cse": 100,
+    "serpapi": None,
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    provider TEXT NOT NULL,
+    query TEXT NOT NULL,
+    page INTEGER NOT NULL,
+    items TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (provider, query, page)
+);
+CREATE TABLE IF NOT EXISTS quota (
+    provider TEXT NOT NULL,
+    day TEXT NOT NULL,
+    calls INTEGER NOT NULL DEFAULT 0,
+    hits INTEGER NOT NULL DEFAULT 0,
+    stale_hits INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (provider, day)
+);
+"""
+
+
+class QuotaExhausted(Exception):
+    """The provider's daily budget is spent and nothing is cached for the query"""
+
+
+def normalize_query(query: str) -> str:
+    """Case- and whitespace-insensitive form of a query used as the cache key"""
+    return " ".join(query.lower().split())
+
+
+def _today() -> str:
+    return datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%d")
+
+
+class SearchCache:
+    """SQLite-backed search result pages with TTLs and a quota ledger"""
+
+    def __init__(self, db_path: Path = CACHE_ROOT / "search.sqlite3", ttl: int = DEFAULT_TTL,
+                 daily_limits: Optional[Dict[str, Optional[int]]] = None):
+        self.ttl = ttl
+        self.daily_limits = dict(DEFAULT_DAILY_LIMITS if daily_limits is None else daily_limits)
+        self._lock = threading.Lock()
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+    def _lookup(self, provider: str, query: str, page: int):
+        row = self._conn.execute(
+            "SELECT items, expires_at FROM results WHERE provider = ? AND query = ? AND page = ?",
+            (provider, normalize_query(query), page)
+        ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), row[1] > time.time()
+
+    def _meter(self, provider: str, column: str):
+        self._conn.execute(
+            f"INSERT INTO quota (provider, day, {column}) VALUES (?, ?, 1) "
+            f"ON CONFLICT(provider, day) DO UPDATE SET {column} = {column} + 1",
+            (provider, _today())
+        )
+        self._conn.commit()
+
+    def _remaining(self, provider: str) -> Optional[int]:
+        limit = self.daily_limits.get(provider)
+        if limit is None:
+            return None
+        row = self._conn.execute(
+            "SELECT calls FROM quota WHERE provider = ? AND day = ?", (provider, _today())
+        ).fetchone()
+        return max(limit - (row[0] if row else 0), 0)
+
+    def remaining(self, provider: str) -> Optional[int]:
+        """Calls left today for a provider, or None if it is unmetered"""
+        with self._lock:
+            return self._remaining(provider)
+
+    def put(self, provider: str, query: str, page: int, items: List[Dict[str, Any]], ttl: Optional[int] = None):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)",
+                (provider, normalize_query(query), page, json.dumps(items), now, now + (self.ttl if ttl is None else ttl))
+            )
+            self._conn.commit()
+
+    def fetch(self, provider: str, query: str, page: int, fetch: Callable[[], List[Dict[str, Any]]],
+              ttl: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return a result page from cache, or call fetch() and store its items
+
+        Stale pages are served when the provider is out of quota or the call
+        fails; with nothing cached, QuotaExhausted / the call's error is raised.
+        """
+        with self._lock:
+            cached = self._lookup(provider, query, page)
+            if cached is not None and cached[1]:
+                self._meter(provider, "hits")
+                return cached[0]
+
+            # Check and spend the budget in one step so concurrent pages cannot overshoot it
+            out_of_quota = self._remaining(provider) == 0
+            if out_of_quota and cached is not None:
+                self._meter(provider, "stale_hits")
+                return cached[0]
+            if not out_of_quota:
+                self._meter(provider, "calls")
+
+        if out_of_quota:
+            raise QuotaExhausted(f"Daily {provider} quota exhausted")
+
+        try:
+            items = fetch()
+        except Exception:
+            if cached is None:
+                raise
+            with self._lock:
+                self._meter(provider, "stale_hits")
+            return cached[0]
+
+        self.put(provider, query, page, items, ttl)
+        return items
+
+    def ledger(self, day: Optional[str] = None) -> Dict[str, Dict[str, Optional[int]]]:
+        """Per-provider calls, cache hits and remaining budget for a day (default today)"""
+        day = day or _today()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT provider, calls, hits, stale_hits FROM quota WHERE day = ?", (day,)
+            ).fetchall()
+        ledger = {}
+        for provider, calls, hits, stale_hits in rows:
+            limit = self.daily_limits.get(provider)
+            ledger[provider] = {
+                "calls": calls,
+                "hits": hits,
+                "stale_hits": stale_hits,
+                "remaining": None if limit is None else max(limit - calls, 0),
+            }
+        return ledger
+
+
+_default_search_cache: Optional[SearchCache] = None
+_default_lock = threading.Lock()
+
+
+def default_search_cache() -> SearchCache:
+    """Process-wide search cache, created on first use"""
+    global _default_search_cache
+    with _default_lock:
+        if _default_search_cache is None:
+            _default_search_cache = SearchCache()
+        return _default_search_cache
+
+
+def format_ledger(ledger: Dict[str, Dict[str, Optional[int]]]) -> str:
+    """One-line summary of today's search quota use"""
+    parts = []
+    for provider, row in sorted(ledger.items()):
+        remaining = "unmetered" if row["remaining"] is None else f"{row['remaining']} left"
+        parts.append(f"{provider}: {row['calls']} calls, {row['hits'] + row['stale_hits']} cached, {remaining}")
+    return "; ".join(parts) or "no searches today"
@@ -0,0 +1,214 @@
+"""
+Federated web search over every configured provider.
+
+Each provider (SerpApi, Google Custom Search) is wrapped behind the same
+``search(query, pages, results_per_page)`` interface returning normalized
+items. FederatedSearch fans a query out to all of them at once, gives each
+its own deadline so a slow provider cannot hold up the run, and merges
+what came back by canonical URL with reciprocal rank fusion, recording
+which providers returned each URL. A provider that fails or runs out of
+quota simply contributes nothing.
+
+Both provider libraries are optional: a provider is only built when its
+credentials are set and its client library is importable.
+"""
+
+import os
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .query_planner import reciprocal_rank_fusion
+from .search_cache import SearchCache
+from .urlnorm import clean_url
+
+DEFAULT_PROVIDER_TIMEOUT = 20.0
+
+
+@dataclass
+class SearchResult:
+    """One merged search hit and the providers that returned it"""
+    url: str
+    title: str = ""
+    snippet: str = ""
+    providers: List[str] = field(default_factory=list)
+
+
+def normalize_item(link: str, title: Optional[str], snippet: Optional[str], provider: str) -> Dict[str, Any]:
+    return {"link": link, "title": title or "", "snippet": snippet or "", "providers": [provider]}
+
+
+class SearchProvider(ABC):
+    """Interface implemented by every search backend"""
+
+    name = "provider"
+
+    @abstractmethod
+    def search(self, query: str, pages: int, results_per_page: int) -> List[Dict[str, Any]]:
+        """Ranked, normalized items (link/title/snippet/providers) across the first pages"""
+
+
+class GoogleCSEProvider(SearchProvider):
+    """Google Custom Search JSON API through a shared CSEClient"""
+
+    name = "google_cse"
+
+    def __init__(self, client):
+        self.client = client
+
+    def search(self, query: str, pages: int, results_per_page: int) -> List[Dict[str, Any]]:
+        return [
+            normalize_item(item["link"], item.get("title"), item.get("snippet"), self.name)
+            for item in self.client.search(query, pages, results_per_page)
+        ]
+
+
+class SerpApiProvider(SearchProvider):
+    """Google results through SerpApi, one concurrent request per page"""
+
+    name = "serpapi"
+
+    def __init__(self, api_key: str, cache: Optional[SearchCache] = None, max_workers: int = 4,
+                 search_cls: Optional[type] = None):
+        if search_cls is None:
+            from serpapi import GoogleSearch as search_cls
+
+        if not api_key:
+            raise ValueError("SerpApi key not configured")
+        self._search_cls = search_cls
+        self.api_key = api_key
+        self.cache = cache
+        self.max_workers = max_workers
+
+    def fetch_page(self, query: str, start: int, num: int) -> List[Dict[str, Any]]:
+        """Organic results for one page (start is 0-based)"""
+        def execute() -> List[Dict[str, Any]]:
+            params = {"engine": "google", "q": query, "api_key": self.api_key, "start": start, "num": num}
+            result = self._search_cls(params).get_dict()
+            # SerpApi reports quota and key problems in the payload rather than raising
+            if "error" in result and "hasn't returned any results" not in result["error"]:
+                raise RuntimeError(f"SerpApi error: {result['error']}")
+            return result.get("organic_results", [])
+
+        if self.cache is None:
+            return execute()
+        return self.cache.fetch(self.name, f"num={num} {query}", start, execute)
+
+    def fetch_pages(self, query: str, pages: int, results_per_page: int) -> List[List[Dict[str, Any]]]:
+        """Result pages in order; a failed page is empty unless every page failed"""
+        starts = [page * results_per_page for page in range(pages)]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, pages) or 1) as pool:
+            futures = [pool.submit(self.fetch_page, query, start, results_per_page) for start in starts]
+
+        results, errors = [], []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as exc:
+                errors.append(exc)
+                results.append([])
+        if errors and len(errors) == len(futures):
+            raise errors[0]
+        return results
+
+    def search(self, query: str, pages: int, results_per_page: int) -> List[Dict[str, Any]]:
+        return [
+            normalize_item(item["link"], item.get("title"), item.get("snippet"), self.name)
+            for page in self.fetch_pages(query, pages, results_per_page) for item in page if item.get("link")
+        ]
+
+
+class FederatedSearch:
+    """Runs a query on every provider concurrently and fuses the rankings"""
+
+    def __init__(self, providers: Sequence[SearchProvider], timeouts: Optional[Dict[str, float]] = None,
+                 default_timeout: float = DEFAULT_PROVIDER_TIMEOUT):
+        if not providers:
+            raise ValueError("No search providers configured")
+        self.providers = list(providers)
+        self.timeouts = dict(timeouts or {})
+        self.default_timeout = default_timeout
+        self.last_errors: Dict[str, str] = {}
+
+    @property
+    def provider_names(self) -> List[str]:
+        return [provider.name for provider in self.providers]
+
+    def search_items(self, query: str, pages: int, results_per_page: int) -> List[Dict[str, Any]]:
+        """Fused items from every provider that answered before its deadline"""
+        items, self.last_errors = self.search_with_errors(query, pages, results_per_page)
+        return items
+
+    def search_with_errors(self, query: str, pages: int,
+                           results_per_page: int) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+        """Like search_items, also returning the error per failed or timed-out provider"""
+        started = time.monotonic()
+        deadlines = {}
+        errors: Dict[str, str] = {}
+        rankings = []
+
+        # Not used as a context manager: leaving it would wait for timed-out providers
+        pool = ThreadPoolExecutor(max_workers=len(self.providers))
+        try:
+            pending = {}
+            for provider in self.providers:
+                future = pool.submit(provider.search, query, pages, results_per_page)
+                pending[future] = provider.name
+                deadlines[provider.name] = started + self.timeouts.get(provider.name, self.default_timeout)
+
+            while pending:
+                next_deadline = min(deadlines[name] for name in pending.values())
+                done, _ = wait(pending, timeout=max(next_deadline - time.monotonic(), 0),
+                               return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = pending.pop(future)
+                    try:
+                        rankings.append(future.result())
+                    except Exception as exc:
+                        errors[name] = f"{type(exc).__name__}: {exc}"
+
+                now = time.monotonic()
+                for future, name in list(pending.items()):
+                    if deadlines[name] <= now:
+                        pending.pop(future)
+                        future.cancel()
+                        errors[name] = "timed out"
+        finally:
+            pool.shutdown(wait=False)
+
+        if errors and len(errors) == len(self.providers):
+            summary = "; ".join(f"{name}: {error}" for name, error in errors.items())
+            raise RuntimeError(f"All search providers failed: {summary}")
+        return reciprocal_rank_fusion(rankings), errors
+
+    def search(self, query: str, pages: int, results_per_page: int) -> List[SearchResult]:
+        return [
+            SearchResult(clean_url(item["link"]), item["title"], item["snippet"], item["providers"])
+            for item in self.search_items(query, pages, results_per_page)
+        ]
+
+
+def providers_from_env(cache: Optional[SearchCache] = None, max_workers: int = 4) -> List[SearchProvider]:
+    """Build every provider whose credentials and client library are available"""
+    providers: List[SearchProvider] = []
+
+    serpapi_key = os.getenv("SERPAPI_KEY", "")
+    if serpapi_key:
+        try:
+            providers.append(SerpApiProvider(serpapi_key, cache=cache, max_workers=max_workers))
+        except ImportError:
+            pass
+
+    google_key = os.getenv("GOOGLE_API_KEY", "")
+    engine_id = os.getenv("CUSTOM_SEARCH_ENGINE_ID", "")
+    if google_key and engine_id:
+        try:
+            from .cse_client import CSEClient
+            client = CSEClient(google_key, engine_id, max_workers=max_workers, cache=cache)
+            providers.append(GoogleCSEProvider(client))
+        except ImportError:
+            pass
+
+    return providers
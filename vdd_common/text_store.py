@@ -0,0 +1,287 @@
+"""
+Compressed store of extracted page text, keyed by content hash.
+
+Parsing HTML is the most expensive step after NLP, and its output used to
+be discarded after scoring. Extracted text is appended, one compressed
+frame per distinct page body, to a single pack file and indexed in SQLite
+by the SHA-256 of the body, together with the page title and the version
+of the extractor that produced it. Reads slice the pack file through a
+memory map, so re-scoring a past screening with a new lexicon needs
+neither the network nor an HTML parser.
+
+The pack file is bounded by ``max_bytes``: once an append takes it over
+the limit, the live frames are copied into a new pack generation, oldest
+texts first to go, and the index switches to it in the same transaction.
+
+Frames are compressed with zstd when ``zstandard`` is installed and with
+zlib otherwise; the codec is recorded per frame so either can be read.
+"""
+
+import hashlib
+import mmap
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from . import CACHE_ROOT
+
+try:
+    import zstandard
+    ZSTD_LIB = "zstandard"
+except ImportError:
+    zstandard = None
+    ZSTD_LIB = None
+
+# Bump when extraction changes what text a page yields; older entries are then ignored
+TEXT_VERSION = "html_text-1"
+
+ZSTD_LEVEL = 9
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+FIRST_PACK = "texts.pack"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS texts (
+    digest TEXT PRIMARY KEY,
+    version TEXT NOT NULL,
+    title TEXT NOT NULL,
+    codec TEXT NOT NULL,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    text_length INTEGER NOT NULL,
+    stored_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pages (
+    url TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    stored_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS screenings (
+    company TEXT NOT NULL,
+    url TEXT NOT NULL,
+    seen_at REAL NOT NULL,
+    PRIMARY KEY (company, url)
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# Current pack file name, read in the same statement as the offsets that point into it
+PACK_NAME = f"COALESCE((SELECT value FROM meta WHERE key = 'pack'), '{FIRST_PACK}')"
+
+
+def content_digest(body: bytes) -> str:
+    return hashlib.sha256(body).hexdigest()
+
+
+def text_version(backend: str, version: str = TEXT_VERSION) -> str:
+    """Version key for text produced by one HTML parser backend; backends disagree on whitespace and boilerplate"""
+    return f"{version}/{backend}"
+
+
+@dataclass
+class ExtractedText:
+    """Title and cleaned text of one page body"""
+    digest: str
+    title: str
+    text: str
+    version: str
+
+
+def _compress(text: str) -> Tuple[str, bytes]:
+    data = text.encode("utf-8")
+    if zstandard is not None:
+        return "zstd", zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    return "zlib", zlib.compress(data, 6)
+
+
+def _decompress(codec: str, frame: bytes) -> str:
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("Text was stored with zstd but zstandard is not installed")
+        return zstandard.ZstdDecompressor().decompress(frame).decode("utf-8")
+    return zlib.decompress(frame).decode("utf-8")
+
+
+class TextStore:
+    """Size-bounded pack file of compressed texts with a SQLite index"""
+
+    def __init__(self, root: Path = CACHE_ROOT / "texts", version: str = TEXT_VERSION,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.version = version
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._map: Optional[mmap.mmap] = None
+        self._map_file = None
+        self._map_name: Optional[str] = None
+        self._conn = sqlite3.connect(str(self.root / "index.sqlite3"), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self.pack_path.touch(exist_ok=True)
+
+    @property
+    def pack_path(self) -> Path:
+        """The pack file new frames are appended to"""
+        return self.root / self._conn.execute(f"SELECT {PACK_NAME}").fetchone()[0]
+
+    def put(self, url: str, digest: str, title: str, text: str, company: Optional[str] = None):
+        """Record a page's text (once per digest and version) and which screening saw it"""
+        now = time.time()
+        compacted = False
+        with self._lock:
+            row = self._conn.execute("SELECT version FROM texts WHERE digest = ?", (digest,)).fetchone()
+            if row is None or row[0] != self.version:
+                codec, frame = _compress(text)
+                # BEGIN IMMEDIATE takes SQLite's write lock, which also serializes
+                # appends and compactions between processes sharing the store
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    with open(self.pack_path, "ab") as pack:
+                        offset = pack.seek(0, os.SEEK_END)
+                        pack.write(frame)
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO texts VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (digest, self.version, title, codec, offset, len(frame), len(text), now)
+                    )
+                    if offset + len(frame) > self.max_bytes:
+                        self._compact()
+                        compacted = True
+                except Exception:
+                    self._conn.rollback()
+                    raise
+            self._conn.execute("INSERT OR REPLACE INTO pages VALUES (?, ?, ?)", (url, digest, now))
+            if company:
+                self._conn.execute("INSERT OR REPLACE INTO screenings VALUES (?, ?, ?)", (company, url, now))
+            self._conn.commit()
+            if compacted:
+                self._remove_old_packs()
+
+    def get(self, digest: str) -> Optional[ExtractedText]:
+        """Stored text for a body digest, if extracted by the current version"""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT title, codec, offset, length, {PACK_NAME} FROM texts WHERE digest = ? AND version = ?",
+                (digest, self.version)
+            ).fetchone()
+            if row is None:
+                return None
+            title, codec, offset, length, pack_name = row
+            try:
+                frame = self._read(pack_name, offset, length)
+            except FileNotFoundError:
+                # Another process compacted the store in between; the text may be gone
+                return None
+        return ExtractedText(digest, title, _decompress(codec, frame), self.version)
+
+    def compact(self):
+        """Rewrite the pack without superseded frames, dropping the oldest texts while over max_bytes"""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._compact()
+            except Exception:
+                self._conn.rollback()
+                raise
+            self._conn.commit()
+            self._remove_old_packs()
+
+    def get_url(self, url: str) -> Optional[ExtractedText]:
+        """Stored text of the body last seen at a URL"""
+        with self._lock:
+            row = self._conn.execute("SELECT digest FROM pages WHERE url = ?", (url,)).fetchone()
+        return self.get(row[0]) if row else None
+
+    def urls_for(self, company: str) -> List[str]:
+        """URLs whose text was stored while screening a company, oldest first"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT url FROM screenings WHERE company = ? ORDER BY seen_at", (company,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def iter_pages(self, urls: List[str]) -> Iterator[Tuple[str, ExtractedText]]:
+        """(url, text) for each URL that has current-version text"""
+        for url in urls:
+            extracted = self.get_url(url)
+            if extracted is not None:
+                yield url, extracted
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            texts, packed, raw = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(length), 0), COALESCE(SUM(text_length), 0) FROM texts"
+            ).fetchone()
+            pages = self._conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+            pack_bytes = self.pack_path.stat().st_size
+        return {"texts": texts, "pages": pages, "packed_bytes": packed, "text_chars": raw,
+                "pack_file_bytes": pack_bytes, "max_bytes": self.max_bytes}
+
+    def close(self):
+        with self._lock:
+            self._unmap()
+            self._conn.close()
+
+    def _compact(self):
+        """Copy the newest live frames into a new pack generation; runs inside the caller's write transaction"""
+        self._conn.execute("DELETE FROM texts WHERE version != ?", (self.version,))
+        rows = self._conn.execute("SELECT digest, offset, length FROM texts ORDER BY stored_at DESC").fetchall()
+
+        # Shrink to 90% of the cap so the next few appends do not compact again
+        budget = self.max_bytes * 0.9
+        kept, total = [], 0
+        for digest, offset, length in rows:
+            if total + length > budget:
+                break
+            kept.append((digest, offset, length))
+            total += length
+        self._conn.executemany("DELETE FROM texts WHERE digest = ?", [(row[0],) for row in rows[len(kept):]])
+        self._conn.execute("DELETE FROM pages WHERE digest NOT IN (SELECT digest FROM texts)")
+
+        old_path = self.pack_path
+        new_name = f"texts.{time.time_ns()}.pack"
+        moved = []
+        with open(old_path, "rb") as old, open(self.root / new_name, "wb") as new:
+            for digest, offset, length in sorted(kept, key=lambda row: row[1]):
+                old.seek(offset)
+                moved.append((new.tell(), digest))
+                new.write(old.read(length))
+        self._conn.executemany("UPDATE texts SET offset = ? WHERE digest = ?", moved)
+        self._conn.execute("INSERT OR REPLACE INTO meta VALUES ('pack', ?)", (new_name,))
+        self._unmap()
+
+    def _remove_old_packs(self):
+        """Delete superseded pack files; one still mapped elsewhere is retried after the next compaction"""
+        current = self.pack_path.name
+        for path in self.root.glob("texts*.pack"):
+            if path.name != current:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def _read(self, pack_name: str, offset: int, length: int) -> bytes:
+        # Remap after a compaction, or when the frame was appended after the current map was taken
+        if self._map is None or self._map_name != pack_name or offset + length > len(self._map):
+            self._unmap()
+            self._map_file = open(self.root / pack_name, "rb")
+            self._map = mmap.mmap(self._map_file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._map_name = pack_name
+        return self._map[offset:offset + length]
+
+    def _unmap(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._map_file is not None:
+            self._map_file.close()
+            self._map_file = None
+        self._map_name = None
+
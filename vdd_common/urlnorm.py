@@ -0,0 +1,166 @@
+"""
+URL canonicalization and near-duplicate collapsing.
+
+Search providers return the same article under many spellings: with
+tracking parameters, over http and https, with and without ``www.``, as
+AMP or mobile variants, or with different fragments. ``clean_url`` strips
+the parts that never change the document while keeping the URL fetchable;
+``dedup_key`` goes further and folds scheme, host prefixes and AMP/mobile
+markers so all variants of one page share a key. ``DedupIndex`` uses the
+key to keep a single, preferred URL per page across providers and queries.
+"""
+
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Set
+from urllib.parse import unquote_plus, urlsplit, urlunsplit
+
+# Query parameters that only identify the click, never the content
+TRACKING_PARAMS = {
+    "gclid", "dclid", "fbclid", "msclkid", "yclid", "igshid", "mc_cid", "mc_eid",
+    "_ga", "_gl", "_hsenc", "_hsmi", "mkt_tok", "ref", "ref_src", "ref_url", "spm",
+    "cmpid", "icid", "ncid", "ocid", "sr_share", "outputtype", "amp",
+}
+TRACKING_PREFIXES = ("utm_", "pk_", "mtm_", "hmb_")
+
+# Host labels that serve the same content as the bare domain
+EQUIVALENT_HOST_PREFIXES = ("www.", "m.", "mobile.", "amp.")
+
+# Second-level labels under country TLDs that are public suffixes themselves (co.uk, com.au, gov.in)
+COUNTRY_SECOND_LEVELS = {"ac", "co", "com", "edu", "gov", "go", "ltd", "ne", "net", "nic", "or", "org", "plc"}
+
+AMP_PATH = re.compile(r"(/amp(?:html)?/?$)|(^/amp(?=/))|(\.amp(?=\.html?$|$))", re.IGNORECASE)
+INDEX_PAGE = re.compile(r"/(index|default)\.(html?|php|aspx?)$", re.IGNORECASE)
+PERCENT_ESCAPE = re.compile(r"%([0-9A-Fa-f]{2})")
+UNRESERVED = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-._~")
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def _is_tracking(name: str) -> bool:
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def _normalize_escapes(path: str) -> str:
+    """Decode escaped unreserved characters and upper-case the rest (RFC 3986 6.2.2)"""
+    def fix(match):
+        char = chr(int(match.group(1), 16))
+        return char if char in UNRESERVED else match.group(0).upper()
+    return PERCENT_ESCAPE.sub(fix, path)
+
+
+def _has_registrable_domain(host: str) -> bool:
+    """Whether the host has a label left of its public suffix (example.com, not com or co.uk)"""
+    labels = host.split(":")[0].split(".")
+    suffix = 2 if len(labels) >= 2 and len(labels[-1]) == 2 and labels[-2] in COUNTRY_SECOND_LEVELS else 1
+    return len(labels) > suffix
+
+
+def _strip_host_prefix(host: str) -> str:
+    for prefix in EQUIVALENT_HOST_PREFIXES:
+        # amp.dev or m.co.uk are sites of their own, not variants of dev or co.uk
+        if host.startswith(prefix) and _has_registrable_domain(host[len(prefix):]):
+            return host[len(prefix):]
+    return host
+
+
+def _query_items(query: str) -> List[str]:
+    """Raw name[=value] items, kept as written so a bare ?flag stays a bare flag"""
+    return [item for item in query.split("&") if item]
+
+
+def _item_name(item: str) -> str:
+    return unquote_plus(item.partition("=")[0])
+
+
+def sorted_query(query: str) -> str:
+    """Query with its items in a stable order"""
+    return "&".join(sorted(_query_items(query)))
+
+
+def _host_with_port(scheme: str, hostname: str, port: Optional[int]) -> str:
+    if port and DEFAULT_PORTS.get(scheme) != port:
+        return f"{hostname}:{port}"
+    return hostname
+
+
+def clean_url(url: str) -> str:
+    """Drop tracking parameters, fragments and default ports; keep the URL fetchable"""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = _host_with_port(scheme, (parts.hostname or "").lower(), parts.port)
+    query = "&".join(item for item in _query_items(parts.query) if not _is_tracking(_item_name(item)))
+    return urlunsplit((scheme, host, parts.path or "/", query, ""))
+
+
+def dedup_key(url: str) -> str:
+    """Key shared by every scheme / host-prefix / AMP / mobile variant of a page"""
+    parts = urlsplit(clean_url(url))
+    host = _strip_host_prefix(parts.netloc)
+    path = AMP_PATH.sub("", _normalize_escapes(parts.path))
+    path = INDEX_PAGE.sub("/", path)
+    path = path.rstrip("/") or "/"
+    return urlunsplit(("", host, path, sorted_query(parts.query), "")).lstrip("/")
+
+
+def same_page(url: str, other: str) -> bool:
+    """True if both URLs are variants of one page (slash, fragment, escaping, tracking, ...)"""
+    return dedup_key(url) == dedup_key(other)
+
+
+def url_preference(url: str) -> int:
+    """Higher is better: https, canonical host, non-AMP"""
+    parts = urlsplit(url)
+    score = 0
+    if parts.scheme == "https":
+        score += 4
+    host = parts.hostname or ""
+    if _strip_host_prefix(host) == host or host.startswith("www."):
+        score += 2
+    if not AMP_PATH.search(parts.path):
+        score += 1
+    return score
+
+
+class DedupIndex:
+    """Run-wide record of canonical pages, their preferred URL and who found them"""
+
+    def __init__(self):
+        self._urls: Dict[str, str] = {}
+        self._sources: Dict[str, Set[str]] = {}
+        self._order: List[str] = []
+        self._lock = threading.Lock()
+
+    def add(self, url: str, sources: Iterable[str] = ()) -> bool:
+        """Record a URL; returns True if its page had not been seen in this run"""
+        key = dedup_key(url)
+        cleaned = clean_url(url)
+        with self._lock:
+            self._sources.setdefault(key, set()).update(sources)
+            current = self._urls.get(key)
+            if current is None:
+                self._urls[key] = cleaned
+                self._order.append(key)
+                return True
+            if url_preference(cleaned) > url_preference(current):
+                self._urls[key] = cleaned
+            return False
+
+    def __contains__(self, url: str) -> bool:
+        return dedup_key(url) in self._urls
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def preferred(self, url: str) -> Optional[str]:
+        """The URL that will be fetched for this page"""
+        return self._urls.get(dedup_key(url))
+
+    def sources(self, url: str) -> Set[str]:
+        return set(self._sources.get(dedup_key(url), ()))
+
+    def urls(self) -> List[str]:
+        """Preferred URL per page in first-seen order"""
+        with self._lock:
+            return [self._urls[key] for key in self._order]